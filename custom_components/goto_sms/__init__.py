@@ -1,22 +1,78 @@
 """The GoTo SMS integration."""
 
-import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Dict, Optional
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_time_interval
 
 from . import config_flow
-from .const import DOMAIN
-from .oauth import GoToOAuth2Manager
+from .admission import AdmissionController
+from .concurrency import AdaptiveConcurrencyLimiter
+from .const import (
+    CONF_BUDGET_HARD_CAP,
+    CONF_DRY_RUN,
+    CONF_DRY_RUN_ERROR_RATE,
+    CONF_DRY_RUN_LATENCY,
+    CONF_LOOP_WATCHDOG,
+    CONF_MAX_ACTIVE_SENDS,
+    CONF_MAX_CONCURRENCY,
+    CONF_MAX_QUEUED_SENDS,
+    CONF_MONTHLY_BUDGET,
+    CONF_PHONE_ATTRIBUTE,
+    CONF_RECIPIENT_GROUPS,
+    CONF_RECORD_TRAFFIC,
+    CONF_RETRY_BUDGET,
+    CONF_ROUTING_RULES,
+    CONF_SENDER_POOLS,
+    CONF_SENDER_RATE,
+    CONF_SHED_POLICY,
+    CONF_SLOW_CALLBACK_THRESHOLD,
+    DEFAULT_DRY_RUN_ERROR_RATE,
+    DEFAULT_DRY_RUN_LATENCY,
+    DEFAULT_MAX_ACTIVE_SENDS,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_QUEUED_SENDS,
+    DEFAULT_PHONE_ATTRIBUTE,
+    DEFAULT_RETRY_BUDGET,
+    DEFAULT_SENDER_BURST,
+    DEFAULT_SENDER_RATE,
+    DEFAULT_SHED_POLICY,
+    DEFAULT_SLOW_CALLBACK_THRESHOLD,
+    DOMAIN,
+    SIGNAL_SENDERS_UPDATED,
+    STARTUP_VALIDATOR,
+    TRAFFIC_FILE,
+)
+from .dryrun import DryRunSink
+from .groups import RecipientGroups, parse_groups
+from .jobs import SendJobs
+from .metrics import SendMetrics
+from .numbers import SenderNumbers
+from .ordering import KeyedSerializer
+from .pool import build_sender_pools
+from .records import OutboundRecords
+from .retrybudget import RetryBudget
+from .routing import RoutingRules
+from .senders import SENDER_PLATFORM
+from .services import async_setup_services, async_unload_services, loaded_entry_ids
+from .startup import StartupValidator
+from .suppression import SuppressionList
+from .traffic import TrafficRecorder
+from .usage import UsageTracker
+from .warmup import async_prewarm
+from .watchdog import LoopWatchdog
+from .webhook import async_register_webhook, async_unregister_webhook
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.NOTIFY]
+PLATFORMS: list[Platform] = [Platform.SENSOR]
+if SENDER_PLATFORM not in PLATFORMS:
+    PLATFORMS.append(SENDER_PLATFORM)
 
 _LOGGER.info("GoTo SMS integration loaded")
 
@@ -24,66 +80,132 @@ _LOGGER.info("GoTo SMS integration loaded")
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up GoTo SMS from a config entry."""
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    validator = hass.data[DOMAIN].get(STARTUP_VALIDATOR)
+    if validator is None:
+        validator = hass.data[DOMAIN][STARTUP_VALIDATOR] = StartupValidator(hass)
 
-    # Create OAuth manager for this config entry
-    oauth_manager = GoToOAuth2Manager(hass, entry)
+    # Wait for this entry's tokens, validated alongside every other entry's;
+    # raises ConfigEntryNotReady so Home Assistant retries if GoTo is down
+    oauth_manager = await validator.async_validate(entry)
+    hass.data[DOMAIN][entry.entry_id] = entry.data
 
     # Store the OAuth manager in hass.data for access by other components
     hass.data[DOMAIN][f"{entry.entry_id}_oauth"] = oauth_manager
 
-    # Validate and refresh tokens on startup
-    async def startup_token_validation():
-        """Validate and refresh tokens on startup."""
-        try:
-            _LOGGER.info("Running startup token validation")
+    # Track sent messages so delivery receipts can be matched to them
+    hass.data[DOMAIN][f"{entry.entry_id}_outbound"] = OutboundRecords()
 
-            # Load tokens
-            if not await oauth_manager.load_tokens():
-                _LOGGER.warning("No tokens found during startup validation")
-                return
+    # Receive delivery receipts and replies pushed by the notification channel
+    async_register_webhook(hass, entry)
 
-            # Check if tokens need refresh
-            if not oauth_manager._validate_tokens():
-                _LOGGER.info("Tokens need refresh on startup, refreshing...")
-                if await oauth_manager.refresh_tokens():
-                    _LOGGER.info("Startup token refresh successful")
-                else:
-                    _LOGGER.warning(
-                        "Startup token refresh failed - will retry on next use"
-                    )
-            else:
-                _LOGGER.info("Tokens are valid on startup")
+    # Expand recipient groups from the options and keep them current
+    _async_build_groups(hass, entry)
 
-        except Exception as e:
-            _LOGGER.error("Error during startup token validation: %s", e)
-            # Don't fail the integration startup, just log the error
-
-    # Run startup validation after a short delay to ensure everything is loaded
-    hass.async_create_task(
-        asyncio.sleep(5)  # Wait 5 seconds for everything to initialize
-    ).add_done_callback(lambda _: hass.async_create_task(startup_token_validation()))
-
-    # Register the SMS service with proper schema
-    async def handle_send_sms(call):
-        """Handle the send SMS service call."""
-        from .notify import get_service
-
-        notify_service = get_service(hass, {})
-        if notify_service:
-            message = call.data.get("message")
-            target = call.data.get("target")
-            sender_id = call.data.get("sender_id")
-
-            if notify_service:
-                await notify_service.async_send_message_service(call)
-
-    # Register the service with schema for form interface
-    hass.services.async_register(
-        DOMAIN,
-        "send_sms",
-        handle_send_sms,
+    # Spread sends across pooled sender numbers
+    _async_build_sender_pools(hass, entry)
+
+    # Compile the routing rules that pick recipients, sender and priority
+    _async_build_routing(hass, entry)
+
+    # Adapt the number of in-flight API requests to how GoTo is coping
+    metrics = hass.data[DOMAIN][f"{entry.entry_id}_metrics"] = SendMetrics()
+    limiter = AdaptiveConcurrencyLimiter(
+        max_limit=entry.options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)
+    )
+    hass.data[DOMAIN][f"{entry.entry_id}_limiter"] = limiter
+    metrics.add_source("limiter", limiter.stats)
+    metrics.add_source(
+        "routing", lambda: hass.data[DOMAIN][f"{entry.entry_id}_routing"].stats()
+    )
+
+    # Bound the sends waiting to run so a burst cannot pile up without limit
+    admission = hass.data[DOMAIN][f"{entry.entry_id}_admission"] = AdmissionController()
+    _async_configure_admission(hass, entry)
+    metrics.add_source("admission", admission.stats)
+
+    # Keep each conversation in order while sends run concurrently
+    ordering = hass.data[DOMAIN][f"{entry.entry_id}_ordering"] = KeyedSerializer()
+    metrics.add_source("ordering", ordering.stats)
+
+    # Share one retry budget between sends and token refreshes
+    retry_budget = RetryBudget(
+        entry.options.get(CONF_RETRY_BUDGET, DEFAULT_RETRY_BUDGET)
+    )
+    hass.data[DOMAIN][f"{entry.entry_id}_retry_budget"] = retry_budget
+    metrics.add_source("retry_budget", retry_budget.stats)
+
+    # Never text numbers that opted out or are known to be dead
+    suppression = SuppressionList(hass, entry.entry_id)
+    await suppression.async_load()
+    hass.data[DOMAIN][f"{entry.entry_id}_suppression"] = suppression
+    metrics.add_source("suppression", suppression.stats)
+
+    # Count messages and segments sent and enforce the monthly budget
+    usage = UsageTracker(hass, entry.entry_id)
+    await usage.async_load()
+    hass.data[DOMAIN][f"{entry.entry_id}_usage"] = usage
+    _async_configure_usage(hass, entry)
+    metrics.add_source("usage", usage.stats)
+
+    # Optionally replace the final POST with an in-process sink for load tests
+    dry_run = hass.data[DOMAIN][f"{entry.entry_id}_dry_run"] = DryRunSink()
+    _async_configure_dry_run(hass, entry)
+    metrics.add_source("dry_run", dry_run.stats)
+
+    # Optionally record the shape of send_sms traffic for offline replay, in
+    # a file per entry so each account's traffic can be replayed on its own
+    recorder = TrafficRecorder(
+        hass, hass.config.path(TRAFFIC_FILE.format(entry.entry_id))
     )
+    hass.data[DOMAIN][f"{entry.entry_id}_recorder"] = recorder
+    _async_configure_recorder(hass, entry)
+    metrics.add_source("traffic", recorder.stats)
+
+    # Optionally measure event loop lag and attribute stalls to our code
+    watchdog = hass.data[DOMAIN][f"{entry.entry_id}_watchdog"] = LoopWatchdog(hass)
+    _async_configure_watchdog(hass, entry)
+    metrics.add_source("watchdog", watchdog.stats)
+    # Options as last applied, so updates to entry.data alone are ignored
+    hass.data[DOMAIN][f"{entry.entry_id}_options"] = dict(entry.options)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    metrics.add_source("startup", lambda: validator.stats(entry.entry_id))
+
+    # Open connections to both hosts before the first send, in the
+    # background so Home Assistant's startup is not held up
+    warmup: Dict[str, Optional[float]] = {}
+    metrics.add_source(
+        "warmup", lambda: {f"warmup_{name}": value for name, value in warmup.items()}
+    )
+    entry.async_create_background_task(
+        hass, async_prewarm(hass, warmup), f"{DOMAIN} warm-up"
+    )
+
+    # Discover the account's sender numbers in the background
+    sender_numbers = SenderNumbers(hass, oauth_manager)
+    hass.data[DOMAIN][f"{entry.entry_id}_sender_numbers"] = sender_numbers
+    sender_numbers.async_start()
+    metrics.add_source("sender_numbers", sender_numbers.stats)
+
+    # Sends made with background: true report through a job handle
+    hass.data[DOMAIN][f"{entry.entry_id}_send_jobs"] = SendJobs(hass)
+
+    # One notification service per entry, shared by the services, the
+    # legacy notify platform and the sender number entities
+    from .notify import GoToSMSNotificationService
+
+    notify_service = GoToSMSNotificationService(hass, oauth_manager)
+    hass.data[DOMAIN][f"{entry.entry_id}_service"] = notify_service
+
+    # Bulk jobs run in the background, at most one per job ID
+    hass.data[DOMAIN][f"{entry.entry_id}_bulk_jobs"] = {}
+
+    # Services are shared by all entries; register them again if the last
+    # entry was unloaded and removed them
+    async_setup_services(hass)
+
+    # Usage and budget sensors, and sender number entities
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Set up periodic token refresh
     async def refresh_tokens_periodic(now):
@@ -121,16 +243,210 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+def _async_build_groups(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Build the recipient groups for a config entry from its options."""
+    old_groups = hass.data[DOMAIN].pop(f"{entry.entry_id}_groups", None)
+    if old_groups is not None:
+        old_groups.async_stop()
+
+    try:
+        groups = parse_groups(entry.options.get(CONF_RECIPIENT_GROUPS, ""))
+    except ValueError as e:
+        _LOGGER.error("Invalid recipient groups, ignoring them: %s", e)
+        groups = {}
+
+    recipient_groups = RecipientGroups(
+        hass,
+        groups,
+        entry.options.get(CONF_PHONE_ATTRIBUTE, DEFAULT_PHONE_ATTRIBUTE),
+    )
+    recipient_groups.async_start()
+    hass.data[DOMAIN][f"{entry.entry_id}_groups"] = recipient_groups
+
+
+def _async_build_sender_pools(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Build the sender number pools for a config entry if they changed.
+
+    Rebuilding forgets which number each recipient sticks to and the state
+    of each number's rate limiter, so unchanged pools are kept.
+    """
+    source = (
+        entry.options.get(CONF_SENDER_POOLS, ""),
+        entry.options.get(CONF_SENDER_RATE, DEFAULT_SENDER_RATE),
+    )
+    if hass.data[DOMAIN].get(f"{entry.entry_id}_pools_source") == source:
+        return
+
+    try:
+        pools = build_sender_pools(source[0], source[1], DEFAULT_SENDER_BURST)
+    except ValueError as e:
+        _LOGGER.error("Invalid sender pools, ignoring them: %s", e)
+        pools = {}
+    hass.data[DOMAIN][f"{entry.entry_id}_pools"] = pools
+    hass.data[DOMAIN][f"{entry.entry_id}_pools_source"] = source
+
+
+def _async_build_routing(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Compile the routing rules for a config entry if they changed."""
+    text = entry.options.get(CONF_ROUTING_RULES, "")
+    routing = hass.data[DOMAIN].get(f"{entry.entry_id}_routing")
+    if routing is not None and routing.source == text:
+        return
+
+    try:
+        routing = RoutingRules(text)
+    except ValueError as e:
+        _LOGGER.error("Invalid routing rules, ignoring them: %s", e)
+        routing = RoutingRules()
+    hass.data[DOMAIN][f"{entry.entry_id}_routing"] = routing
+
+
+def _async_configure_dry_run(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply the dry-run options to the entry's sink."""
+    dry_run = hass.data[DOMAIN][f"{entry.entry_id}_dry_run"]
+    dry_run.enabled = entry.options.get(CONF_DRY_RUN, False)
+    dry_run.latency = entry.options.get(CONF_DRY_RUN_LATENCY, DEFAULT_DRY_RUN_LATENCY)
+    dry_run.error_rate = entry.options.get(
+        CONF_DRY_RUN_ERROR_RATE, DEFAULT_DRY_RUN_ERROR_RATE
+    )
+    if dry_run.enabled:
+        _LOGGER.warning("Dry run is enabled; no SMS will be sent for %s", entry.title)
+
+
+def _async_configure_admission(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply the admission control options."""
+    admission = hass.data[DOMAIN][f"{entry.entry_id}_admission"]
+    admission.configure(
+        entry.options.get(CONF_MAX_ACTIVE_SENDS, DEFAULT_MAX_ACTIVE_SENDS),
+        entry.options.get(CONF_MAX_QUEUED_SENDS, DEFAULT_MAX_QUEUED_SENDS),
+        entry.options.get(CONF_SHED_POLICY, DEFAULT_SHED_POLICY),
+    )
+
+
+def _async_configure_recorder(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Start or stop traffic recording from the options."""
+    recorder = hass.data[DOMAIN][f"{entry.entry_id}_recorder"]
+    if entry.options.get(CONF_RECORD_TRAFFIC, False):
+        recorder.async_start()
+    elif recorder.active:
+        hass.async_create_task(recorder.async_stop())
+
+
+def _async_configure_usage(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply the monthly budget options."""
+    usage = hass.data[DOMAIN][f"{entry.entry_id}_usage"]
+    usage.configure(
+        entry.options.get(CONF_MONTHLY_BUDGET, 0),
+        entry.options.get(CONF_BUDGET_HARD_CAP, False),
+    )
+
+
+def _async_configure_watchdog(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Start or stop the event loop watchdog from the options."""
+    watchdog = hass.data[DOMAIN][f"{entry.entry_id}_watchdog"]
+    watchdog.threshold = (
+        entry.options.get(CONF_SLOW_CALLBACK_THRESHOLD, DEFAULT_SLOW_CALLBACK_THRESHOLD)
+        / 1000
+    )
+    if entry.options.get(CONF_LOOP_WATCHDOG, False):
+        watchdog.async_start()
+    else:
+        watchdog.async_stop()
+
+
+def _options_changed(
+    applied: Optional[Dict[str, Any]], entry: ConfigEntry, *keys: str
+) -> bool:
+    """Return True if any of the options differ from those last applied."""
+    applied = applied or {}
+    return any(applied.get(key) != entry.options.get(key) for key in keys)
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply updated options without reloading the entry."""
+    # The listener also runs when token saves or the webhook ID change
+    # entry.data; there is nothing to apply then
+    applied = hass.data[DOMAIN].get(f"{entry.entry_id}_options")
+    if applied == entry.options:
+        return
+    hass.data[DOMAIN][f"{entry.entry_id}_options"] = dict(entry.options)
+
+    _LOGGER.debug("Options updated for %s", entry.entry_id)
+    if _options_changed(applied, entry, CONF_RECIPIENT_GROUPS, CONF_PHONE_ATTRIBUTE):
+        _async_build_groups(hass, entry)
+    _async_build_sender_pools(hass, entry)
+    _async_build_routing(hass, entry)
+    # Pool members and the default sender may be new sender numbers
+    async_dispatcher_send(hass, SIGNAL_SENDERS_UPDATED.format(entry.entry_id))
+
+    limiter = hass.data[DOMAIN][f"{entry.entry_id}_limiter"]
+    limiter.max_limit = entry.options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)
+    limiter.limit = min(limiter.limit, limiter.max_limit)
+
+    retry_budget = hass.data[DOMAIN][f"{entry.entry_id}_retry_budget"]
+    retry_budget.percent = entry.options.get(CONF_RETRY_BUDGET, DEFAULT_RETRY_BUDGET)
+
+    _async_configure_admission(hass, entry)
+    _async_configure_usage(hass, entry)
+    _async_configure_dry_run(hass, entry)
+    _async_configure_recorder(hass, entry)
+    _async_configure_watchdog(hass, entry)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     try:
-        # Remove the service
-        hass.services.async_remove(DOMAIN, "send_sms")
+        if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+            return False
+
+        # The services are shared; remove them with the last loaded entry
+        if loaded_entry_ids(hass) == [entry.entry_id]:
+            async_unload_services(hass)
+
+        # Interrupt running bulk jobs; they checkpoint and can be resumed
+        for task in hass.data[DOMAIN].pop(f"{entry.entry_id}_bulk_jobs", {}).values():
+            task.cancel()
+        send_jobs = hass.data[DOMAIN].pop(f"{entry.entry_id}_send_jobs", None)
+        if send_jobs is not None:
+            send_jobs.cancel()
+        recorder = hass.data[DOMAIN].pop(f"{entry.entry_id}_recorder", None)
+        if recorder is not None:
+            await recorder.async_stop()
+        watchdog = hass.data[DOMAIN].pop(f"{entry.entry_id}_watchdog", None)
+        if watchdog is not None:
+            watchdog.async_stop()
+        usage = hass.data[DOMAIN].pop(f"{entry.entry_id}_usage", None)
+        if usage is not None:
+            await usage.async_stop()
+
+        # Stop receiving notification-channel pushes
+        async_unregister_webhook(hass, entry)
 
         # Clean up the data
         if DOMAIN in hass.data:
             hass.data[DOMAIN].pop(entry.entry_id, None)
             hass.data[DOMAIN].pop(f"{entry.entry_id}_oauth", None)
+            hass.data[DOMAIN].pop(f"{entry.entry_id}_outbound", None)
+            hass.data[DOMAIN].pop(f"{entry.entry_id}_pools", None)
+            hass.data[DOMAIN].pop(f"{entry.entry_id}_pools_source", None)
+            hass.data[DOMAIN].pop(f"{entry.entry_id}_options", None)
+            hass.data[DOMAIN].pop(f"{entry.entry_id}_routing", None)
+            hass.data[DOMAIN].pop(f"{entry.entry_id}_service", None)
+            hass.data[DOMAIN].pop(f"{entry.entry_id}_metrics", None)
+            hass.data[DOMAIN].pop(f"{entry.entry_id}_limiter", None)
+            hass.data[DOMAIN].pop(f"{entry.entry_id}_admission", None)
+            hass.data[DOMAIN].pop(f"{entry.entry_id}_ordering", None)
+            hass.data[DOMAIN].pop(f"{entry.entry_id}_retry_budget", None)
+            hass.data[DOMAIN].pop(f"{entry.entry_id}_suppression", None)
+            hass.data[DOMAIN].pop(f"{entry.entry_id}_dry_run", None)
+            sender_numbers = hass.data[DOMAIN].pop(
+                f"{entry.entry_id}_sender_numbers", None
+            )
+            if sender_numbers is not None:
+                sender_numbers.async_stop()
+            groups = hass.data[DOMAIN].pop(f"{entry.entry_id}_groups", None)
+            if groups is not None:
+                groups.async_stop()
 
         _LOGGER.info("GoTo SMS integration unloaded successfully")
         return True
@@ -144,6 +460,13 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     _LOGGER.info("Setting up GoTo SMS integration")
     hass.data.setdefault(DOMAIN, {})
 
+    # Validate every entry's tokens concurrently before the entries set up
+    validator = hass.data[DOMAIN][STARTUP_VALIDATOR] = StartupValidator(hass)
+    validator.async_start(hass.config_entries.async_entries(DOMAIN))
+
+    # The services act on the entry named in each call
+    async_setup_services(hass)
+
     # The notification service will be registered by the notify platform
     # when the integration is loaded via config entry
 
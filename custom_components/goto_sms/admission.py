@@ -0,0 +1,190 @@
+"""Admission control that bounds pending sends per entry and priority."""
+
+import asyncio
+import itertools
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+
+from .const import (
+    DEFAULT_MAX_ACTIVE_SENDS,
+    DEFAULT_MAX_QUEUED_SENDS,
+    DEFAULT_SHED_POLICY,
+    PRIORITIES,
+    PRIORITY_NORMAL,
+    PRIORITY_QUEUE_SHARE,
+    SHED_DROP_LOWEST_PRIORITY,
+    SHED_DROP_OLDEST,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_Waiter = Tuple[int, asyncio.Future]
+
+
+class SendShed(Exception):
+    """A send was shed by admission control."""
+
+    def __init__(self, reason: str) -> None:
+        """Initialize the exception."""
+        super().__init__(reason)
+        self.reason = reason
+
+
+class AdmissionController:
+    """Bounds sends that are active or waiting to start.
+
+    At most max_active sends run at once; the rest wait in one FIFO queue
+    per priority, highest priority first. The queue holds at most
+    max_queued sends, and each priority at most its PRIORITY_QUEUE_SHARE of
+    that. When a new send does not fit, the policy decides what is shed:
+    reject_newest sheds the new send, drop_oldest the longest waiting one,
+    and drop_lowest_priority the oldest send of a lower priority than the
+    new one (or the new send if there is none).
+    """
+
+    def __init__(
+        self,
+        max_active: int = DEFAULT_MAX_ACTIVE_SENDS,
+        max_queued: int = DEFAULT_MAX_QUEUED_SENDS,
+        policy: str = DEFAULT_SHED_POLICY,
+    ) -> None:
+        """Initialize the controller."""
+        self.max_active = max_active
+        self.max_queued = max_queued
+        self.policy = policy
+        self.active = 0
+        self.queued = 0
+        self._waking = 0
+        self.max_queued_seen = 0
+        self.shed: Dict[str, int] = {priority: 0 for priority in PRIORITIES}
+        self._queues: Dict[str, Deque[_Waiter]] = {p: deque() for p in PRIORITIES}
+        self._sequence = itertools.count()
+
+    def configure(self, max_active: int, max_queued: int, policy: str) -> None:
+        """Change the limits, starting queued sends if there is now room.
+
+        Sends already queued beyond a lowered max_queued stay queued; the
+        limit applies to new sends.
+        """
+        self.max_active = max_active
+        self.max_queued = max_queued
+        self.policy = policy
+        self._wake()
+
+    @asynccontextmanager
+    async def admit(self, priority: str = PRIORITY_NORMAL) -> AsyncIterator[None]:
+        """Wait for a send to be admitted, raising SendShed if it is shed."""
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority {priority}")
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._wake()
+
+    async def _acquire(self, priority: str) -> None:
+        """Take an active slot, queueing for one if none is free."""
+        # Sends woken but not yet resumed still count as ahead of this one,
+        # so a new send cannot overtake an earlier send it may depend on
+        if self.active < self.max_active and not self.queued and not self._waking:
+            self.active += 1
+            return
+
+        self._make_room(priority)
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (next(self._sequence), waiter)
+        self._queues[priority].append(entry)
+        self.queued += 1
+        self.max_queued_seen = max(self.max_queued_seen, self.queued)
+        self._wake()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if entry in self._queues[priority]:
+                self._queues[priority].remove(entry)
+                self.queued -= 1
+            elif waiter.done() and not waiter.cancelled() and not waiter.exception():
+                # We were handed a slot we will not use; pass it on
+                self._waking -= 1
+                self.active -= 1
+                self._wake()
+            raise
+        self._waking -= 1
+
+    def _make_room(self, priority: str) -> None:
+        """Shed a queued send, or raise SendShed, so one more fits."""
+        queue = self._queues[priority]
+        if len(queue) >= int(self.max_queued * PRIORITY_QUEUE_SHARE[priority]):
+            if self.policy != SHED_DROP_OLDEST or not queue:
+                self._count_shed(priority)
+                raise SendShed("priority_queue_full")
+            self._shed(priority, "priority_queue_full")
+
+        if self.queued < self.max_queued:
+            return
+
+        victim: Optional[str] = None
+        if self.policy == SHED_DROP_OLDEST:
+            victim = min(
+                (p for p in PRIORITIES if self._queues[p]),
+                key=lambda p: self._queues[p][0][0],
+                default=None,
+            )
+        elif self.policy == SHED_DROP_LOWEST_PRIORITY:
+            for candidate in PRIORITIES[: PRIORITIES.index(priority)]:
+                if self._queues[candidate]:
+                    victim = candidate
+                    break
+
+        if victim is None:
+            self._count_shed(priority)
+            raise SendShed("queue_full")
+        self._shed(victim, "queue_full")
+
+    def _shed(self, priority: str, reason: str) -> None:
+        """Shed the oldest queued send of a priority."""
+        _, waiter = self._queues[priority].popleft()
+        self.queued -= 1
+        self._count_shed(priority)
+        if not waiter.done():
+            waiter.set_exception(SendShed(reason))
+
+    def _count_shed(self, priority: str) -> None:
+        """Count one shed send."""
+        self.shed[priority] += 1
+        if sum(self.shed.values()) % 1000 == 1:
+            _LOGGER.warning(
+                "Shedding sends: %d active, %d queued (policy %s)",
+                self.active,
+                self.queued,
+                self.policy,
+            )
+
+    def _wake(self) -> None:
+        """Start queued sends, highest priority first, while slots are free."""
+        for priority in reversed(PRIORITIES):
+            queue = self._queues[priority]
+            while queue and self.active < self.max_active:
+                _, waiter = queue.popleft()
+                self.queued -= 1
+                if not waiter.done():
+                    self.active += 1
+                    self._waking += 1
+                    waiter.set_result(None)
+            if self.active >= self.max_active:
+                return
+
+    def stats(self) -> Dict[str, int]:
+        """Return the controller state for metrics."""
+        return {
+            "sends_active": self.active,
+            "sends_queued": self.queued,
+            "sends_queued_peak": self.max_queued_seen,
+            "sends_shed": sum(self.shed.values()),
+            **{
+                f"sends_shed_{priority}": count for priority, count in self.shed.items()
+            },
+        }
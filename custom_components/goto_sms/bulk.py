@@ -0,0 +1,345 @@
+"""Streaming bulk send from a recipients file."""
+
+import asyncio
+import csv
+import heapq
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    BULK_CHUNK_SIZE,
+    BULK_PROGRESS_INTERVAL,
+    DOMAIN,
+    EVENT_BULK_PROGRESS,
+    PRIORITY_LOW,
+)
+from .deadline import monotonic_deadline
+from .groups import normalize_number
+from .records import new_idempotency_key
+from .templates import MessageTemplate
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+async def async_resolve_recipients_file(hass: HomeAssistant, name: str) -> str:
+    """Resolve a recipients file, which must live in the config dir."""
+    config_dir = os.path.realpath(hass.config.config_dir)
+    path = await hass.async_add_executor_job(
+        os.path.realpath, os.path.join(config_dir, name)
+    )
+    inside_config = os.path.commonpath([path, config_dir]) == config_dir
+    if not inside_config and not hass.config.is_allowed_path(path):
+        raise HomeAssistantError(f"Access to {name} is not allowed")
+    if not await hass.async_add_executor_job(os.path.isfile, path):
+        raise HomeAssistantError(f"Recipients file {name} does not exist")
+    return path
+
+
+def _json_rows(handle: Any) -> Iterator[Optional[Dict[str, Any]]]:
+    """Yield the object on each JSONL line, or None for a malformed line."""
+    for line in handle:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        # A bad line still takes a row number, so checkpoints stay stable
+        yield row if isinstance(row, dict) else None
+
+
+def open_rows(path: str) -> Tuple[Any, Iterator[Optional[Dict[str, Any]]]]:
+    """Open a CSV or JSONL recipients file and return (file, row iterator)."""
+    handle = open(path, encoding="utf-8", newline="")
+    if os.path.splitext(path)[1].lower() in (".jsonl", ".ndjson"):
+        rows: Iterator[Optional[Dict[str, Any]]] = _json_rows(handle)
+    else:
+        rows = csv.DictReader(handle)
+    return handle, rows
+
+
+def _read_chunk(
+    rows: Iterator[Optional[Dict[str, Any]]], size: int
+) -> List[Optional[Dict[str, Any]]]:
+    """Read up to size rows (runs in the executor)."""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            break
+    return chunk
+
+
+class BulkSendJob:
+    """Sends one message per row of a recipients file with bounded concurrency."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        service: Any,
+        job_id: str,
+        path: str,
+        template: MessageTemplate,
+        sender_id: str,
+        target_field: str,
+        max_in_flight: int,
+        priority: str = PRIORITY_LOW,
+        deadline: Optional[datetime] = None,
+    ) -> None:
+        """Initialize the job; rows not sent by deadline (UTC) expire."""
+        self.hass = hass
+        self.service = service
+        self.job_id = job_id
+        self.path = path
+        self.template = template
+        self.sender_id = sender_id
+        self.target_field = target_field
+        self.max_in_flight = max(1, max_in_flight)
+        self.priority = priority
+        self.deadline = deadline
+
+        self.sent = 0
+        self.failed = 0
+        self.skipped = 0
+        self.expired = 0
+        self._deadline: Optional[float] = None
+        self._next_row = 0
+        self._in_flight_rows: Set[int] = set()
+        # Rows past the checkpoint that already finished, as a min-heap
+        self._finished_rows: List[int] = []
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.bulk_{job_id}")
+
+    @property
+    def done(self) -> int:
+        """Return the number of rows finished, whatever their outcome."""
+        return self.sent + self.failed + self.skipped + self.expired
+
+    @property
+    def checkpoint(self) -> int:
+        """Return the first row not known to be finished."""
+        if self._in_flight_rows:
+            return min(self._in_flight_rows)
+        return self._next_row
+
+    def _finish_row(self, row_number: int) -> None:
+        """Mark a row finished and forget rows the checkpoint has passed."""
+        self._in_flight_rows.discard(row_number)
+        heapq.heappush(self._finished_rows, row_number)
+        checkpoint = self.checkpoint
+        while self._finished_rows and self._finished_rows[0] < checkpoint:
+            heapq.heappop(self._finished_rows)
+
+    async def async_run(self, resume: bool = True) -> None:
+        """Run the job, continuing from a saved checkpoint if resuming."""
+        start_row = 0
+        finished: Set[int] = set()
+        saved = await self._store.async_load() if resume else None
+        if saved and saved.get("path") == self.path:
+            start_row = saved["next_row"]
+            # Rows that finished while an earlier row was still in flight
+            finished = set(saved.get("finished_rows", []))
+            self._finished_rows = sorted(finished)
+            self.sent = saved.get("sent", 0)
+            self.failed = saved.get("failed", 0)
+            self.skipped = saved.get("skipped", 0)
+            self.expired = saved.get("expired", 0)
+            if saved.get("deadline"):
+                # A time to live counts from the job's first start
+                self.deadline = dt_util.parse_datetime(saved["deadline"])
+            _LOGGER.info("Resuming bulk job %s at row %d", self.job_id, start_row)
+        self._deadline = monotonic_deadline(self.deadline)
+
+        handle, rows = await self.hass.async_add_executor_job(open_rows, self.path)
+        pending: Set[asyncio.Task] = set()
+        try:
+            while True:
+                chunk = await self.hass.async_add_executor_job(
+                    _read_chunk, rows, BULK_CHUNK_SIZE
+                )
+                if not chunk:
+                    break
+
+                first_row = self._next_row
+                self._next_row += len(chunk)
+                if self._next_row <= start_row:
+                    continue
+                if first_row < start_row:
+                    chunk = chunk[start_row - first_row :]
+                    first_row = start_row
+
+                # Rows are rendered lazily, one at a time, as slots free up
+                messages = self.template.render_many(row or {} for row in chunk)
+                for row_number, (row, message) in enumerate(
+                    zip(chunk, messages), first_row
+                ):
+                    if row_number in finished:
+                        # Already counted before the job stopped
+                        continue
+                    # Backpressure: wait for a slot before reading further
+                    self._in_flight_rows.add(row_number)
+                    while len(pending) >= self.max_in_flight:
+                        _, pending = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+
+                    pending.add(
+                        asyncio.create_task(self._send_row(row_number, row, message))
+                    )
+
+            if pending:
+                await asyncio.wait(pending)
+        except asyncio.CancelledError:
+            _LOGGER.warning(
+                "Bulk job %s interrupted; resumable from row %d",
+                self.job_id,
+                self.checkpoint,
+            )
+            await self._async_stop(pending)
+            raise
+        except Exception as e:
+            _LOGGER.error(
+                "Bulk job %s stopped: %s; resumable from row %d",
+                self.job_id,
+                e,
+                self.checkpoint,
+            )
+            await self._async_stop(pending)
+            self._fire_progress(done=False, error=str(e))
+            return
+        finally:
+            await self.hass.async_add_executor_job(handle.close)
+
+        await self._store.async_remove()
+        self._fire_progress(done=True)
+        _LOGGER.info(
+            "Bulk job %s finished: %d sent, %d failed, %d skipped, %d expired",
+            self.job_id,
+            self.sent,
+            self.failed,
+            self.skipped,
+            self.expired,
+        )
+
+    async def _async_stop(self, pending: Set[asyncio.Task]) -> None:
+        """Cancel the sends in flight, wait for them and save the checkpoint."""
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        await self._store.async_save(self._checkpoint_data())
+
+    async def _send_row(
+        self, row_number: int, row: Optional[Dict[str, Any]], message: Optional[str]
+    ) -> None:
+        """Send a single row and update the checkpoint."""
+        try:
+            await self._async_send_row(row_number, row, message)
+        except asyncio.CancelledError:
+            # Leave the row in flight so the checkpoint does not skip it
+            raise
+        except Exception as e:
+            _LOGGER.error("Bulk job %s row %d failed: %s", self.job_id, row_number, e)
+            self.failed += 1
+
+        self._finish_row(row_number)
+        if self.done % BULK_PROGRESS_INTERVAL == 0:
+            self._store.async_delay_save(self._checkpoint_data, 1)
+            self._fire_progress(done=False)
+
+    async def _async_send_row(
+        self, row_number: int, row: Optional[Dict[str, Any]], message: Optional[str]
+    ) -> None:
+        """Render and send the message for a single row."""
+        if row is None:
+            _LOGGER.warning(
+                "Bulk job %s row %d: not a JSON object", self.job_id, row_number
+            )
+            self.skipped += 1
+            return
+
+        target = normalize_number(row.get(self.target_field) or "")
+        if target is None:
+            _LOGGER.warning(
+                "Bulk job %s row %d: invalid %s",
+                self.job_id,
+                row_number,
+                self.target_field,
+            )
+            self.skipped += 1
+            return
+
+        if self.service._is_suppressed(target):
+            _LOGGER.debug(
+                "Bulk job %s row %d: %s is suppressed", self.job_id, row_number, target
+            )
+            self.skipped += 1
+            return
+
+        if message is None:
+            _LOGGER.warning(
+                "Bulk job %s row %d: message failed to render", self.job_id, row_number
+            )
+            self.skipped += 1
+            return
+
+        # Derived from the row so a resumed job reuses the key of any row
+        # that was in flight when it stopped
+        idempotency_key = new_idempotency_key("bulk", self.job_id, row_number)
+        result = await self.service._async_send(
+            message,
+            target,
+            self.sender_id,
+            idempotency_key,
+            self.priority,
+            deadline=self._deadline,
+        )
+        if result.sent:
+            self.sent += 1
+        elif result.status == "expired":
+            self.expired += 1
+        else:
+            self.failed += 1
+
+    def _checkpoint_data(self) -> Dict[str, Any]:
+        """Return the data persisted for resuming the job."""
+        return {
+            "path": self.path,
+            "next_row": self.checkpoint,
+            "finished_rows": sorted(self._finished_rows),
+            "sent": self.sent,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "expired": self.expired,
+            "deadline": self.deadline.isoformat() if self.deadline else None,
+        }
+
+    def _fire_progress(self, done: bool, error: Optional[str] = None) -> None:
+        """Report progress, or the error that stopped the job, on the event bus."""
+        data: Dict[str, Any] = {
+            "job_id": self.job_id,
+            "sent": self.sent,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "expired": self.expired,
+            "checkpoint": self.checkpoint,
+            "done": done,
+        }
+        if error is not None:
+            data["error"] = error
+        self.hass.bus.async_fire(EVENT_BULK_PROGRESS, data)
+
+
+def default_job_id(path: str) -> str:
+    """Derive a job ID from the recipients file name."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    return "".join(c if c.isalnum() else "_" for c in name).lower() or "bulk"
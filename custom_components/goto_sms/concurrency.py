@@ -0,0 +1,180 @@
+"""Adaptive concurrency control for the GoTo SMS send path."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+
+from .const import (
+    AIMD_BACKOFF,
+    AIMD_ERROR_RATE,
+    AIMD_LATENCY_SPIKE,
+    AIMD_WINDOW,
+    DEFAULT_INITIAL_CONCURRENCY,
+    DEFAULT_MAX_CONCURRENCY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+OUTCOME_OK = "ok"
+OUTCOME_THROTTLED = "throttled"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_ERROR = "error"
+
+
+class Sample:
+    """The outcome of one request made within the limit."""
+
+    def __init__(self, started: float) -> None:
+        """Initialize the sample."""
+        self.started = started
+        self.outcome = OUTCOME_OK
+
+    def record_status(self, status: int) -> None:
+        """Classify an HTTP status for the controller."""
+        if status == 429:
+            self.outcome = OUTCOME_THROTTLED
+        elif status >= 500:
+            self.outcome = OUTCOME_ERROR
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on in-flight requests.
+
+    The limit grows by roughly one per window of healthy responses and is
+    multiplied by AIMD_BACKOFF on a 429, a timeout, or when windowed p95
+    latency rises AIMD_LATENCY_SPIKE times above the observed baseline.
+    Responses to requests started before the last cut do not cut again.
+    """
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_INITIAL_CONCURRENCY,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_MAX_CONCURRENCY,
+        window: int = AIMD_WINDOW,
+    ) -> None:
+        """Initialize the limiter."""
+        self.min_limit = min_limit
+        self.max_limit = max(min_limit, max_limit)
+        self.limit = float(min(max(initial, min_limit), self.max_limit))
+        self.in_flight = 0
+        self.decreases = 0
+
+        self._window = window
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._errors: Deque[bool] = deque(maxlen=window)
+        self._samples_since_p95 = 0
+        self._p95: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._last_decrease = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[Sample]:
+        """Wait for room under the limit and time the request made within it."""
+        await self._acquire()
+        sample = Sample(time.monotonic())
+        try:
+            yield sample
+        except (asyncio.TimeoutError, TimeoutError):
+            sample.outcome = OUTCOME_TIMEOUT
+            raise
+        except asyncio.CancelledError:
+            sample = None
+            raise
+        except Exception:
+            sample.outcome = OUTCOME_ERROR
+            raise
+        finally:
+            self.in_flight -= 1
+            if sample is not None:
+                self._record(sample, time.monotonic() - sample.started)
+            self._wake()
+
+    async def _acquire(self) -> None:
+        """Wait until fewer than limit requests are in flight."""
+        if self.in_flight >= int(self.limit) or self._waiters:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif waiter.done() and not waiter.cancelled():
+                    # We were handed a slot we will not use; pass it on
+                    self.in_flight -= 1
+                    self._wake()
+                raise
+        else:
+            self.in_flight += 1
+
+    def _wake(self) -> None:
+        """Hand free slots to waiters in FIFO order."""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def _record(self, sample: Sample, latency: float) -> None:
+        """Feed a finished request into the AIMD controller."""
+        failed = sample.outcome != OUTCOME_OK
+        self._errors.append(failed)
+
+        if sample.outcome in (OUTCOME_THROTTLED, OUTCOME_TIMEOUT):
+            self._decrease(sample, sample.outcome)
+            return
+
+        if failed:
+            return
+
+        self._latencies.append(latency)
+        p95, baseline = self._latency_stats()
+        if p95 is not None and baseline and p95 > AIMD_LATENCY_SPIKE * baseline:
+            self._decrease(sample, "latency")
+            return
+
+        if sum(self._errors) <= AIMD_ERROR_RATE * len(self._errors):
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def _latency_stats(self) -> Tuple[Optional[float], Optional[float]]:
+        """Return (windowed p95, baseline), refreshed once per window."""
+        self._samples_since_p95 += 1
+        if self._samples_since_p95 >= self._window and len(self._latencies) >= 10:
+            self._samples_since_p95 = 0
+            ordered = sorted(self._latencies)
+            self._p95 = ordered[int(len(ordered) * 0.95) - 1]
+            median = ordered[len(ordered) // 2]
+            # The baseline tracks the lowest median seen, drifting up slowly so
+            # a permanent change in the API's latency is eventually accepted
+            if self._baseline is None or median < self._baseline:
+                self._baseline = median
+            else:
+                self._baseline *= 1.05
+        return self._p95, self._baseline
+
+    def _decrease(self, sample: Sample, reason: str) -> None:
+        """Cut the limit multiplicatively, once per round of requests."""
+        if sample.started < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        self.limit = max(self.min_limit, self.limit * AIMD_BACKOFF)
+        self.decreases += 1
+        self._p95 = None
+        self._latencies.clear()
+        _LOGGER.debug("Concurrency limit cut to %.1f (%s)", self.limit, reason)
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Return the controller state for metrics."""
+        return {
+            "concurrency_limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "latency_p95": self._p95,
+            "latency_baseline": self._baseline,
+            "limit_decreases": self.decreases,
+        }
@@ -5,20 +5,55 @@ from typing import Any, Dict, Optional
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import selector
 
 from .const import (
+    CONF_BUDGET_HARD_CAP,
     CONF_CLIENT_ID,
     CONF_CLIENT_SECRET,
+    CONF_DEFAULT_SENDER,
+    CONF_DRY_RUN,
+    CONF_DRY_RUN_ERROR_RATE,
+    CONF_DRY_RUN_LATENCY,
+    CONF_LOOP_WATCHDOG,
+    CONF_MAX_ACTIVE_SENDS,
+    CONF_MAX_CONCURRENCY,
+    CONF_MAX_QUEUED_SENDS,
+    CONF_MONTHLY_BUDGET,
+    CONF_PHONE_ATTRIBUTE,
+    CONF_RECIPIENT_GROUPS,
+    CONF_RECORD_TRAFFIC,
+    CONF_RETRY_BUDGET,
+    CONF_ROUTING_RULES,
+    CONF_SENDER_POOLS,
+    CONF_SENDER_RATE,
+    CONF_SHED_POLICY,
+    CONF_SLOW_CALLBACK_THRESHOLD,
+    DEFAULT_DRY_RUN_ERROR_RATE,
+    DEFAULT_DRY_RUN_LATENCY,
+    DEFAULT_MAX_ACTIVE_SENDS,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_QUEUED_SENDS,
+    DEFAULT_PHONE_ATTRIBUTE,
+    DEFAULT_RETRY_BUDGET,
+    DEFAULT_SENDER_BURST,
+    DEFAULT_SENDER_RATE,
+    DEFAULT_SHED_POLICY,
+    DEFAULT_SLOW_CALLBACK_THRESHOLD,
     DOMAIN,
     OAUTH2_AUTHORIZE_URL,
     OAUTH2_SCOPE,
     OAUTH2_TOKEN_URL,
+    SHED_POLICIES,
 )
+from .groups import normalize_number, parse_groups
 from .oauth import GoToOAuth2Manager
+from .pool import build_sender_pools
+from .routing import parse_rules
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -292,6 +327,183 @@ class GoToSMSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle import from configuration.yaml."""
         return await self.async_step_user(import_info)
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> "GoToSMSOptionsFlow":
+        """Get the options flow for this handler."""
+        return GoToSMSOptionsFlow(config_entry)
+
+
+class GoToSMSOptionsFlow(config_entries.OptionsFlow):
+    """Handle GoTo SMS options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Manage the integration options."""
+        errors = {}
+
+        if user_input is not None:
+            try:
+                parse_groups(user_input.get(CONF_RECIPIENT_GROUPS, ""))
+            except ValueError as e:
+                _LOGGER.warning("Invalid recipient groups: %s", e)
+                errors[CONF_RECIPIENT_GROUPS] = "invalid_groups"
+
+            try:
+                build_sender_pools(
+                    user_input.get(CONF_SENDER_POOLS, ""),
+                    user_input.get(CONF_SENDER_RATE, DEFAULT_SENDER_RATE),
+                    DEFAULT_SENDER_BURST,
+                )
+            except ValueError as e:
+                _LOGGER.warning("Invalid sender pools: %s", e)
+                errors[CONF_SENDER_POOLS] = "invalid_pools"
+
+            try:
+                parse_rules(user_input.get(CONF_ROUTING_RULES, ""))
+            except ValueError as e:
+                _LOGGER.warning("Invalid routing rules: %s", e)
+                errors[CONF_ROUTING_RULES] = "invalid_rules"
+
+            default_sender = user_input.get(CONF_DEFAULT_SENDER)
+            if default_sender and normalize_number(default_sender) is None:
+                errors[CONF_DEFAULT_SENDER] = "invalid_sender"
+
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = user_input or self.config_entry.options
+        sender_numbers = self.hass.data.get(DOMAIN, {}).get(
+            f"{self.config_entry.entry_id}_sender_numbers"
+        )
+        known_numbers = sorted(sender_numbers.numbers) if sender_numbers else []
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_DEFAULT_SENDER,
+                        description={
+                            "suggested_value": options.get(CONF_DEFAULT_SENDER)
+                        },
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=known_numbers,
+                            custom_value=True,
+                            mode=selector.SelectSelectorMode.DROPDOWN,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_RECIPIENT_GROUPS,
+                        default=options.get(CONF_RECIPIENT_GROUPS, ""),
+                    ): selector.TextSelector(
+                        selector.TextSelectorConfig(multiline=True)
+                    ),
+                    vol.Optional(
+                        CONF_PHONE_ATTRIBUTE,
+                        default=options.get(
+                            CONF_PHONE_ATTRIBUTE, DEFAULT_PHONE_ATTRIBUTE
+                        ),
+                    ): str,
+                    vol.Optional(
+                        CONF_SENDER_POOLS,
+                        default=options.get(CONF_SENDER_POOLS, ""),
+                    ): selector.TextSelector(
+                        selector.TextSelectorConfig(multiline=True)
+                    ),
+                    vol.Optional(
+                        CONF_ROUTING_RULES,
+                        default=options.get(CONF_ROUTING_RULES, ""),
+                    ): selector.TextSelector(
+                        selector.TextSelectorConfig(multiline=True)
+                    ),
+                    vol.Optional(
+                        CONF_SENDER_RATE,
+                        default=options.get(CONF_SENDER_RATE, DEFAULT_SENDER_RATE),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=100)),
+                    vol.Optional(
+                        CONF_MAX_CONCURRENCY,
+                        default=options.get(
+                            CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=256)),
+                    vol.Optional(
+                        CONF_RETRY_BUDGET,
+                        default=options.get(CONF_RETRY_BUDGET, DEFAULT_RETRY_BUDGET),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+                    vol.Optional(
+                        CONF_MAX_ACTIVE_SENDS,
+                        default=options.get(
+                            CONF_MAX_ACTIVE_SENDS, DEFAULT_MAX_ACTIVE_SENDS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10000)),
+                    vol.Optional(
+                        CONF_MAX_QUEUED_SENDS,
+                        default=options.get(
+                            CONF_MAX_QUEUED_SENDS, DEFAULT_MAX_QUEUED_SENDS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100000)),
+                    vol.Optional(
+                        CONF_SHED_POLICY,
+                        default=options.get(CONF_SHED_POLICY, DEFAULT_SHED_POLICY),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=SHED_POLICIES,
+                            translation_key=CONF_SHED_POLICY,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_MONTHLY_BUDGET,
+                        default=options.get(CONF_MONTHLY_BUDGET, 0),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100000000)),
+                    vol.Optional(
+                        CONF_BUDGET_HARD_CAP,
+                        default=options.get(CONF_BUDGET_HARD_CAP, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_DRY_RUN,
+                        default=options.get(CONF_DRY_RUN, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_DRY_RUN_LATENCY,
+                        default=options.get(
+                            CONF_DRY_RUN_LATENCY, DEFAULT_DRY_RUN_LATENCY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=60000)),
+                    vol.Optional(
+                        CONF_DRY_RUN_ERROR_RATE,
+                        default=options.get(
+                            CONF_DRY_RUN_ERROR_RATE, DEFAULT_DRY_RUN_ERROR_RATE
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                    vol.Optional(
+                        CONF_RECORD_TRAFFIC,
+                        default=options.get(CONF_RECORD_TRAFFIC, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_LOOP_WATCHDOG,
+                        default=options.get(CONF_LOOP_WATCHDOG, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_SLOW_CALLBACK_THRESHOLD,
+                        default=options.get(
+                            CONF_SLOW_CALLBACK_THRESHOLD,
+                            DEFAULT_SLOW_CALLBACK_THRESHOLD,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=10000)),
+                }
+            ),
+            errors=errors,
+        )
+
 
 class InvalidCredentials(HomeAssistantError):
     """Error to indicate there is invalid auth."""
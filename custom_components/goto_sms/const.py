@@ -11,6 +11,7 @@ OAUTH2_SCOPE = "messaging.v1.send"
 # GoTo Connect API Endpoints
 GOTO_API_BASE_URL = "https://api.goto.com"
 SMS_ENDPOINT = "/messaging/v1/messages"
+PHONE_NUMBERS_ENDPOINT = "/voice-admin/v1/phone-numbers"
 
 # Configuration keys
 CONF_CLIENT_ID = "client_id"
@@ -25,6 +26,168 @@ ATTR_MESSAGE = "message"
 ATTR_TARGET = "target"
 ATTR_SENDER_ID = "sender_id"
 ATTR_TEMPLATE_DATA = "data"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+# Bulk send service
+SERVICE_SEND_BULK = "send_bulk"
+ATTR_FILE = "file"
+ATTR_TARGET_FIELD = "target_field"
+ATTR_MAX_IN_FLIGHT = "max_in_flight"
+ATTR_JOB_ID = "job_id"
+ATTR_RESUME = "resume"
+EVENT_BULK_PROGRESS = "goto_sms_bulk_progress"
+DEFAULT_TARGET_FIELD = "phone"
+DEFAULT_BULK_MAX_IN_FLIGHT = 10
+BULK_CHUNK_SIZE = 100
+BULK_PROGRESS_INTERVAL = 100
+
+# Suppression (opt-out) list
+SERVICE_SUPPRESSION_ADD = "suppression_add"
+SERVICE_SUPPRESSION_REMOVE = "suppression_remove"
+SERVICE_SUPPRESSION_IMPORT = "suppression_import"
+ATTR_NUMBERS = "numbers"
+STOP_KEYWORDS = {"STOP", "STOPALL", "UNSUBSCRIBE", "CANCEL", "END", "QUIT"}
+START_KEYWORDS = {"START", "UNSTOP"}
+
+# Dry run: sends go through the whole pipeline but end in an in-process sink
+ATTR_DRY_RUN = "dry_run"
+DEFAULT_DRY_RUN_LATENCY = 200  # Milliseconds
+DEFAULT_DRY_RUN_ERROR_RATE = 0  # Percent of sends answered with a server error
+MAX_DRY_RUN_RECORDS = 1000
+
+# Webhook receiver for GoTo notification-channel events
+CONF_WEBHOOK_ID = "webhook_id"
+EVENT_MESSAGE_RECEIVED = "goto_sms_message_received"
+EVENT_MESSAGE_STATUS = "goto_sms_message_status"
+MAX_OUTBOUND_RECORDS = 1000
+
+# Idempotent sends
+ATTR_IDEMPOTENCY_KEY = "idempotency_key"
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# Send results and background sends
+SERVICE_SEND_STATUS = "send_status"
+ATTR_BACKGROUND = "background"
+EVENT_SEND_COMPLETE = "goto_sms_send_complete"
+MAX_SEND_JOBS = 100
+
+# Sender number discovery
+SENDER_NUMBERS_TTL = 3600  # Seconds between background refreshes
+
+# Admission control of pending sends
+ATTR_PRIORITY = "priority"
+PRIORITY_LOW = "low"
+PRIORITY_NORMAL = "normal"
+PRIORITY_HIGH = "high"
+PRIORITY_CRITICAL = "critical"
+PRIORITIES = [PRIORITY_LOW, PRIORITY_NORMAL, PRIORITY_HIGH, PRIORITY_CRITICAL]
+# Share of the queue each priority may fill on its own
+PRIORITY_QUEUE_SHARE = {
+    PRIORITY_LOW: 0.5,
+    PRIORITY_NORMAL: 0.75,
+    PRIORITY_HIGH: 1.0,
+    PRIORITY_CRITICAL: 1.0,
+}
+SHED_REJECT_NEWEST = "reject_newest"
+SHED_DROP_OLDEST = "drop_oldest"
+SHED_DROP_LOWEST_PRIORITY = "drop_lowest_priority"
+SHED_POLICIES = [SHED_REJECT_NEWEST, SHED_DROP_OLDEST, SHED_DROP_LOWEST_PRIORITY]
+DEFAULT_MAX_ACTIVE_SENDS = 100
+DEFAULT_MAX_QUEUED_SENDS = 1000
+DEFAULT_SHED_POLICY = SHED_DROP_LOWEST_PRIORITY
+EVENT_MESSAGE_SHED = "goto_sms_message_shed"
+
+# Group conversations
+ATTR_MODE = "mode"
+MODE_INDIVIDUAL = "individual"
+MODE_GROUP = "group"
+MODES = (MODE_INDIVIDUAL, MODE_GROUP)
+GROUP_MAX_CONTACTS = 10  # Contact numbers the API accepts in one group message
+
+# Message deadlines
+ATTR_TTL = "ttl"
+ATTR_DEADLINE = "deadline"
+
+# Startup warm-up
+WARMUP_TIMEOUT = 10  # Seconds to wait for a host before giving up
+STARTUP_VALIDATOR = "startup"
+STARTUP_VALIDATION_TIMEOUT = 20  # Seconds a setup waits for its tokens
+
+# Profiler
+SERVICE_PROFILE = "profile"
+PROFILER = "profiler"
+ATTR_DURATION = "duration"
+ATTR_INTERVAL = "interval"
+DEFAULT_PROFILE_DURATION = 30  # Seconds
+DEFAULT_PROFILE_INTERVAL = 5  # Milliseconds between samples
+PROFILE_TOP_FUNCTIONS = 15
+
+# Event loop watchdog
+CONF_LOOP_WATCHDOG = "loop_watchdog"
+CONF_SLOW_CALLBACK_THRESHOLD = "slow_callback_threshold"
+DEFAULT_SLOW_CALLBACK_THRESHOLD = 100  # Milliseconds
+LOOP_HEARTBEAT_INTERVAL = 0.05  # Seconds between heartbeats
+LOOP_LAG_WINDOW = 1200  # Heartbeats kept for the lag percentile
+LOOP_RECENT_STALLS = 20  # Stalls listed in diagnostics
+
+# Usage and budget
+CONF_MONTHLY_BUDGET = "monthly_segment_budget"
+CONF_BUDGET_HARD_CAP = "budget_hard_cap"
+USAGE_PERIODS = ("hour", "day", "month")
+USAGE_HISTORY = {"hour": 24, "day": 31, "month": 12}  # Finished periods kept
+USAGE_FLUSH_INTERVAL = 5  # Seconds between saves and sensor updates while sending
+SIGNAL_USAGE_UPDATED = "goto_sms_usage_updated_{}"
+SIGNAL_USAGE_NEW_SENDER = "goto_sms_usage_new_sender_{}"
+EVENT_USAGE_BUDGET_REACHED = "goto_sms_budget_reached"
+
+# Sender number entities
+SERVICE_SEND_MESSAGE = "send_message"
+SIGNAL_SENDERS_UPDATED = "goto_sms_senders_updated_{}"
+
+# Traffic recording
+CONF_RECORD_TRAFFIC = "record_traffic"
+TRAFFIC_FILE = "goto_sms_traffic_{}.jsonl"
+TRAFFIC_FLUSH_SIZE = 200  # Buffered calls before a write
+TRAFFIC_FLUSH_INTERVAL = 5  # Seconds between writes of a partial buffer
+TRAFFIC_MAX_BYTES = 100 * 1024 * 1024  # Recording stops at this size
+
+# Options
+CONF_RECIPIENT_GROUPS = "recipient_groups"
+CONF_PHONE_ATTRIBUTE = "phone_attribute"
+DEFAULT_PHONE_ATTRIBUTE = "phone_number"
+CONF_SENDER_POOLS = "sender_pools"
+CONF_SENDER_RATE = "sender_rate"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_RETRY_BUDGET = "retry_budget"
+CONF_DRY_RUN = "dry_run"
+CONF_DRY_RUN_LATENCY = "dry_run_latency"
+CONF_DRY_RUN_ERROR_RATE = "dry_run_error_rate"
+CONF_DEFAULT_SENDER = "default_sender"
+CONF_MAX_ACTIVE_SENDS = "max_active_sends"
+CONF_MAX_QUEUED_SENDS = "max_queued_sends"
+CONF_SHED_POLICY = "shed_policy"
+CONF_ROUTING_RULES = "routing_rules"
+
+# Routing rules
+ROUTE_MATCH_ALL = "*"  # Conditions of a rule that matches every notification
+
+# Sender pools
+DEFAULT_SENDER_RATE = 1.0  # Messages per second per GoTo number
+DEFAULT_SENDER_BURST = 1
+MAX_STICKY_RECIPIENTS = 10000
+
+# Adaptive (AIMD) concurrency control of in-flight API requests
+DEFAULT_INITIAL_CONCURRENCY = 4
+DEFAULT_MAX_CONCURRENCY = 32
+AIMD_WINDOW = 50  # Samples per latency window
+AIMD_BACKOFF = 0.5  # Multiplicative decrease factor
+AIMD_LATENCY_SPIKE = 3.0  # p95 over this multiple of the baseline is a spike
+AIMD_ERROR_RATE = 0.1  # No increase while the windowed error rate is above this
+
+# Shared retry budget for sends and token refreshes
+DEFAULT_RETRY_BUDGET = 20  # Retries allowed as a percentage of first attempts
+RETRY_BUDGET_WINDOW = 10  # Sliding window in seconds
+RETRY_BUDGET_MIN_RETRIES = 10  # Retries always allowed per window at low traffic
 
 # Default values
 # Note: sender_id is required and must be a valid GoTo phone number in E.164 format
@@ -0,0 +1,81 @@
+"""Message deadlines for the GoTo SMS integration."""
+
+import asyncio
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, AsyncContextManager, AsyncIterator, Optional, TypeVar
+
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+_T = TypeVar("_T")
+
+
+class MessageExpired(Exception):
+    """A message's deadline passed, or would pass, before it was sent."""
+
+    def __init__(self, reason: str) -> None:
+        """Initialize the exception."""
+        super().__init__(reason)
+        self.reason = reason
+
+
+def deadline_at(ttl: Any = None, deadline: Any = None) -> Optional[datetime]:
+    """Return the UTC time a message must be sent by, if any.
+
+    ttl is a duration from now (seconds, "HH:MM:SS" or a timedelta) and
+    deadline a date and time, local if it has no time zone; given both,
+    the earlier one applies. Raises vol.Invalid if either cannot be parsed.
+    """
+    limits = []
+    if ttl is not None:
+        if not isinstance(ttl, timedelta):
+            ttl = cv.positive_time_period(ttl)
+        limits.append(dt_util.utcnow() + ttl)
+    if deadline is not None:
+        if not isinstance(deadline, datetime):
+            deadline = cv.datetime(deadline)
+        limits.append(dt_util.as_utc(deadline))
+    return min(limits) if limits else None
+
+
+def monotonic_deadline(at: Optional[datetime]) -> Optional[float]:
+    """Return a UTC deadline as a time.monotonic() value."""
+    if at is None:
+        return None
+    return time.monotonic() + (at - dt_util.utcnow()).total_seconds()
+
+
+def message_deadline(ttl: Any = None, deadline: Any = None) -> Optional[float]:
+    """Return the time.monotonic() a message must be sent by, if any."""
+    return monotonic_deadline(deadline_at(ttl, deadline))
+
+
+def check_deadline(deadline: Optional[float], reason: str, delay: float = 0) -> None:
+    """Raise MessageExpired if the deadline will have passed after delay."""
+    if deadline is not None and time.monotonic() + delay >= deadline:
+        raise MessageExpired(reason)
+
+
+@asynccontextmanager
+async def before_deadline(
+    context: AsyncContextManager[_T], deadline: Optional[float], reason: str
+) -> AsyncIterator[_T]:
+    """Enter context, raising MessageExpired if waiting for it outlasts deadline.
+
+    Only entering is bounded: once the wait is over the body runs to the
+    end, so a request already on its way to GoTo is never cut off.
+    """
+    async with AsyncExitStack() as stack:
+        if deadline is None:
+            yield await stack.enter_async_context(context)
+            return
+        check_deadline(deadline, reason)
+        try:
+            # The loop's clock is time.monotonic()
+            async with asyncio.timeout_at(deadline):
+                value = await stack.enter_async_context(context)
+        except TimeoutError as err:
+            raise MessageExpired(reason) from err
+        yield value
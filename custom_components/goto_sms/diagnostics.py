@@ -0,0 +1,102 @@
+"""Diagnostics support for GoTo SMS."""
+
+import hashlib
+import os
+from typing import Any, Dict, List
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    ATTR_SENDER_ID,
+    ATTR_TARGET,
+    CONF_CLIENT_ID,
+    CONF_CLIENT_SECRET,
+    CONF_DEFAULT_SENDER,
+    CONF_RECIPIENT_GROUPS,
+    CONF_ROUTING_RULES,
+    CONF_SENDER_POOLS,
+    CONF_WEBHOOK_ID,
+    DOMAIN,
+)
+
+TO_REDACT = {CONF_CLIENT_ID, CONF_CLIENT_SECRET, CONF_WEBHOOK_ID, "tokens"}
+
+# Options and routes that hold phone numbers
+OPTIONS_TO_REDACT = {
+    CONF_DEFAULT_SENDER,
+    CONF_RECIPIENT_GROUPS,
+    CONF_ROUTING_RULES,
+    CONF_SENDER_POOLS,
+}
+ROUTING_TO_REDACT = {ATTR_SENDER_ID, ATTR_TARGET}
+
+
+def _dry_run_summary(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Describe would-be sends without their numbers or bodies."""
+    return [
+        {
+            "time": record["time"],
+            "recipients": len(record.get("targets") or []),
+            "body_length": len(record.get("body") or ""),
+            "accepted": record.get("message_id") is not None,
+        }
+        for record in records
+    ]
+
+
+def _hash_numbers(data: Dict[str, Any], salt: bytes) -> Dict[str, Any]:
+    """Replace phone number keys with hashes keyed by salt.
+
+    The salt is new for every download, so numbers cannot be looked up, but
+    the same number matches across the sections of one download.
+    """
+    return {
+        hashlib.blake2b(number.encode(), key=salt, digest_size=6).hexdigest(): value
+        for number, value in data.items()
+    }
+
+
+def _usage_summary(usage_data: Dict[str, Any], salt: bytes) -> Dict[str, Any]:
+    """Return usage counts with the per-sender numbers hashed."""
+    return {
+        **usage_data,
+        "periods": {
+            period: {**counts, "senders": _hash_numbers(counts["senders"], salt)}
+            for period, counts in usage_data["periods"].items()
+        },
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data.get(DOMAIN, {})
+    metrics = data.get(f"{entry.entry_id}_metrics")
+    pools = data.get(f"{entry.entry_id}_pools") or {}
+    dry_run = data.get(f"{entry.entry_id}_dry_run")
+    watchdog = data.get(f"{entry.entry_id}_watchdog")
+    usage = data.get(f"{entry.entry_id}_usage")
+    routing = data.get(f"{entry.entry_id}_routing")
+    salt = os.urandom(16)
+
+    return {
+        "entry": async_redact_data(entry.data, TO_REDACT),
+        "options": async_redact_data(entry.options, OPTIONS_TO_REDACT),
+        "metrics": metrics.as_dict() if metrics is not None else {},
+        "sender_pools": {
+            name: _hash_numbers(pool.stats(), salt) for name, pool in pools.items()
+        },
+        "dry_run_recent": (
+            _dry_run_summary(dry_run.recent()) if dry_run is not None else []
+        ),
+        "slow_callbacks": watchdog.slow_callbacks() if watchdog is not None else {},
+        "usage": _usage_summary(usage.as_dict(), salt) if usage is not None else {},
+        "routing": (
+            async_redact_data(routing.as_dict(), ROUTING_TO_REDACT)
+            if routing is not None
+            else []
+        ),
+    }
@@ -0,0 +1,101 @@
+"""In-process sink that stands in for the GoTo API in dry runs."""
+
+import asyncio
+import random
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.json import json_loads
+
+from .const import (
+    DEFAULT_DRY_RUN_ERROR_RATE,
+    DEFAULT_DRY_RUN_LATENCY,
+    IDEMPOTENCY_HEADER,
+    MAX_DRY_RUN_RECORDS,
+)
+
+# Set for the duration of a service call made with dry_run: true; tasks
+# started during the call, such as fan-out sends and bulk jobs, inherit it
+_DRY_RUN: ContextVar[bool] = ContextVar("goto_sms_dry_run", default=False)
+
+
+@contextmanager
+def dry_run_scope(enabled: Optional[bool]) -> Iterator[None]:
+    """Mark sends started within the block as dry runs if enabled."""
+    if not enabled:
+        yield
+        return
+    token = _DRY_RUN.set(True)
+    try:
+        yield
+    finally:
+        _DRY_RUN.reset(token)
+
+
+class DryRunSink:
+    """Answers sends like the GoTo API would, without sending anything.
+
+    Latency is drawn uniformly between half and one and a half times the
+    configured mean, and error_rate percent of sends get a 500 response.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        latency: float = DEFAULT_DRY_RUN_LATENCY,
+        error_rate: float = DEFAULT_DRY_RUN_ERROR_RATE,
+        max_records: int = MAX_DRY_RUN_RECORDS,
+    ) -> None:
+        """Initialize the sink; latency is in milliseconds."""
+        self.enabled = enabled
+        self.latency = latency
+        self.error_rate = error_rate
+        self.records: Deque[Dict[str, Any]] = deque(maxlen=max_records)
+        self.accepted = 0
+        self.errors = 0
+
+    @property
+    def active(self) -> bool:
+        """Return True if sends in the current context should be sunk."""
+        return self.enabled or _DRY_RUN.get()
+
+    async def post(self, headers: Dict[str, str], data: bytes) -> Tuple[int, str]:
+        """Simulate one POST of a JSON request body to the messaging endpoint."""
+        payload = json_loads(data)
+        if self.latency:
+            await asyncio.sleep(self.latency * random.uniform(0.5, 1.5) / 1000)
+
+        failed = random.random() * 100 < self.error_rate
+        message_id = None if failed else f"dryrun-{uuid.uuid4().hex}"
+        self.records.append(
+            {
+                "time": time.time(),
+                "sender_id": payload.get("ownerPhoneNumber"),
+                "targets": payload.get("contactPhoneNumbers"),
+                "body": payload.get("body"),
+                "idempotency_key": headers.get(IDEMPOTENCY_HEADER),
+                "message_id": message_id,
+            }
+        )
+        if failed:
+            self.errors += 1
+            return 500, json_dumps({"error": "simulated failure"})
+        self.accepted += 1
+        return 201, json_dumps({"id": message_id})
+
+    def recent(self, count: int = 20) -> List[Dict[str, Any]]:
+        """Return the most recent would-be sends, newest last."""
+        return list(self.records)[-count:]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the sink state for metrics."""
+        return {
+            "dry_run_enabled": self.enabled,
+            "dry_run_accepted": self.accepted,
+            "dry_run_errors": self.errors,
+        }
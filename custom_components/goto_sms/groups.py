@@ -0,0 +1,159 @@
+"""Named recipient groups for the GoTo SMS integration."""
+
+import logging
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+_LOGGER = logging.getLogger(__name__)
+
+E164_PATTERN = re.compile(r"^\+[1-9]\d{1,14}$")
+_SEPARATORS = re.compile(r"[\s().\-]")
+_ENTITY_ID = re.compile(r"^[a-z0-9_]+\.[a-z0-9_]+$")
+
+
+def normalize_number(value: str) -> Optional[str]:
+    """Normalize a phone number to E.164, or return None if it is not one.
+
+    The number must carry its country code, after "+" or "00"; a national
+    number such as "(555) 123-4567" is rejected rather than guessed at.
+    """
+    number = _SEPARATORS.sub("", str(value))
+    if number.startswith("00"):
+        number = "+" + number[2:]
+    return number if E164_PATTERN.match(number) else None
+
+
+def split_targets(target: Union[str, Iterable[str], None]) -> List[str]:
+    """Split a target field into individual names or numbers."""
+    if not target:
+        return []
+    if isinstance(target, str):
+        target = target.split(",")
+    return [item.strip() for item in target if item and item.strip()]
+
+
+def parse_groups(text: str) -> Dict[str, List[str]]:
+    """Parse group definitions, one ``name: member, member`` per line."""
+    groups: Dict[str, List[str]] = {}
+    for line_number, line in enumerate((text or "").splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        name, sep, members = line.partition(":")
+        name = name.strip()
+        if not sep or not name:
+            raise ValueError(f"Line {line_number}: expected 'name: member, ...'")
+        groups[name] = split_targets(members)
+    return groups
+
+
+class RecipientGroups:
+    """Expands group names to phone numbers, caching each expansion."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        groups: Dict[str, List[str]],
+        phone_attribute: str,
+    ) -> None:
+        """Initialize the groups."""
+        self.hass = hass
+        self._groups = groups
+        self._phone_attribute = phone_attribute
+        self._cache: Dict[str, Tuple[str, ...]] = {}
+        self._unsub: Optional[Callable[[], None]] = None
+
+        # Map each referenced entity to the groups that must be re-expanded
+        self._groups_by_entity: Dict[str, List[str]] = {}
+        for name, members in groups.items():
+            for member in members:
+                entity_id = member.split(":", 1)[0]
+                if _ENTITY_ID.match(entity_id):
+                    self._groups_by_entity.setdefault(entity_id, []).append(name)
+
+    def __contains__(self, name: str) -> bool:
+        """Return True if a group with this name is defined."""
+        return name in self._groups
+
+    @callback
+    def async_start(self) -> None:
+        """Start invalidating expansions when referenced entities change."""
+        if self._groups_by_entity:
+            self._unsub = async_track_state_change_event(
+                self.hass, list(self._groups_by_entity), self._async_entity_changed
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracking referenced entities."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_entity_changed(self, event: Event) -> None:
+        """Drop cached expansions that depend on the changed entity."""
+        for name in self._groups_by_entity.get(event.data["entity_id"], ()):
+            self._cache.pop(name, None)
+
+    def resolve(self, targets: Union[str, Iterable[str], None]) -> List[str]:
+        """Resolve group names and numbers to a de-duplicated list of numbers."""
+        resolved: Dict[str, None] = {}
+        for target in split_targets(targets):
+            if target in self._groups:
+                numbers = self._cache.get(target)
+                if numbers is None:
+                    numbers = self._cache[target] = self._expand(target)
+                resolved.update(dict.fromkeys(numbers))
+                continue
+
+            number = normalize_number(target)
+            if number is None:
+                _LOGGER.error(
+                    "Ignoring invalid target %s; numbers need a country code "
+                    "(+ or 00)",
+                    target,
+                )
+                continue
+            resolved[number] = None
+        return list(resolved)
+
+    def _expand(self, name: str) -> Tuple[str, ...]:
+        """Expand, normalize and de-duplicate the members of a group."""
+        numbers: Dict[str, None] = {}
+        for member in self._groups[name]:
+            entity_id, _, attribute = member.partition(":")
+            if _ENTITY_ID.match(entity_id):
+                values = self._entity_numbers(entity_id, attribute)
+            else:
+                values = [member]
+
+            for value in values:
+                number = normalize_number(value)
+                if number is None:
+                    _LOGGER.warning("Group %s: ignoring invalid number %s", name, value)
+                    continue
+                numbers[number] = None
+
+        _LOGGER.debug("Expanded group %s to %d numbers", name, len(numbers))
+        return tuple(numbers)
+
+    def _entity_numbers(self, entity_id: str, attribute: str) -> List[str]:
+        """Read phone numbers from an entity attribute."""
+        state = self.hass.states.get(entity_id)
+        if state is None:
+            _LOGGER.warning("Group member %s does not exist", entity_id)
+            return []
+
+        value = state.attributes.get(attribute or self._phone_attribute)
+        if not value:
+            _LOGGER.warning(
+                "Group member %s has no %s attribute",
+                entity_id,
+                attribute or self._phone_attribute,
+            )
+            return []
+        return split_targets(value)
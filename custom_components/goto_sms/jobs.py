@@ -0,0 +1,66 @@
+"""Background send_sms calls whose results can be fetched later."""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, EVENT_SEND_COMPLETE, MAX_SEND_JOBS
+from .records import SendResult, send_response
+
+
+class SendJobs:
+    """Bounded index of background sends keyed by job ID.
+
+    Finished jobs are kept until MAX_SEND_JOBS newer jobs have started, so an
+    automation can poll for the result or wait for the completion event.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_jobs: int = MAX_SEND_JOBS) -> None:
+        """Initialize the job index."""
+        self.hass = hass
+        self._max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def start(self, send: Callable[[], Awaitable[List[SendResult]]]) -> Dict[str, Any]:
+        """Run send in the background and return its job handle."""
+        job_id = uuid.uuid4().hex
+        job = {"job_id": job_id, "state": "running", "started_at": time.time()}
+        self._jobs[job_id] = job
+        while len(self._jobs) > self._max_jobs:
+            self._jobs.popitem(last=False)
+
+        async def run() -> None:
+            try:
+                results = await send()
+            except asyncio.CancelledError:
+                job["state"] = "cancelled"
+                raise
+            except Exception as e:  # Reported through the job, not the loop
+                job.update(state="error", error=str(e))
+            else:
+                job.update(state="done", **send_response(results))
+            finally:
+                job["finished_at"] = time.time()
+                self._tasks.pop(job_id, None)
+            self.hass.bus.async_fire(EVENT_SEND_COMPLETE, dict(job))
+
+        self._tasks[job_id] = self.hass.async_create_background_task(
+            run(), f"{DOMAIN} send job {job_id}"
+        )
+        return dict(job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a snapshot of a job, if still held."""
+        job = self._jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+    def cancel(self) -> None:
+        """Cancel every running job."""
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
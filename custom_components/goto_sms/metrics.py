@@ -0,0 +1,31 @@
+"""Send metrics for the GoTo SMS integration."""
+
+from typing import Any, Callable, Dict
+
+
+class SendMetrics:
+    """Counters and gauges for one config entry."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self._counters: Dict[str, int] = {}
+        self._sources: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+    def increment(self, name: str, count: int = 1) -> None:
+        """Increment a counter."""
+        self._counters[name] = self._counters.get(name, 0) + count
+
+    def get(self, name: str) -> int:
+        """Return the value of a counter."""
+        return self._counters.get(name, 0)
+
+    def add_source(self, name: str, source: Callable[[], Dict[str, Any]]) -> None:
+        """Register a callable whose values are included as gauges."""
+        self._sources[name] = source
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return all counters and current gauge values."""
+        data: Dict[str, Any] = dict(self._counters)
+        for source in self._sources.values():
+            data.update(source())
+        return data
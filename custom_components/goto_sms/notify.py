@@ -1,8 +1,11 @@
 """GoTo SMS notification service."""
 
+import asyncio
 import logging
+import time
+from dataclasses import replace
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 import requests
 from homeassistant.components.notify import (
@@ -10,23 +13,62 @@ from homeassistant.components.notify import (
     ATTR_TARGET,
     BaseNotificationService,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.template import Template, TemplateError
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, ServiceResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.template import TemplateError, is_template_string
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util.json import json_loads
 
+from .admission import SendShed
 from .const import (
+    ATTR_DEADLINE,
+    ATTR_DRY_RUN,
+    ATTR_IDEMPOTENCY_KEY,
+    ATTR_MODE,
+    ATTR_PRIORITY,
     ATTR_SENDER_ID,
     ATTR_TEMPLATE_DATA,
+    ATTR_TTL,
     CONF_CLIENT_ID,
     CONF_CLIENT_SECRET,
+    CONF_DEFAULT_SENDER,
     DOMAIN,
+    EVENT_MESSAGE_SHED,
     GOTO_API_BASE_URL,
+    GROUP_MAX_CONTACTS,
+    IDEMPOTENCY_HEADER,
+    MODE_GROUP,
+    MODE_INDIVIDUAL,
+    PRIORITY_CRITICAL,
+    PRIORITY_NORMAL,
     SMS_ENDPOINT,
 )
+from .deadline import (
+    MessageExpired,
+    before_deadline,
+    check_deadline,
+    message_deadline,
+)
+from .dryrun import dry_run_scope
+from .groups import normalize_number, split_targets
 from .oauth import GoToOAuth2Manager
+from .payload import SmsBody, as_body, sms_payload, sms_segments
+from .pool import SenderPool
+from .records import SendResult, new_idempotency_key
+from .routing import Route
+from .senders import NotifyEntity, SenderEntity, async_setup_senders
+from .templates import MessageTemplate
 
 _LOGGER = logging.getLogger(__name__)
 
+EXPIRED_BEFORE_SEND = "deadline passed before sending"
+EXPIRED_QUEUED = "deadline passed while queued"
+EXPIRED_BEFORE_RETRY = "deadline too close to retry"
+
 
 def get_service(
     hass: HomeAssistant,
@@ -41,12 +83,74 @@ def get_service(
         return None
 
     config_entry = config_entries[0]  # Use the first config entry
-    _LOGGER.debug("Creating OAuth manager with config entry: %s", config_entry.entry_id)
-    oauth_manager = GoToOAuth2Manager(hass, config_entry)
+    # Reuse the service built by the entry's setup when there is one
+    service = hass.data.get(DOMAIN, {}).get(f"{config_entry.entry_id}_service")
+    if service is not None:
+        return service
+
+    # Reuse the entry's OAuth manager so tokens and send state are shared
+    oauth_manager = hass.data.get(DOMAIN, {}).get(f"{config_entry.entry_id}_oauth")
+    if oauth_manager is None:
+        _LOGGER.debug(
+            "Creating OAuth manager with config entry: %s", config_entry.entry_id
+        )
+        oauth_manager = GoToOAuth2Manager(hass, config_entry)
 
     return GoToSMSNotificationService(hass, oauth_manager)
 
 
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up a notify entity for each sender number.
+
+    Only forwarded on Home Assistant versions with notify entities; see
+    SENDER_PLATFORM.
+    """
+    async_setup_senders(hass, entry, async_add_entities, SenderNotifyEntity)
+
+
+class SenderNotifyEntity(SenderEntity, NotifyEntity or Entity):
+    """A sender number as a notify entity, for notify.send_message.
+
+    notify.send_message has no recipients, so the target comes from the
+    routing rules; goto_sms.send_message takes all the send_sms fields.
+    Both go through NotifyEntity's send path, which records the time of
+    the last notification as the state.
+    """
+
+    async def async_send_sms(self, **kwargs: Any) -> ServiceResponse:
+        """Send a message from this number, returning per-recipient results."""
+        response: Dict[str, Any] = {}
+        await self._async_send_message(
+            message=kwargs[ATTR_MESSAGE], fields=kwargs, response=response
+        )
+        return response
+
+    async def async_send_message(
+        self,
+        message: str,
+        title: Optional[str] = None,
+        fields: Optional[Dict[str, Any]] = None,
+        response: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Send a message from this number.
+
+        From notify.send_message only the message is given and it goes to
+        the routed target; goto_sms.send_message passes its fields and
+        collects the results in response.
+        """
+        if fields is not None and response is not None:
+            response.update(await super().async_send_sms(**fields))
+            return
+        sent = await super().async_send_sms(**{ATTR_MESSAGE: message})
+        if not sent["results"]:
+            raise HomeAssistantError(
+                f"Nothing sent from {self.sender}: notify.send_message has no "
+                "recipients, so a routing rule must supply the target"
+            )
+
+
 class GoToSMSNotificationService(BaseNotificationService):
     """GoTo SMS notification service."""
 
@@ -58,72 +162,265 @@ class GoToSMSNotificationService(BaseNotificationService):
 
     async def async_send_message(self, message: str, **kwargs: Any) -> None:
         """Send SMS message."""
-        target = kwargs.get(ATTR_TARGET)
-        sender_id = kwargs.get(ATTR_SENDER_ID)
-
-        if not target:
-            _LOGGER.error("No target phone number provided")
-            return
+        await self.async_send_data({**kwargs, ATTR_MESSAGE: message})
+
+    async def async_send_message_service(self, call) -> List[SendResult]:
+        """Handle the service call for sending SMS, returning the results."""
+        return await self.async_send_data(call.data)
+
+    async def async_send_data(self, data: Mapping[str, Any]) -> List[SendResult]:
+        """Send a message described by send_sms fields, returning the results."""
+        message = data.get(ATTR_MESSAGE)
+        template_data = data.get("data", {})
+        route = self._route(template_data)
+        target = data.get(ATTR_TARGET) or route.target
+        sender_id = (
+            data.get(ATTR_SENDER_ID) or route.sender_id or self._default_sender()
+        )
+        idempotency_key = data.get(ATTR_IDEMPOTENCY_KEY)
+        priority = data.get(ATTR_PRIORITY) or route.priority or PRIORITY_NORMAL
+        mode = data.get(ATTR_MODE) or route.mode or MODE_INDIVIDUAL
 
         if not message:
             _LOGGER.error("No message provided")
-            return
+            return []
+
+        if not target:
+            _LOGGER.error("No target phone number provided")
+            return []
 
         if not sender_id:
             _LOGGER.error(
-                "No sender_id provided. You must specify the GoTo phone number "
-                "in E.164 format to send from."
+                "No sender_id provided and no default sender number is configured"
             )
-            return
-
-        # Render template if message contains template syntax
-        rendered_message = await self._render_template(message, kwargs.get("data", {}))
-
-        # Call the async SMS sending method directly
-        await self._send_sms(rendered_message, target, sender_id)
-
-    async def async_send_message_service(self, call) -> None:
-        """Handle the service call for sending SMS."""
-        message = call.data.get("message")
-        target = call.data.get("target")
-        sender_id = call.data.get("sender_id")
-        template_data = call.data.get("data", {})
+            return []
 
-        if not message:
-            _LOGGER.error("No message provided")
-            return
-
-        if not target:
-            _LOGGER.error("No target phone number provided")
-            return
+        # The time to live counts from the call, not from when sending starts;
+        # the service schemas have already validated both
+        deadline = message_deadline(data.get(ATTR_TTL), data.get(ATTR_DEADLINE))
 
         # Render template if message contains template syntax
         rendered_message = await self._render_template(message, template_data)
+        self._record_call(
+            message, template_data, rendered_message, target, sender_id, priority
+        )
+
+        with dry_run_scope(data.get(ATTR_DRY_RUN)):
+            return await self._send_to_targets(
+                rendered_message,
+                target,
+                sender_id,
+                idempotency_key,
+                priority,
+                mode,
+                deadline,
+            )
 
-        # Call the async SMS sending method directly
-        await self._send_sms(rendered_message, target, sender_id)
+    def _entry_data(self, key: str) -> Any:
+        """Return per-entry runtime data stored by async_setup_entry."""
+        if self.oauth_manager.config_entry is None:
+            return None
+        entry_id = self.oauth_manager.config_entry.entry_id
+        return self.hass.data.get(DOMAIN, {}).get(f"{entry_id}_{key}")
+
+    def _count(self, name: str) -> None:
+        """Increment a send metric for this entry."""
+        metrics = self._entry_data("metrics")
+        if metrics is not None:
+            metrics.increment(name)
+
+    def _route(self, data: Optional[Dict[str, Any]]) -> Route:
+        """Return what the entry's routing rules fill in for this data.
+
+        Values given in the call take precedence over the route.
+        """
+        routing = self._entry_data("routing")
+        route = routing.match(data) if routing else None
+        if route is None:
+            return Route()
+        self._count("routed")
+        return route
+
+    def _record_call(
+        self,
+        message: str,
+        template_data: Optional[Dict[str, Any]],
+        rendered_message: str,
+        target: Any,
+        sender_id: str,
+        priority: str,
+    ) -> None:
+        """Record the call's shape if traffic recording is on."""
+        recorder = self._entry_data("recorder")
+        if recorder is None or not recorder.active:
+            return
+        recorder.record(
+            message,
+            template_data,
+            rendered_message,
+            self._resolve_targets(target),
+            sender_id,
+            priority,
+            is_template_string(message),
+        )
+
+    def _default_sender(self) -> Optional[str]:
+        """Return the configured default sender, or the account's only number."""
+        entry = self.oauth_manager.config_entry
+        if entry is not None and entry.options.get(CONF_DEFAULT_SENDER):
+            return entry.options[CONF_DEFAULT_SENDER]
+        numbers = self._entry_data("sender_numbers")
+        return numbers.default if numbers is not None else None
+
+    def _sender_allowed(self, sender_id: str) -> bool:
+        """Check sender_id against the discovered account numbers.
+
+        Pool names are always allowed, as is any sender while the account's
+        numbers are not known yet.
+        """
+        pools = self._entry_data("pools")
+        if pools and sender_id in pools:
+            return True
+        numbers = self._entry_data("sender_numbers")
+        return numbers is None or numbers.is_valid(sender_id) is not False
+
+    def _is_suppressed(self, target: str) -> bool:
+        """Return True if the recipient opted out or is known to be dead."""
+        suppression = self._entry_data("suppression")
+        return suppression is not None and target in suppression
+
+    def _resolve_targets(self, target: Any) -> List[str]:
+        """Resolve group names and numbers to the list of recipients."""
+        groups = self._entry_data("groups")
+        if groups is None:
+            return split_targets(target)
+        return groups.resolve(target)
+
+    async def _send_to_targets(
+        self,
+        message: str,
+        target: Any,
+        sender_id: str,
+        idempotency_key: Optional[str] = None,
+        priority: str = PRIORITY_NORMAL,
+        mode: str = MODE_INDIVIDUAL,
+        deadline: Optional[float] = None,
+    ) -> List[SendResult]:
+        """Send a message to every resolved recipient concurrently.
+
+        A caller-supplied idempotency key is combined with each recipient so
+        repeating the call with the same key never texts anyone twice. The
+        body is encoded once and shared by every recipient's request. In
+        group mode recipients share group conversations instead. deadline
+        is a time.monotonic() after which unsent messages expire.
+        """
+        targets = self._resolve_targets(target)
+        if not targets:
+            _LOGGER.error("No valid recipients in target: %s", target)
+            return []
+
+        if not self._sender_allowed(sender_id):
+            # Report once here rather than once per recipient below
+            _LOGGER.error(
+                "sender_id %s is not an SMS-capable number of this GoTo account",
+                sender_id,
+            )
+
+        body = SmsBody(message)
+        if mode == MODE_GROUP:
+            return await self._send_groups(
+                body, targets, sender_id, idempotency_key, priority, deadline
+            )
+        return await asyncio.gather(
+            *(
+                self._async_send(
+                    body,
+                    number,
+                    sender_id,
+                    (
+                        new_idempotency_key(idempotency_key, number)
+                        if idempotency_key
+                        else None
+                    ),
+                    priority,
+                    deadline=deadline,
+                )
+                for number in targets
+            )
+        )
+
+    async def _send_groups(
+        self,
+        body: SmsBody,
+        targets: List[str],
+        sender_id: str,
+        idempotency_key: Optional[str],
+        priority: str,
+        deadline: Optional[float] = None,
+    ) -> List[SendResult]:
+        """Send a message as group conversations of up to GROUP_MAX_CONTACTS.
+
+        Each chunk of recipients is one POST with every number in
+        contactPhoneNumbers, so it shares one thread, one message ID and one
+        trip through admission, ordering and retries. Suppressed and repeated
+        numbers are left out first; every recipient gets a result, in order.
+        """
+        results: Dict[str, Optional[SendResult]] = {}
+        members: List[str] = []
+        seen = set()
+        for number in targets:
+            normalized = normalize_number(number) or number
+            if normalized in seen:
+                continue
+            seen.add(normalized)
+            if self._is_suppressed(number):
+                results[number] = self._suppressed(SendResult(number, sender_id))
+            else:
+                results[number] = None
+                members.append(number)
+
+        chunks = [
+            members[i : i + GROUP_MAX_CONTACTS]
+            for i in range(0, len(members), GROUP_MAX_CONTACTS)
+        ]
+        sent = await asyncio.gather(
+            *(
+                self._async_send(
+                    body,
+                    ",".join(chunk),
+                    sender_id,
+                    (
+                        new_idempotency_key(idempotency_key, *chunk)
+                        if idempotency_key
+                        else None
+                    ),
+                    priority,
+                    chunk,
+                    deadline,
+                )
+                for chunk in chunks
+            )
+        )
+        for chunk, group in zip(chunks, sent):
+            for number in chunk:
+                results[number] = replace(group, target=number)
+        return list(results.values())
 
     async def _render_template(
         self, message: str, template_data: Dict[str, Any]
     ) -> str:
         """Render template in message if needed."""
         try:
-            # Check if message contains template syntax
-            if "{{" in message and "}}" in message:
-                _LOGGER.debug("Rendering template: %s", message)
-
-                # Create template object
-                template = Template(message, self.hass)
-
-                # Render template with provided data
-                rendered = template.async_render(template_data)
-
-                _LOGGER.debug("Template rendered to: %s", rendered)
-                return rendered
-            else:
+            template = MessageTemplate(self.hass, message)
+            if template.is_static:
                 # No template syntax, return as-is
                 return message
 
+            _LOGGER.debug("Rendering template: %s", message)
+            rendered = template.render(template_data)
+            _LOGGER.debug("Template rendered to: %s", rendered)
+            return rendered
+
         except TemplateError as e:
             _LOGGER.error("Template rendering failed: %s", e)
             # Return original message if template fails
@@ -132,12 +429,236 @@ class GoToSMSNotificationService(BaseNotificationService):
             _LOGGER.error("Unexpected error during template rendering: %s", e)
             return message
 
-    async def _send_sms(self, message: str, target: str, sender_id: str) -> None:
-        """Send SMS message via GoTo Connect API."""
+    async def _send_sms(
+        self,
+        message: Union[str, SmsBody],
+        target: str,
+        sender_id: str,
+        idempotency_key: Optional[str] = None,
+        priority: str = PRIORITY_NORMAL,
+        deadline: Optional[float] = None,
+    ) -> bool:
+        """Send SMS message via GoTo Connect API, returning True on success."""
+        result = await self._async_send(
+            message, target, sender_id, idempotency_key, priority, deadline=deadline
+        )
+        return result.sent
+
+    async def _async_send(
+        self,
+        message: Union[str, SmsBody],
+        target: str,
+        sender_id: str,
+        idempotency_key: Optional[str] = None,
+        priority: str = PRIORITY_NORMAL,
+        contacts: Optional[List[str]] = None,
+        deadline: Optional[float] = None,
+    ) -> SendResult:
+        """Send SMS message via GoTo Connect API and return the outcome.
+
+        Messages to the same (sender_id, target) conversation are sent one at
+        a time in call order, retries included; other conversations proceed
+        concurrently. Every attempt carries the same idempotency key, so a
+        retry after a lost response cannot deliver the message twice. When
+        the entry's send queue is full the message may be shed instead, and
+        once the monthly budget is used up only critical messages are sent
+        if the hard cap is on. With contacts the message goes to all of them
+        in one group conversation and target only labels it. A message that
+        cannot be sent by its deadline expires instead: while queued, or
+        when the next retry would start after the deadline.
+        """
+        start = time.monotonic()
+        result = SendResult(target, sender_id, idempotency_key or new_idempotency_key())
+
+        if contacts is None and self._is_suppressed(target):
+            return self._suppressed(result)
+
+        if not self._sender_allowed(sender_id):
+            _LOGGER.debug("Not sending to %s: unknown sender_id %s", target, sender_id)
+            self._count("invalid_sender")
+            result.status = "failed"
+            result.error = "unknown sender_id"
+            return result
+
+        usage = self._entry_data("usage")
+        if usage is not None and usage.blocked and priority != PRIORITY_CRITICAL:
+            _LOGGER.debug("Not sending to %s: monthly budget reached", target)
+            self._count("over_budget")
+            result.status = "over_budget"
+            result.error = "monthly segment budget reached"
+            return result
+
+        try:
+            check_deadline(deadline, EXPIRED_BEFORE_SEND)
+            await self._send_in_order(
+                message, target, sender_id, result, priority, contacts, deadline
+            )
+        except SendShed as err:
+            self._shed(result, priority, err.reason)
+        except MessageExpired as err:
+            self._expired(result, err.reason)
+
+        result.latency = round(time.monotonic() - start, 3)
+        return result
+
+    def _suppressed(self, result: SendResult) -> SendResult:
+        """Mark a message to a suppressed number as not sent."""
+        _LOGGER.info(
+            "Not sending to %s: number is on the suppression list", result.target
+        )
+        self._count("suppressed")
+        result.status = "suppressed"
+        return result
+
+    def _expired(self, result: SendResult, reason: str) -> None:
+        """Record a message dropped because its deadline passed."""
+        _LOGGER.info("Not sending to %s: %s", result.target, reason)
+        self._count("expired")
+        result.status = "expired"
+        result.error = reason
+
+    async def _send_in_order(
+        self,
+        message: Union[str, SmsBody],
+        target: str,
+        sender_id: str,
+        result: SendResult,
+        priority: str = PRIORITY_NORMAL,
+        contacts: Optional[List[str]] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """Send one message after earlier messages in its conversation.
+
+        The message takes its place in the conversation before it waits for
+        admission, which starts higher priorities first; otherwise a later
+        urgent message could pass an earlier one to the same recipient.
+        """
+        ordering = self._entry_data("ordering")
+        if ordering is None:
+            await self._send_admitted(
+                message, target, sender_id, result, priority, contacts, deadline
+            )
+            return
+        key = (sender_id, normalize_number(target) or target)
+        async with before_deadline(ordering.hold(key), deadline, EXPIRED_QUEUED):
+            await self._send_admitted(
+                message, target, sender_id, result, priority, contacts, deadline
+            )
+
+    async def _send_admitted(
+        self,
+        message: Union[str, SmsBody],
+        target: str,
+        sender_id: str,
+        result: SendResult,
+        priority: str = PRIORITY_NORMAL,
+        contacts: Optional[List[str]] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """Send one message once admission control lets it start."""
+        admission = self._entry_data("admission")
+        if admission is None:
+            await self._send_sms_now(
+                message, target, sender_id, result, contacts, deadline
+            )
+            return
+        async with before_deadline(admission.admit(priority), deadline, EXPIRED_QUEUED):
+            await self._send_sms_now(
+                message, target, sender_id, result, contacts, deadline
+            )
+
+    def _shed(self, result: SendResult, priority: str, reason: str) -> None:
+        """Record a message shed by admission control."""
+        _LOGGER.debug("Shed message to %s (%s, %s)", result.target, priority, reason)
+        self._count("shed")
+        result.status = "shed"
+        result.error = reason
+        self.hass.bus.async_fire(
+            EVENT_MESSAGE_SHED,
+            {
+                "entry_id": self.oauth_manager.config_entry.entry_id,
+                "target": result.target,
+                "sender_id": result.sender_id,
+                "priority": priority,
+                "reason": reason,
+                "idempotency_key": result.idempotency_key,
+            },
+        )
+
+    async def _send_sms_now(
+        self,
+        message: Union[str, SmsBody],
+        target: str,
+        sender_id: str,
+        result: SendResult,
+        contacts: Optional[List[str]] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """Send one message without waiting for its conversation."""
+        pools = self._entry_data("pools")
+        pool = pools.get(sender_id) if pools else None
+        if pool is None:
+            sent = await self._post_sms(
+                message, target, sender_id, result, None, contacts, deadline
+            )
+        else:
+            # Send from the pool number with the most headroom for this recipient
+            number = result.sender_id = pool.select(target)
+            async with before_deadline(pool.slot(number), deadline, EXPIRED_QUEUED):
+                sent = await self._post_sms(
+                    message, target, number, result, pool, contacts, deadline
+                )
+
+        result.status = "sent" if sent else "failed"
+        self._count(result.status)
+        if sent:
+            self._record_usage(message, result.sender_id, len(contacts or [target]))
+
+    def _record_usage(
+        self, message: Union[str, SmsBody], sender_id: str, recipients: int = 1
+    ) -> None:
+        """Count a sent message and its segments; dry runs cost nothing."""
+        usage = self._entry_data("usage")
+        dry_run = self._entry_data("dry_run")
+        if usage is None or (dry_run is not None and dry_run.active):
+            return
+        segments = (
+            message.segments if isinstance(message, SmsBody) else sms_segments(message)
+        )
+        usage.record(sender_id, segments, recipients)
+
+    async def _post_sms(
+        self,
+        message: Union[str, SmsBody],
+        target: str,
+        sender_id: str,
+        result: SendResult,
+        pool: Optional[SenderPool] = None,
+        contacts: Optional[List[str]] = None,
+        deadline: Optional[float] = None,
+    ) -> bool:
+        """POST the message, retrying on expired tokens, rate limits and errors.
+
+        Attempts, the GoTo message ID and the last error are noted on result.
+        The request body is encoded once and the same bytes are sent on every
+        attempt. contacts, if given, replace target as the recipients.
+        Raises MessageExpired rather than retry after the deadline.
+        """
         max_retries = 2
         retry_count = 0
 
+        # Prepare the SMS payload according to GoTo Connect API specification
+        body = as_body(message)
+        payload = sms_payload(sender_id, contacts or target, body)
+        url = f"{GOTO_API_BASE_URL}{SMS_ENDPOINT}"
+
+        budget = self._entry_data("retry_budget")
+        if budget is not None:
+            budget.record_request()
+
         while retry_count <= max_retries:
+            if retry_count:
+                check_deadline(deadline, EXPIRED_BEFORE_RETRY)
             try:
                 _LOGGER.debug(
                     "Attempting to get authentication headers (attempt %d/%d)",
@@ -151,96 +672,107 @@ class GoToSMSNotificationService(BaseNotificationService):
                     _LOGGER.error(
                         "Please check your Home Assistant UI for re-authentication prompts"
                     )
-                    return
-
-                # Prepare the SMS payload according to GoTo Connect API specification
-                payload = {
-                    "ownerPhoneNumber": sender_id,  # The GoTo phone number to send from
-                    "contactPhoneNumbers": [target],  # List of phone numbers to send to
-                    "body": message,  # The message content
-                }
-
-                url = f"{GOTO_API_BASE_URL}{SMS_ENDPOINT}"
+                    result.error = "no valid authentication"
+                    return False
+                headers = {**headers, IDEMPOTENCY_HEADER: result.idempotency_key}
 
                 _LOGGER.info(
                     "Sending SMS to %s: %s",
                     target,
-                    message[:50] + "..." if len(message) > 50 else message,
+                    body.text[:50] + "..." if len(body.text) > 50 else body.text,
                 )
 
-                # Use Home Assistant's async HTTP client
-                from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
-                session = async_get_clientsession(self.hass)
-
-                async with session.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=30,
-                ) as response:
-                    if response.status in [200, 201]:
-                        _LOGGER.info("SMS sent successfully to %s", target)
-                        return  # Success, exit the retry loop
-
-                    elif response.status == 401:
-                        _LOGGER.warning(
-                            "Authentication failed (attempt %d/%d). Token may be expired.",
-                            retry_count + 1,
-                            max_retries + 1,
-                        )
+                result.attempts += 1
+                status, response_text = await self._async_post(
+                    url, headers, payload, deadline
+                )
 
-                        if retry_count < max_retries:
-                            _LOGGER.info("Attempting to refresh tokens and retry...")
-                            if await self.oauth_manager.refresh_tokens():
-                                _LOGGER.info(
-                                    "Token refresh successful, retrying SMS send..."
-                                )
-                                retry_count += 1
-                                continue  # Retry with fresh tokens
-                            else:
-                                _LOGGER.error("Token refresh failed")
-                                break  # Don't retry if refresh failed
-                        else:
-                            _LOGGER.error("All authentication attempts failed")
-                            _LOGGER.error(
-                                "Re-authentication has been triggered automatically"
-                            )
-                            return
+                if status in [200, 201]:
+                    _LOGGER.info("SMS sent successfully to %s", target)
+                    result.error = None
+                    result.message_id = self._record_outbound(
+                        response_text, target, sender_id, result.idempotency_key
+                    )
+                    return True  # Success, exit the retry loop
+
+                elif status == 401:
+                    result.error = "authentication failed"
+                    _LOGGER.warning(
+                        "Authentication failed (attempt %d/%d). Token may be expired.",
+                        retry_count + 1,
+                        max_retries + 1,
+                    )
 
-                    elif response.status == 429:  # Rate limited
-                        _LOGGER.warning(
-                            "Rate limited by GoTo API (attempt %d/%d)",
-                            retry_count + 1,
-                            max_retries + 1,
+                    if retry_count < max_retries:
+                        _LOGGER.info("Attempting to refresh tokens and retry...")
+                        # Sends rejected with the same token share one refresh
+                        # and one retry from the budget
+                        refreshed = await self.oauth_manager.async_refresh_rejected(
+                            headers.get("Authorization", "")
                         )
-                        if retry_count < max_retries:
-                            import asyncio
-
-                            wait_time = 2 ** (
-                                retry_count + 1
-                            )  # Exponential backoff: 2s, 4s
+                        if refreshed is None:
+                            return self._retry_skipped(target)
+                        if refreshed:
                             _LOGGER.info(
-                                "Waiting %d seconds before retry...", wait_time
+                                "Token refresh successful, retrying SMS send..."
                             )
-                            await asyncio.sleep(wait_time)
                             retry_count += 1
-                            continue
+                            continue  # Retry with fresh tokens
                         else:
-                            _LOGGER.error("Rate limit exceeded after all retries")
-                            return
-
+                            _LOGGER.error("Token refresh failed")
+                            break  # Don't retry if refresh failed
                     else:
-                        response_text = await response.text()
+                        _LOGGER.error("All authentication attempts failed")
                         _LOGGER.error(
-                            "Failed to send SMS. Status: %d, Response: %s",
-                            response.status,
-                            response_text,
+                            "Re-authentication has been triggered automatically"
                         )
-                        # For other errors, don't retry unless it's a network issue
-                        break
+                        return False
+
+                elif status == 429:  # Rate limited
+                    result.error = "rate limited"
+                    _LOGGER.warning(
+                        "Rate limited by GoTo API (attempt %d/%d)",
+                        retry_count + 1,
+                        max_retries + 1,
+                    )
+                    self._count("throttled")
+                    if pool is not None:
+                        pool.throttled(sender_id)
+                    if retry_count < max_retries:
+                        if not self._retry_allowed(target):
+                            return False
+                        import asyncio
+
+                        wait_time = 2 ** (
+                            retry_count + 1
+                        )  # Exponential backoff: 2s, 4s
+                        check_deadline(deadline, EXPIRED_BEFORE_RETRY, wait_time)
+                        _LOGGER.info("Waiting %d seconds before retry...", wait_time)
+                        await asyncio.sleep(wait_time)
+                        retry_count += 1
+                        continue
+                    else:
+                        _LOGGER.error("Rate limit exceeded after all retries")
+                        return False
 
+                else:
+                    result.error = f"HTTP {status}"
+                    _LOGGER.error(
+                        "Failed to send SMS. Status: %d, Response: %s",
+                        status,
+                        response_text,
+                    )
+                    # For other errors, don't retry unless it's a network issue
+                    break
+
+            except MessageExpired as err:
+                if err.reason == EXPIRED_QUEUED:
+                    # Expired waiting for the concurrency limit, before the POST
+                    result.attempts -= 1
+                raise
             except Exception as e:
+                result.error = str(e) or type(e).__name__
+                self._count("network_errors")
                 _LOGGER.error(
                     "Network error while sending SMS (attempt %d/%d): %s",
                     retry_count + 1,
@@ -248,15 +780,89 @@ class GoToSMSNotificationService(BaseNotificationService):
                     e,
                 )
                 if retry_count < max_retries:
+                    if not self._retry_allowed(target):
+                        return False
                     import asyncio
 
                     wait_time = 2 ** (retry_count + 1)  # Exponential backoff
+                    check_deadline(deadline, EXPIRED_BEFORE_RETRY, wait_time)
                     _LOGGER.info("Waiting %d seconds before retry...", wait_time)
                     await asyncio.sleep(wait_time)
                     retry_count += 1
                     continue
                 else:
                     _LOGGER.error("Network error persisted after all retries")
-                    return
+                    return False
 
         _LOGGER.error("Failed to send SMS after all retry attempts")
+        return False
+
+    def _retry_allowed(self, target: str) -> bool:
+        """Spend the entry's shared retry budget on one retry if any is left."""
+        budget = self._entry_data("retry_budget")
+        if budget is None or budget.try_retry():
+            return True
+        return self._retry_skipped(target)
+
+    def _retry_skipped(self, target: str) -> bool:
+        """Count a retry the budget did not allow; always returns False."""
+        self._count("retries_skipped")
+        _LOGGER.warning("Retry budget exhausted, not retrying SMS to %s", target)
+        return False
+
+    async def _async_post(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: bytes,
+        deadline: Optional[float] = None,
+    ) -> Tuple[int, str]:
+        """POST once within the adaptive concurrency limit."""
+        limiter = self._entry_data("limiter")
+        if limiter is None:
+            self._count("attempts")
+            return await self._async_post_once(url, headers, payload)
+
+        async with before_deadline(limiter.slot(), deadline, EXPIRED_QUEUED) as sample:
+            self._count("attempts")
+            status, response_text = await self._async_post_once(url, headers, payload)
+            sample.record_status(status)
+            return status, response_text
+
+    async def _async_post_once(
+        self, url: str, headers: Dict[str, str], payload: bytes
+    ) -> Tuple[int, str]:
+        """POST to the GoTo API, or to the dry-run sink when one is active."""
+        dry_run = self._entry_data("dry_run")
+        if dry_run is not None and dry_run.active:
+            return await dry_run.post(headers, payload)
+
+        # Use Home Assistant's async HTTP client
+        session = async_get_clientsession(self.hass)
+        async with session.post(
+            url, headers=headers, data=payload, timeout=30
+        ) as response:
+            return response.status, await response.text()
+
+    def _record_outbound(
+        self,
+        response_text: str,
+        target: str,
+        sender_id: str,
+        idempotency_key: Optional[str] = None,
+    ) -> Optional[str]:
+        """Remember an accepted message so delivery receipts can be matched.
+
+        Returns the GoTo message ID parsed from the response, if any.
+        """
+        try:
+            result = json_loads(response_text)
+        except ValueError as e:
+            _LOGGER.debug("Could not parse send response: %s", e)
+            return None
+
+        message_id = result.get("id") if isinstance(result, dict) else None
+        records = self._entry_data("outbound")
+        if message_id and records is not None:
+            records.add(message_id, target, sender_id, idempotency_key)
+        return message_id
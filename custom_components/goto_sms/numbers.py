@@ -0,0 +1,168 @@
+"""Discovery and caching of the account's SMS-capable phone numbers."""
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, FrozenSet, Optional, Set
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DOMAIN,
+    GOTO_API_BASE_URL,
+    PHONE_NUMBERS_ENDPOINT,
+    SENDER_NUMBERS_TTL,
+    SIGNAL_SENDERS_UPDATED,
+)
+from .groups import normalize_number
+from .oauth import GoToOAuth2Manager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_phone_numbers(data: Any) -> Set[str]:
+    """Return the SMS-capable E.164 numbers from a phone-numbers response."""
+    items = data.get("items", []) if isinstance(data, dict) else data
+    numbers: Set[str] = set()
+    for item in items if isinstance(items, list) else []:
+        if isinstance(item, dict):
+            if item.get("smsEnabled") is False:
+                continue
+            value = item.get("number") or item.get("phoneNumber") or ""
+        else:
+            value = str(item)
+        number = normalize_number(value)
+        if number is not None:
+            numbers.add(number)
+    return numbers
+
+
+class SenderNumbers:
+    """Cached set of the numbers this account can send SMS from.
+
+    The list is fetched at setup and then refreshed in the background once
+    per TTL; sends only ever read the cached set, so the lookup runs at most
+    once per TTL however many messages are sent. Until the first fetch
+    returns at least one number nothing is known and validation is skipped
+    rather than guessed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        oauth_manager: GoToOAuth2Manager,
+        ttl: float = SENDER_NUMBERS_TTL,
+    ) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.oauth_manager = oauth_manager
+        self.ttl = ttl
+        self.numbers: FrozenSet[str] = frozenset()
+        self.fetched_at: Optional[float] = None
+        self.fetches = 0
+        self._refresh: Optional[asyncio.Task] = None
+        self._unsub: Optional[Callable[[], None]] = None
+
+    @property
+    def known(self) -> bool:
+        """Return True once the numbers have been fetched."""
+        return self.fetched_at is not None
+
+    def is_valid(self, sender_id: str) -> Optional[bool]:
+        """Return whether sender_id is an account number, or None if unknown."""
+        if not self.known:
+            return None
+        return (normalize_number(sender_id) or sender_id) in self.numbers
+
+    @property
+    def default(self) -> Optional[str]:
+        """Return the only account number, if there is exactly one."""
+        if len(self.numbers) == 1:
+            return next(iter(self.numbers))
+        return None
+
+    def async_start(self) -> None:
+        """Fetch now without blocking setup, then once per TTL."""
+        self.async_request_refresh()
+        self._unsub = async_track_time_interval(
+            self.hass,
+            lambda _now: self.async_request_refresh(),
+            timedelta(seconds=self.ttl),
+        )
+
+    def async_stop(self) -> None:
+        """Stop refreshing."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        if self._refresh is not None:
+            self._refresh.cancel()
+
+    def async_request_refresh(self) -> asyncio.Task:
+        """Start a background refresh unless one is already running."""
+        if self._refresh is None or self._refresh.done():
+            self._refresh = self.hass.async_create_background_task(
+                self._async_fetch(), f"{DOMAIN} sender number refresh"
+            )
+        return self._refresh
+
+    async def _async_fetch(self) -> None:
+        """Fetch the account's numbers, keeping the old set on failure."""
+        self.fetches += 1
+        try:
+            headers = await self.oauth_manager.get_headers()
+            if not headers:
+                _LOGGER.debug("No valid tokens, not fetching sender numbers")
+                return
+            session = async_get_clientsession(self.hass)
+            async with session.get(
+                f"{GOTO_API_BASE_URL}{PHONE_NUMBERS_ENDPOINT}",
+                headers=headers,
+                timeout=30,
+            ) as response:
+                if response.status != 200:
+                    _LOGGER.warning(
+                        "Could not list GoTo phone numbers (HTTP %d); "
+                        "sender_id will not be validated locally",
+                        response.status,
+                    )
+                    return
+                data = await response.json()
+        except Exception as e:
+            _LOGGER.warning("Could not list GoTo phone numbers: %s", e)
+            return
+
+        numbers = parse_phone_numbers(data)
+        if not numbers:
+            # An account always has a number; an empty result means the
+            # response was not understood, and rejecting every sender_id on
+            # that basis would be worse than not checking
+            _LOGGER.warning(
+                "GoTo listed no SMS-capable phone numbers or the response was "
+                "not understood; sender_id will not be validated locally"
+            )
+            return
+
+        self.numbers = frozenset(numbers)
+        self.fetched_at = time.monotonic()
+        _LOGGER.debug("Discovered %d SMS-capable GoTo numbers", len(self.numbers))
+        if self.oauth_manager.config_entry is not None:
+            async_dispatcher_send(
+                self.hass,
+                SIGNAL_SENDERS_UPDATED.format(self.oauth_manager.config_entry.entry_id),
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the cache state for metrics."""
+        age = None
+        if self.fetched_at is not None:
+            age = round(time.monotonic() - self.fetched_at)
+        return {
+            "sender_numbers": len(self.numbers),
+            "sender_numbers_age": age,
+            "sender_number_fetches": self.fetches,
+        }
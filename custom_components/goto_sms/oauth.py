@@ -1,5 +1,6 @@
 """OAuth2 token management for GoTo SMS integration."""
 
+import asyncio
 import json
 import logging
 import os
@@ -26,6 +27,7 @@ from .const import (
     OAUTH2_SCOPE,
     OAUTH2_TOKEN_URL,
 )
+from .retrybudget import RetryBudget
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,6 +55,9 @@ class GoToOAuth2Manager:
             scope=OAUTH2_SCOPE,
         )
         self._tokens = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+        # True if GoTo turned down the last refresh, rather than not answering
+        self.refresh_rejected = False
 
     async def load_tokens(self) -> bool:
         """Load tokens from config entry."""
@@ -83,10 +88,8 @@ class GoToOAuth2Manager:
             if not self._validate_tokens():
                 _LOGGER.warning("Invalid or expired tokens found")
                 _LOGGER.warning("Attempting to refresh tokens...")
-                if not await self.refresh_tokens():
-                    _LOGGER.error(
-                        "Failed to refresh tokens. Re-authentication required."
-                    )
+                if not await self.async_refresh_shared():
+                    _LOGGER.error("Failed to refresh expired tokens")
                     return False
                 return True
 
@@ -316,10 +319,16 @@ class GoToOAuth2Manager:
         max_retries = 3
         retry_count = 0
 
+        self.refresh_rejected = False
+        budget = self._retry_budget()
+        if budget is not None:
+            budget.record_request()
+
         while retry_count < max_retries:
             try:
                 if CONF_REFRESH_TOKEN not in self._tokens:
                     _LOGGER.error("No refresh token available")
+                    self.refresh_rejected = True
                     return False
 
                 import base64
@@ -395,11 +404,14 @@ class GoToOAuth2Manager:
                         # If it's a 401 or 400, the refresh token might be invalid
                         if response.status in [401, 400]:
                             _LOGGER.error("Refresh token appears to be invalid")
+                            self.refresh_rejected = True
                             break
 
                         # For other errors, retry after a short delay
                         retry_count += 1
                         if retry_count < max_retries:
+                            if not self._retry_allowed():
+                                return False
                             import asyncio
 
                             await asyncio.sleep(
@@ -412,15 +424,73 @@ class GoToOAuth2Manager:
                 )
                 retry_count += 1
                 if retry_count < max_retries:
+                    if not self._retry_allowed():
+                        return False
                     import asyncio
 
                     await asyncio.sleep(2**retry_count)  # Exponential backoff
 
-        # If we get here, all retries failed
-        _LOGGER.error("All token refresh attempts failed, triggering re-authentication")
+        if not self.refresh_rejected:
+            # GoTo could not be reached; the refresh token may still be good
+            _LOGGER.error("All token refresh attempts failed - will retry later")
+            return False
+
+        _LOGGER.error("Token refresh rejected, triggering re-authentication")
         self._trigger_reauth()
         return False
 
+    async def async_refresh_shared(self) -> bool:
+        """Refresh tokens, joining a refresh that is already in flight.
+
+        Startup warm-up, sender number discovery and the first sends all
+        find the same expired token; only one of them should refresh it.
+        """
+        if self._refresh_task is None:
+            self._refresh_task = self.hass.async_create_task(self.refresh_tokens())
+            self._refresh_task.add_done_callback(self._refresh_done)
+        return await asyncio.shield(self._refresh_task)
+
+    async def async_refresh_rejected(self, authorization: str) -> Optional[bool]:
+        """Replace a token GoTo rejected, once for every send that used it.
+
+        Sends in flight with the same token all get a 401. The first starts a
+        shared refresh and spends one retry from the budget, the others join
+        it, and those whose 401 arrives after it finished retry with the new
+        token. Returns None if the budget did not allow a refresh.
+        """
+        if authorization != f"Bearer {self._tokens.get(CONF_ACCESS_TOKEN)}":
+            return True
+        if self._refresh_task is None:
+            if self.refresh_rejected:
+                # GoTo already refused the refresh token; wait for re-auth
+                return False
+            if not self._retry_allowed():
+                return None
+        return await self.async_refresh_shared()
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        """Forget a finished shared refresh."""
+        if self._refresh_task is task:
+            self._refresh_task = None
+
+    def _retry_budget(self) -> Optional[RetryBudget]:
+        """Return the retry budget shared with the entry's sends."""
+        if self.config_entry is None:
+            return None
+        return self.hass.data.get(DOMAIN, {}).get(
+            f"{self.config_entry.entry_id}_retry_budget"
+        )
+
+    def _retry_allowed(self) -> bool:
+        """Spend retry budget on one refresh retry if any is left."""
+        budget = self._retry_budget()
+        if budget is None or budget.try_retry():
+            return True
+        # An exhausted budget means the API is struggling, not that the
+        # refresh token is bad, so do not ask the user to re-authenticate
+        _LOGGER.warning("Retry budget exhausted, not retrying token refresh")
+        return False
+
     async def get_valid_token(self) -> Optional[str]:
         """Get a valid access token, refreshing if necessary."""
         _LOGGER.debug("get_valid_token() called")
@@ -440,9 +510,9 @@ class GoToOAuth2Manager:
         # Check if tokens need refresh
         if not self._validate_tokens():
             _LOGGER.info("Token validation failed, attempting refresh")
-            if not await self.refresh_tokens():
+            if not await self.async_refresh_shared():
                 _LOGGER.error("Failed to refresh tokens")
-                # Re-authentication has already been triggered in refresh_tokens
+                # refresh_tokens triggered re-authentication if GoTo rejected it
                 return None
 
         token = self._tokens.get(CONF_ACCESS_TOKEN)
@@ -0,0 +1,64 @@
+"""Per-conversation ordering for concurrent sends."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Hashable
+
+
+class _KeyState:
+    """Lock and user count for one active key."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        """Initialize the key state."""
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class KeyedSerializer:
+    """Run work for the same key strictly in arrival order.
+
+    Work for different keys is not serialized at all. A key's state exists
+    only while something holds or waits for it, so memory is bounded by the
+    number of conversations in flight rather than every conversation seen.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the serializer."""
+        self._keys: Dict[Hashable, _KeyState] = {}
+        self.max_waiting = 0
+
+    @asynccontextmanager
+    async def hold(self, key: Hashable) -> AsyncIterator[None]:
+        """Wait for earlier work on key to finish, then hold the key.
+
+        Arrival order is the order in which callers reach this point, so it
+        must be entered before the caller's first await.
+        """
+        state = self._keys.get(key)
+        if state is None:
+            state = self._keys[key] = _KeyState()
+        state.users += 1
+        self.max_waiting = max(self.max_waiting, state.users - 1)
+        try:
+            # asyncio.Lock wakes waiters in FIFO order and does not let a new
+            # caller overtake a waiter that has already been woken
+            async with state.lock:
+                yield
+        finally:
+            state.users -= 1
+            if not state.users:
+                del self._keys[key]
+
+    def __len__(self) -> int:
+        """Return the number of keys currently held or waited on."""
+        return len(self._keys)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the serializer state for metrics."""
+        return {
+            "active_conversations": len(self._keys),
+            "queued_in_order": sum(s.users - 1 for s in self._keys.values()),
+            "max_queued_per_conversation": self.max_waiting,
+        }
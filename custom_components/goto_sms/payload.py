@@ -0,0 +1,95 @@
+"""Pre-serialized request bodies for the GoTo messaging API."""
+
+import re
+from typing import Sequence, Union
+
+from homeassistant.helpers.json import json_bytes
+
+try:
+    from orjson import Fragment
+except ImportError:  # orjson before 3.9
+    Fragment = None
+
+# GSM 03.38 basic character set; anything else forces UCS-2 encoding
+_GSM7_BASIC = (
+    "@£$¥èéùìòÇ\nØø\rÅåΔ_ΦΓΛΩΠΨΣΘΞÆæßÉ !\"#¤%&'()*+,-./0123456789:;<=>?"
+    "¡ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§¿abcdefghijklmnopqrstuvwxyzäöñüà"
+)
+# Extension table characters take two septets (an escape and the character)
+_GSM7_EXTENDED = "^{}\\[~]|€\f"
+_NOT_GSM7 = re.compile(f"[^{re.escape(_GSM7_BASIC + _GSM7_EXTENDED)}]")
+
+
+def sms_segments(text: str) -> int:
+    """Return the number of SMS segments text is billed as.
+
+    GSM-7 messages fit 160 septets in one segment and 153 per segment when
+    concatenated; anything else is sent as UCS-2 with 70 and 67 UTF-16 code
+    units.
+    """
+    if _NOT_GSM7.search(text) is None:
+        units = len(text) + sum(text.count(char) for char in _GSM7_EXTENDED)
+        single, multi = 160, 153
+    else:
+        units = len(text.encode("utf-16-le")) // 2
+        single, multi = 70, 67
+    if units <= single:
+        return 1
+    return -(-units // multi)
+
+
+class SmsBody:
+    """A message body JSON-encoded once and shared by every recipient.
+
+    Encoding uses Home Assistant's orjson-backed json_bytes. The encoded
+    text is embedded in each recipient's payload as a pre-serialized
+    fragment, so fan-out and retries never re-escape the body. The
+    segment count used for usage tracking is computed once here too.
+    """
+
+    __slots__ = ("text", "json", "fragment", "segments")
+
+    def __init__(self, text: str) -> None:
+        """Encode the message text."""
+        self.text = text
+        self.json = json_bytes(text)
+        self.fragment = Fragment(self.json) if Fragment is not None else None
+        self.segments = sms_segments(text)
+
+    def __str__(self) -> str:
+        """Return the message text."""
+        return self.text
+
+
+def as_body(message: Union[str, SmsBody]) -> SmsBody:
+    """Return message as an SmsBody, encoding it if needed."""
+    return message if isinstance(message, SmsBody) else SmsBody(message)
+
+
+def sms_payload(
+    sender_id: str, target: Union[str, Sequence[str]], body: SmsBody
+) -> bytes:
+    """Return the JSON request body sending body from sender_id to target.
+
+    target is one number, or several for a group conversation.
+    """
+    contacts = [target] if isinstance(target, str) else list(target)
+    if body.fragment is not None:
+        return json_bytes(
+            {
+                "ownerPhoneNumber": sender_id,
+                "contactPhoneNumbers": contacts,
+                "body": body.fragment,
+            }
+        )
+    return b"".join(
+        (
+            b'{"ownerPhoneNumber":',
+            json_bytes(sender_id),
+            b',"contactPhoneNumbers":',
+            json_bytes(contacts),
+            b',"body":',
+            body.json,
+            b"}",
+        )
+    )
@@ -0,0 +1,95 @@
+"""Sender number pools for the GoTo SMS integration."""
+
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List
+
+from .const import MAX_STICKY_RECIPIENTS
+from .groups import normalize_number, parse_groups
+from .ratelimit import TokenBucket
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SenderPool:
+    """Spreads messages across several GoTo numbers.
+
+    Each number has its own rate limiter. New recipients go to the number
+    with the most limiter headroom, and stay on it afterwards so a
+    conversation is not split across numbers.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        numbers: List[str],
+        rate: float,
+        burst: float = 1.0,
+        max_sticky: int = MAX_STICKY_RECIPIENTS,
+    ) -> None:
+        """Initialize the pool."""
+        if not numbers:
+            raise ValueError(f"Sender pool {name} has no numbers")
+        self.name = name
+        self.numbers = list(numbers)
+        self._limiters = {number: TokenBucket(rate, burst) for number in numbers}
+        self._in_flight = dict.fromkeys(numbers, 0)
+        self._sticky: "OrderedDict[str, str]" = OrderedDict()
+        self._max_sticky = max_sticky
+
+    def select(self, recipient: str) -> str:
+        """Return the number to send to a recipient from."""
+        number = self._sticky.get(recipient)
+        if number is not None:
+            self._sticky.move_to_end(recipient)
+            return number
+
+        number = max(
+            self.numbers,
+            key=lambda n: self._limiters[n].headroom - self._in_flight[n],
+        )
+        self._sticky[recipient] = number
+        if len(self._sticky) > self._max_sticky:
+            self._sticky.popitem(last=False)
+        return number
+
+    @asynccontextmanager
+    async def slot(self, number: str) -> AsyncIterator[None]:
+        """Wait for the number's rate limiter and count the send as in flight."""
+        self._in_flight[number] += 1
+        try:
+            await self._limiters[number].acquire()
+            yield
+        finally:
+            self._in_flight[number] -= 1
+
+    def throttled(self, number: str) -> None:
+        """Back off a number the API reported as rate limited."""
+        _LOGGER.debug("Sender %s in pool %s was rate limited", number, self.name)
+        self._limiters[number].drain()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return per-number load for diagnostics."""
+        return {
+            number: {
+                "in_flight": self._in_flight[number],
+                "headroom": round(self._limiters[number].headroom, 2),
+            }
+            for number in self.numbers
+        }
+
+
+def build_sender_pools(text: str, rate: float, burst: float) -> Dict[str, SenderPool]:
+    """Build sender pools from ``name: number, number`` lines."""
+    pools = {}
+    for name, members in parse_groups(text).items():
+        numbers = []
+        for member in members:
+            number = normalize_number(member)
+            if number is None:
+                raise ValueError(f"Sender pool {name}: invalid number {member}")
+            if number not in numbers:
+                numbers.append(number)
+        pools[name] = SenderPool(name, numbers, rate, burst)
+    return pools
@@ -0,0 +1,174 @@
+"""On-demand sampling profiler for the integration's code."""
+
+import asyncio
+import logging
+import os
+import signal
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from types import FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import PROFILE_TOP_FUNCTIONS
+
+_LOGGER = logging.getLogger(__name__)
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+Stack = Tuple[str, ...]
+
+
+def _frame_label(frame: FrameType) -> str:
+    """Return a short file:function label for a frame."""
+    code = frame.f_code
+    path = code.co_filename
+    if path.startswith(_PACKAGE_DIR):
+        name = f"goto_sms/{os.path.basename(path)}"
+    else:
+        name = "/".join(path.replace("\\", "/").rsplit("/", 2)[-2:])
+    return f"{name}:{code.co_qualname}"
+
+
+def integration_stack(frame: Optional[FrameType]) -> Optional[Stack]:
+    """Return the stack from the outermost integration frame, if any.
+
+    Frames below the integration (the event loop, asyncio) are dropped;
+    library frames called from the integration are kept, since their cost
+    is the integration's.
+    """
+    frames: List[FrameType] = []
+    outermost = -1
+    while frame is not None:
+        if frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+            outermost = len(frames)
+        frames.append(frame)
+        frame = frame.f_back
+    if outermost < 0:
+        return None
+    return tuple(_frame_label(f) for f in reversed(frames[: outermost + 1]))
+
+
+class SamplingProfiler:
+    """Samples the event loop's stack while a profile is running.
+
+    A SIGPROF interval timer interrupts the process every interval of CPU
+    time, and the handler, which runs on the event loop thread, counts the
+    interrupted stack if it passes through integration code. Unlike a
+    sampling thread this sees pure-Python code too, not just the points
+    where the loop releases the GIL. Nothing is installed when no profile
+    runs, so the profiler costs nothing until the profile service is called.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the profiler."""
+        self.hass = hass
+        self._stopped: Optional[asyncio.Event] = None
+
+    @property
+    def running(self) -> bool:
+        """Return True while a profile is being captured."""
+        return self._stopped is not None
+
+    async def async_profile(self, duration: float, interval: float) -> Dict[str, Any]:
+        """Profile for duration seconds, sampling every interval ms of CPU time.
+
+        Writes the samples as collapsed stacks (one `frame;frame;frame count`
+        line per stack, the input format of flamegraph tools) to the config
+        dir and returns a summary with the top integration functions.
+        """
+        if self.running:
+            raise HomeAssistantError("A profile is already running")
+        if threading.current_thread() is not threading.main_thread():
+            raise HomeAssistantError(
+                "Profiling needs the event loop in the main thread"
+            )
+
+        stacks: Counter = Counter()
+        totals = {"samples": 0}
+
+        def sample(signum: int, frame: Optional[FrameType]) -> None:
+            """Count the interrupted stack."""
+            totals["samples"] += 1
+            stack = integration_stack(frame)
+            if stack is not None:
+                stacks[stack] += 1
+
+        stopped = self._stopped = asyncio.Event()
+        previous = signal.signal(signal.SIGPROF, sample)
+        signal.setitimer(signal.ITIMER_PROF, interval / 1000, interval / 1000)
+        _LOGGER.info("Profiling goto_sms for %ss", duration)
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(stopped.wait(), duration)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous)
+            self._stopped = None
+        elapsed = time.monotonic() - started
+
+        path = self.hass.config.path(
+            f"goto_sms_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.collapsed"
+        )
+        await self.hass.async_add_executor_job(_write_collapsed, path, stacks)
+        summary = _summarize(stacks, totals["samples"])
+        summary.update(file=path, duration=round(elapsed, 3), interval=interval)
+        _LOGGER.info(
+            "Profile written to %s: %d of %d samples in goto_sms",
+            path,
+            summary["integration_samples"],
+            summary["samples"],
+        )
+        return summary
+
+    def stop(self) -> None:
+        """Stop a running profile early; what was sampled is still written."""
+        if self._stopped is not None:
+            self._stopped.set()
+
+
+def _write_collapsed(path: str, stacks: Counter) -> None:
+    """Write stacks in collapsed format (runs in the executor)."""
+    with open(path, "w", encoding="utf-8") as handle:
+        for stack, count in stacks.most_common():
+            handle.write(f"{';'.join(stack)} {count}\n")
+
+
+def _summarize(stacks: Counter, samples: int) -> Dict[str, Any]:
+    """Return the sample counts and the top integration functions.
+
+    A function's own samples are those where it was the innermost
+    integration frame, including time in libraries it called; its total
+    samples are those where it was anywhere on the stack.
+    """
+    own: Counter = Counter()
+    total: Counter = Counter()
+    for stack, count in stacks.items():
+        ours = [label for label in stack if label.startswith("goto_sms/")]
+        own[ours[-1]] += count
+        for label in set(ours):
+            total[label] += count
+
+    integration_samples = sum(stacks.values())
+    return {
+        "samples": samples,
+        "integration_samples": integration_samples,
+        "top": [
+            {
+                "function": label,
+                "own_samples": count,
+                "own_percent": round(100 * count / samples, 1) if samples else 0,
+                "total_samples": total[label],
+                "total_percent": (
+                    round(100 * total[label] / samples, 1) if samples else 0
+                ),
+            }
+            for label, count in own.most_common(PROFILE_TOP_FUNCTIONS)
+        ],
+    }
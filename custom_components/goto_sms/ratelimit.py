@@ -0,0 +1,82 @@
+"""Rate limiting for the GoTo SMS integration."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Optional
+
+
+class TokenBucket:
+    """Token bucket that hands out send slots in FIFO order.
+
+    Callers that find the bucket empty queue up and are woken one at a time
+    as tokens accrue. A caller cancelled while queued, e.g. because its
+    message expired, leaves the queue, so the callers behind it move up.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0) -> None:
+        """Initialize the bucket with a refill rate in tokens per second."""
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def headroom(self) -> float:
+        """Return the tokens available now; negative when callers are queued."""
+        self._refill()
+        return self._tokens - len(self._waiters)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available."""
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._schedule()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.done() and not waiter.cancelled():
+                # We were handed a token we will not use; pass it on
+                self._tokens += 1
+                self._wake()
+            raise
+
+    def _schedule(self) -> None:
+        """Wake the first waiter when the next token has accrued."""
+        if self._timer is not None or not self._waiters:
+            return
+        delay = max(0.0, (1 - self._tokens) / self.rate)
+        self._timer = asyncio.get_running_loop().call_later(delay, self._wake)
+
+    def _wake(self) -> None:
+        """Hand accrued tokens to waiters in FIFO order."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._tokens -= 1
+                waiter.set_result(None)
+        self._schedule()
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the API reports rate limiting."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
@@ -0,0 +1,123 @@
+"""Outbound message records for the GoTo SMS integration."""
+
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from .const import MAX_OUTBOUND_RECORDS
+
+# Namespace for idempotency keys derived from a caller key or a bulk row
+_IDEMPOTENCY_NAMESPACE = uuid.UUID("6f1c2b8e-4c0d-4a53-9d7e-3b1f8e2a6c55")
+
+
+def new_idempotency_key(*parts: object) -> str:
+    """Return an idempotency key for one logical message.
+
+    With parts the key is derived deterministically, so the same message
+    gets the same key after a restart; without parts it is random.
+    """
+    if not parts:
+        return uuid.uuid4().hex
+    name = "\x1f".join(str(part) for part in parts)
+    return uuid.uuid5(_IDEMPOTENCY_NAMESPACE, name).hex
+
+
+@dataclass
+class OutboundRecord:
+    """A message accepted by the GoTo API."""
+
+    message_id: str
+    target: str
+    sender_id: str
+    sent_at: float
+    status: str = "sent"
+    status_at: Optional[float] = None
+    idempotency_key: Optional[str] = None
+
+
+@dataclass
+class SendResult:
+    """The outcome of sending one message to one recipient."""
+
+    target: str
+    sender_id: str
+    idempotency_key: Optional[str] = None
+    status: str = "pending"
+    message_id: Optional[str] = None
+    attempts: int = 0
+    latency: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def sent(self) -> bool:
+        """Return True if the API accepted the message."""
+        return self.status == "sent"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the result as service response data."""
+        return asdict(self)
+
+
+def send_response(results: Iterable[SendResult]) -> Dict[str, Any]:
+    """Summarize per-recipient results as send_sms service response data."""
+    items = [result.as_dict() for result in results]
+    response: Dict[str, Any] = {
+        "sent": 0,
+        "failed": 0,
+        "suppressed": 0,
+        "shed": 0,
+        "over_budget": 0,
+        "expired": 0,
+    }
+    for item in items:
+        response[item["status"]] = response.get(item["status"], 0) + 1
+    response["results"] = items
+    return response
+
+
+class OutboundRecords:
+    """Bounded index of recently sent messages keyed by GoTo message ID."""
+
+    def __init__(self, max_records: int = MAX_OUTBOUND_RECORDS) -> None:
+        """Initialize the record index."""
+        self._max_records = max_records
+        self._records: "OrderedDict[str, OutboundRecord]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of records held."""
+        return len(self._records)
+
+    def add(
+        self,
+        message_id: str,
+        target: str,
+        sender_id: str,
+        idempotency_key: Optional[str] = None,
+    ) -> OutboundRecord:
+        """Record a message the API accepted, evicting the oldest when full."""
+        record = OutboundRecord(
+            message_id,
+            target,
+            sender_id,
+            time.time(),
+            idempotency_key=idempotency_key,
+        )
+        self._records[message_id] = record
+        self._records.move_to_end(message_id)
+        while len(self._records) > self._max_records:
+            self._records.popitem(last=False)
+        return record
+
+    def get(self, message_id: str) -> Optional[OutboundRecord]:
+        """Return the record for a message ID, if still held."""
+        return self._records.get(message_id)
+
+    def update_status(self, message_id: str, status: str) -> Optional[OutboundRecord]:
+        """Update the delivery status of a held record."""
+        record = self._records.get(message_id)
+        if record is not None:
+            record.status = status
+            record.status_at = time.time()
+        return record
@@ -0,0 +1,86 @@
+"""Retry budget shared by every retry loop of a config entry."""
+
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, List
+
+from .const import DEFAULT_RETRY_BUDGET, RETRY_BUDGET_MIN_RETRIES, RETRY_BUDGET_WINDOW
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RetryBudget:
+    """Cap retries at a percentage of first attempts over a sliding window.
+
+    Without a shared budget every layer retries independently, so a partial
+    outage multiplies request volume exactly when the API is struggling.
+    A small fixed allowance per window keeps retries available when traffic
+    is too low for the percentage to allow any.
+    """
+
+    def __init__(
+        self,
+        percent: float = DEFAULT_RETRY_BUDGET,
+        window: float = RETRY_BUDGET_WINDOW,
+        min_retries: int = RETRY_BUDGET_MIN_RETRIES,
+    ) -> None:
+        """Initialize the budget."""
+        self.percent = percent
+        self.window = window
+        self.min_retries = min_retries
+        # One [second, first attempts, retries] bucket per second of the window
+        self._buckets: Deque[List[int]] = deque()
+        self._requests = 0
+        self._retries = 0
+        self.total_retries = 0
+        self.denied = 0
+
+    def _bucket(self) -> List[int]:
+        """Expire old buckets and return the one for the current second."""
+        now = int(time.monotonic())
+        while self._buckets and self._buckets[0][0] <= now - self.window:
+            _, requests, retries = self._buckets.popleft()
+            self._requests -= requests
+            self._retries -= retries
+        if not self._buckets or self._buckets[-1][0] != now:
+            self._buckets.append([now, 0, 0])
+        return self._buckets[-1]
+
+    @property
+    def allowed(self) -> float:
+        """Return the number of retries the current window allows."""
+        return self.min_retries + self._requests * self.percent / 100
+
+    def record_request(self) -> None:
+        """Record a first attempt, which earns retry budget."""
+        self._bucket()[1] += 1
+        self._requests += 1
+
+    def try_retry(self) -> bool:
+        """Spend budget on one retry, or return False if it is exhausted."""
+        bucket = self._bucket()
+        if self._retries + 1 > self.allowed:
+            self.denied += 1
+            _LOGGER.debug(
+                "Retry budget exhausted (%d retries, %d first attempts in window)",
+                self._retries,
+                self._requests,
+            )
+            return False
+        bucket[2] += 1
+        self._retries += 1
+        self.total_retries += 1
+        return True
+
+    def stats(self) -> Dict[str, float]:
+        """Return budget consumption for metrics."""
+        self._bucket()
+        return {
+            "retry_budget_percent": self.percent,
+            "retry_budget_used": round(100 * self._retries / self.allowed, 1),
+            "retries_in_window": self._retries,
+            "first_attempts_in_window": self._requests,
+            "retries_total": self.total_retries,
+            "retries_denied": self.denied,
+        }
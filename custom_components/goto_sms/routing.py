@@ -0,0 +1,187 @@
+"""Notification routing rules for the GoTo SMS integration."""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .const import (
+    ATTR_MODE,
+    ATTR_PRIORITY,
+    ATTR_SENDER_ID,
+    ATTR_TARGET,
+    MODES,
+    PRIORITIES,
+    ROUTE_MATCH_ALL,
+)
+
+_FIELD = re.compile(r"^[A-Za-z0-9_]+$")
+_ACTIONS = (ATTR_TARGET, ATTR_SENDER_ID, ATTR_PRIORITY, ATTR_MODE)
+
+
+@dataclass(frozen=True)
+class Route:
+    """What a matching rule fills in for a notification."""
+
+    target: Optional[str] = None
+    sender_id: Optional[str] = None
+    priority: Optional[str] = None
+    mode: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One parsed routing rule: conditions on data fields and a route."""
+
+    line: int
+    conditions: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    route: Route
+
+
+def _parse_conditions(text: str, line_number: int) -> Dict[str, Tuple[str, ...]]:
+    """Parse ``field=value, field=a|b`` into {field: accepted values}."""
+    conditions: Dict[str, Tuple[str, ...]] = {}
+    if text.strip() == ROUTE_MATCH_ALL:
+        return conditions
+    for condition in text.split(","):
+        field, sep, values = condition.partition("=")
+        field = field.strip()
+        accepted = tuple(v.strip().lower() for v in values.split("|") if v.strip())
+        if not sep or not _FIELD.match(field) or not accepted:
+            raise ValueError(
+                f"Line {line_number}: expected 'field=value', got '{condition.strip()}'"
+            )
+        if field in conditions:
+            raise ValueError(f"Line {line_number}: {field} is given twice")
+        conditions[field] = accepted
+    return conditions
+
+
+def _parse_route(text: str, line_number: int) -> Route:
+    """Parse ``target: oncall; sender_id: pool; priority: high`` into a Route."""
+    actions: Dict[str, str] = {}
+    for action in text.split(";"):
+        if not action.strip():
+            continue
+        key, sep, value = action.partition(":")
+        key, value = key.strip(), value.strip()
+        if key == "sender":
+            key = ATTR_SENDER_ID
+        if not sep or key not in _ACTIONS or not value:
+            raise ValueError(
+                f"Line {line_number}: expected one of {', '.join(_ACTIONS)} "
+                f"as 'key: value', got '{action.strip()}'"
+            )
+        actions[key] = value
+
+    if actions.get(ATTR_PRIORITY, PRIORITIES[0]) not in PRIORITIES:
+        raise ValueError(f"Line {line_number}: unknown priority {actions['priority']}")
+    if actions.get(ATTR_MODE, MODES[0]) not in MODES:
+        raise ValueError(f"Line {line_number}: unknown mode {actions['mode']}")
+    if not actions:
+        raise ValueError(f"Line {line_number}: the rule does not route anything")
+    return Route(**actions)
+
+
+def parse_rules(text: str) -> List[Rule]:
+    """Parse routing rules, one ``conditions -> route`` per line."""
+    rules: List[Rule] = []
+    for line_number, line in enumerate((text or "").splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        conditions, sep, route = line.partition("->")
+        if not sep or not conditions.strip():
+            raise ValueError(f"Line {line_number}: expected 'conditions -> route'")
+        rules.append(
+            Rule(
+                line_number,
+                tuple(_parse_conditions(conditions, line_number).items()),
+                _parse_route(route, line_number),
+            )
+        )
+    return rules
+
+
+class RoutingRules:
+    """Routing rules compiled into per-field indexes.
+
+    Rules are tried in order and the first match wins. Each rule is a bit
+    in an integer mask. For every field any rule tests, the index maps each
+    accepted value to the mask of rules it satisfies, and the field keeps
+    the mask of rules that do not test it. Matching a notification ANDs one
+    looked-up mask per indexed field and takes the lowest bit left, so the
+    cost depends on the number of fields the rules use, not on the number
+    of rules.
+    """
+
+    def __init__(self, text: str = "") -> None:
+        """Compile the rules; raises ValueError if they do not parse."""
+        self.source = text
+        self._rules = parse_rules(text)
+        self.hits = [0] * len(self._rules)
+        self._all = (1 << len(self._rules)) - 1
+        self._index: Dict[str, Tuple[Dict[str, int], int]] = {}
+
+        values_by_field: Dict[str, Dict[str, int]] = {}
+        tested_by_field: Dict[str, int] = {}
+        for bit, rule in enumerate(self._rules):
+            for field, accepted in rule.conditions:
+                values = values_by_field.setdefault(field, {})
+                for value in accepted:
+                    values[value] = values.get(value, 0) | 1 << bit
+                tested_by_field[field] = tested_by_field.get(field, 0) | 1 << bit
+        for field, values in values_by_field.items():
+            untested = self._all & ~tested_by_field[field]
+            self._index[field] = (
+                {value: mask | untested for value, mask in values.items()},
+                untested,
+            )
+
+    def __len__(self) -> int:
+        """Return the number of rules."""
+        return len(self._rules)
+
+    def match(self, data: Optional[Mapping[str, Any]]) -> Optional[Route]:
+        """Return the route of the first rule the notification data matches."""
+        candidates = self._all
+        if not candidates:
+            return None
+        if not isinstance(data, Mapping):
+            data = {}
+        for field, (masks, untested) in self._index.items():
+            value = data.get(field)
+            if value is None:
+                candidates &= untested
+            else:
+                candidates &= masks.get(str(value).lower(), untested)
+            if not candidates:
+                return None
+        bit = (candidates & -candidates).bit_length() - 1
+        self.hits[bit] += 1
+        return self._rules[bit].route
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the rule count, indexed fields and matches for metrics."""
+        return {
+            "routing_rules": len(self._rules),
+            "routing_fields": len(self._index),
+            "routing_matches": sum(self.hits),
+        }
+
+    def as_dict(self) -> List[Dict[str, Any]]:
+        """Return each rule with its match count for diagnostics."""
+        return [
+            {
+                "line": rule.line,
+                "conditions": {
+                    field: list(values) for field, values in rule.conditions
+                },
+                "route": {
+                    key: value
+                    for key, value in vars(rule.route).items()
+                    if value is not None
+                },
+                "matches": hits,
+            }
+            for rule, hits in zip(self._rules, self.hits)
+        ]
@@ -0,0 +1,201 @@
+"""Sender number entities for the GoTo SMS integration.
+
+Each number the account can send from is an entity bound to the entry's
+notification service. Home Assistant 2024.5 added notify entities, and where
+they exist sender numbers are notify entities; on older versions they are
+sensors with the same last-sent timestamp state.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Set
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+
+from .const import (
+    ATTR_DEADLINE,
+    ATTR_DRY_RUN,
+    ATTR_IDEMPOTENCY_KEY,
+    ATTR_MESSAGE,
+    ATTR_MODE,
+    ATTR_PRIORITY,
+    ATTR_SENDER_ID,
+    ATTR_TARGET,
+    ATTR_TEMPLATE_DATA,
+    ATTR_TTL,
+    CONF_DEFAULT_SENDER,
+    DOMAIN,
+    MODES,
+    PRIORITIES,
+    SERVICE_SEND_MESSAGE,
+    SIGNAL_SENDERS_UPDATED,
+)
+from .groups import normalize_number
+from .numbers import SenderNumbers
+from .records import send_response
+
+try:
+    from homeassistant.components.notify import NotifyEntity
+except ImportError:  # Home Assistant before 2024.5
+    NotifyEntity = None
+
+if TYPE_CHECKING:
+    from .notify import GoToSMSNotificationService
+
+# The platform the sender number entities belong to
+SENDER_PLATFORM = Platform.SENSOR if NotifyEntity is None else Platform.NOTIFY
+
+SEND_MESSAGE_SCHEMA = {
+    vol.Required(ATTR_MESSAGE): cv.string,
+    vol.Optional(ATTR_TARGET): vol.All(cv.ensure_list_csv, [cv.string]),
+    vol.Optional(ATTR_TEMPLATE_DATA): dict,
+    vol.Optional(ATTR_IDEMPOTENCY_KEY): cv.string,
+    vol.Optional(ATTR_PRIORITY): vol.In(PRIORITIES),
+    vol.Optional(ATTR_MODE): vol.In(MODES),
+    vol.Optional(ATTR_TTL): cv.positive_time_period,
+    vol.Optional(ATTR_DEADLINE): cv.datetime,
+    vol.Optional(ATTR_DRY_RUN): cv.boolean,
+}
+
+
+def device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return the service device all of an entry's entities belong to."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=entry.title,
+        manufacturer="GoTo",
+        entry_type=DeviceEntryType.SERVICE,
+    )
+
+
+def configured_senders(hass: HomeAssistant, entry: ConfigEntry) -> Set[str]:
+    """Return the entry's discovered, pooled and default sender numbers."""
+    data = hass.data[DOMAIN]
+    senders = set(data[f"{entry.entry_id}_sender_numbers"].numbers)
+    for pool in data.get(f"{entry.entry_id}_pools", {}).values():
+        senders.update(pool.numbers)
+    default = normalize_number(entry.options.get(CONF_DEFAULT_SENDER) or "")
+    if default is not None:
+        senders.add(default)
+    return senders
+
+
+def async_setup_senders(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: Callable[[Iterable[Entity]], None],
+    entity_class: Callable[..., "SenderEntity"],
+) -> None:
+    """Add an entity per sender number and the send_message entity service."""
+    # The entities hold the entry's notification service, so
+    # goto_sms.send_message reaches the right account without a config entry
+    service = hass.data[DOMAIN][f"{entry.entry_id}_service"]
+    sender_numbers = hass.data[DOMAIN][f"{entry.entry_id}_sender_numbers"]
+    senders: Set[str] = set()
+
+    @callback
+    def async_add_senders() -> None:
+        """Add entities for sender numbers discovered or configured since."""
+        new = configured_senders(hass, entry) - senders
+        if new:
+            senders.update(new)
+            async_add_entities(
+                entity_class(entry, service, sender_numbers, sender)
+                for sender in sorted(new)
+            )
+
+    async_add_senders()
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_SENDERS_UPDATED.format(entry.entry_id), async_add_senders
+        )
+    )
+
+    entity_platform.async_get_current_platform().async_register_entity_service(
+        SERVICE_SEND_MESSAGE,
+        SEND_MESSAGE_SCHEMA,
+        "async_send_sms",
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+class SenderEntity(Entity):
+    """A sender number that messages can be sent from with send_message.
+
+    Sends go straight to the bound service and so to the account's queue,
+    limiters and token manager. Platforms combine this with their entity
+    class and record sends in _async_sent.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_icon = "mdi:message-arrow-right"
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        service: "GoToSMSNotificationService",
+        sender_numbers: SenderNumbers,
+        sender: str,
+    ) -> None:
+        """Initialize the entity."""
+        self.entry_id = entry.entry_id
+        self.service = service
+        self.sender_numbers = sender_numbers
+        self.sender = sender
+        self._last_response: Dict[str, int] = {}
+        self._attr_name = f"Sender {sender}"
+        self._attr_unique_id = f"{entry.entry_id}_{sender}_sender"
+        self._attr_device_info = device_info(entry)
+
+    async def async_added_to_hass(self) -> None:
+        """Follow sender number discovery."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_SENDERS_UPDATED.format(self.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return False once discovery shows the number is not on the account."""
+        return self.sender_numbers.is_valid(self.sender) is not False
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the number and the outcome of the last send."""
+        return {"number": self.sender, **self._last_response}
+
+    async def async_send_sms(self, **kwargs: Any) -> ServiceResponse:
+        """Send a message from this number, returning per-recipient results."""
+        results = await self.service.async_send_data(
+            {**kwargs, ATTR_SENDER_ID: self.sender}
+        )
+        response = send_response(results)
+        if results:
+            self._last_response = {
+                f"last_{status}": count
+                for status, count in response.items()
+                if status != "results"
+            }
+            self._async_sent()
+        return response
+
+    @callback
+    def _async_sent(self) -> None:
+        """Record that a message was sent through this entity."""
+        self.async_write_ha_state()
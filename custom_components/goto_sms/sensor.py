@@ -0,0 +1,177 @@
+"""Usage, budget and sender number sensors for the GoTo SMS integration."""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from homeassistant.components.sensor import (
+    RestoreSensor,
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SIGNAL_USAGE_NEW_SENDER, SIGNAL_USAGE_UPDATED, USAGE_PERIODS
+from .senders import SENDER_PLATFORM, SenderEntity, async_setup_senders, device_info
+from .usage import UsageTracker
+
+KINDS = ("messages", "segments")
+PERIOD_NAMES = {"hour": "this hour", "day": "today", "month": "this month"}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up usage sensors for the entry and for each sender number."""
+    tracker: UsageTracker = hass.data[DOMAIN][f"{entry.entry_id}_usage"]
+
+    entities: List[SensorEntity] = [
+        UsageSensor(entry, tracker, period, kind)
+        for period in USAGE_PERIODS
+        for kind in KINDS
+    ]
+    entities.append(BudgetSensor(entry, tracker))
+    known = set(tracker.senders)
+    for sender in known:
+        entities.extend(_sender_sensors(entry, tracker, sender))
+    async_add_entities(entities)
+
+    @callback
+    def async_add_sender(sender: str) -> None:
+        """Add sensors for a sender number that has just sent its first message."""
+        if sender not in known:
+            known.add(sender)
+            async_add_entities(_sender_sensors(entry, tracker, sender))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_USAGE_NEW_SENDER.format(entry.entry_id), async_add_sender
+        )
+    )
+
+    # Sender numbers are sensors where Home Assistant has no notify entities
+    if SENDER_PLATFORM == Platform.SENSOR:
+        async_setup_senders(hass, entry, async_add_entities, SenderSensor)
+
+
+def _sender_sensors(
+    entry: ConfigEntry, tracker: UsageTracker, sender: str
+) -> List[SensorEntity]:
+    """Return this month's message and segment sensors for a sender number."""
+    return [UsageSensor(entry, tracker, "month", kind, sender) for kind in KINDS]
+
+
+class UsageEntity(SensorEntity):
+    """A sensor updated from the entry's usage tracker."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, entry: ConfigEntry, tracker: UsageTracker) -> None:
+        """Initialize the sensor."""
+        self.tracker = tracker
+        self._attr_device_info = device_info(entry)
+
+    async def async_added_to_hass(self) -> None:
+        """Update when the tracker's counts change."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_USAGE_UPDATED.format(self.tracker.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+
+
+class UsageSensor(UsageEntity):
+    """Messages or segments sent in the current hour, day or month."""
+
+    _attr_state_class = SensorStateClass.TOTAL
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        tracker: UsageTracker,
+        period: str,
+        kind: str,
+        sender: Optional[str] = None,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(entry, tracker)
+        self.period = period
+        self.sender = sender
+        self._index = KINDS.index(kind)
+        self._attr_native_unit_of_measurement = kind
+        self._attr_icon = "mdi:message-text" if kind == "messages" else "mdi:counter"
+        if sender is None:
+            self._attr_name = f"{kind.capitalize()} {PERIOD_NAMES[period]}"
+            self._attr_unique_id = f"{entry.entry_id}_{kind}_{period}"
+        else:
+            self._attr_name = f"{sender} {kind} {PERIOD_NAMES[period]}"
+            self._attr_unique_id = f"{entry.entry_id}_{sender}_{kind}_{period}"
+
+    @property
+    def native_value(self) -> int:
+        """Return the count for the current period."""
+        return self.tracker.counts(self.period, self.sender)[self._index]
+
+    @property
+    def last_reset(self) -> datetime:
+        """Return when the current period began."""
+        return self.tracker.period_start(self.period)
+
+
+class BudgetSensor(UsageEntity):
+    """Segments left in this month's budget."""
+
+    _attr_name = "Segment budget remaining"
+    _attr_icon = "mdi:cash-multiple"
+    _attr_native_unit_of_measurement = "segments"
+
+    def __init__(self, entry: ConfigEntry, tracker: UsageTracker) -> None:
+        """Initialize the sensor."""
+        super().__init__(entry, tracker)
+        self._attr_unique_id = f"{entry.entry_id}_budget_remaining"
+
+    @property
+    def available(self) -> bool:
+        """Return True if a monthly budget is configured."""
+        return bool(self.tracker.budget)
+
+    @property
+    def native_value(self) -> Optional[int]:
+        """Return the segments left this month."""
+        return self.tracker.remaining
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the budget and whether it is enforced."""
+        return {"budget": self.tracker.budget, "hard_cap": self.tracker.hard_cap}
+
+
+class SenderSensor(SenderEntity, RestoreSensor):
+    """A sender number on Home Assistant versions without notify entities.
+
+    As for notify entities, the state is when a message was last sent
+    through it.
+    """
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last send time."""
+        await super().async_added_to_hass()
+        last = await self.async_get_last_sensor_data()
+        if last is not None and isinstance(last.native_value, datetime):
+            self._attr_native_value = last.native_value
+
+    @callback
+    def _async_sent(self) -> None:
+        """Record the send time as the state."""
+        self._attr_native_value = dt_util.utcnow()
+        super()._async_sent()
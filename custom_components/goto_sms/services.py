@@ -0,0 +1,326 @@
+"""Services of the GoTo SMS integration.
+
+The services are registered once for the integration, not per config entry.
+Each call acts on the entry named by its config_entry_id, or on the first
+loaded entry; suppression changes without one apply to every loaded entry.
+"""
+
+import logging
+from typing import Any, List
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.template import TemplateError
+
+from .bulk import BulkSendJob, async_resolve_recipients_file, default_job_id
+from .const import (
+    ATTR_BACKGROUND,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DEADLINE,
+    ATTR_DRY_RUN,
+    ATTR_DURATION,
+    ATTR_FILE,
+    ATTR_INTERVAL,
+    ATTR_JOB_ID,
+    ATTR_MAX_IN_FLIGHT,
+    ATTR_MESSAGE,
+    ATTR_NUMBERS,
+    ATTR_PRIORITY,
+    ATTR_RESUME,
+    ATTR_SENDER_ID,
+    ATTR_TARGET_FIELD,
+    ATTR_TTL,
+    DEFAULT_BULK_MAX_IN_FLIGHT,
+    DEFAULT_PROFILE_DURATION,
+    DEFAULT_PROFILE_INTERVAL,
+    DEFAULT_TARGET_FIELD,
+    DOMAIN,
+    PRIORITIES,
+    PRIORITY_LOW,
+    PROFILER,
+    SERVICE_PROFILE,
+    SERVICE_SEND_BULK,
+    SERVICE_SEND_SMS,
+    SERVICE_SEND_STATUS,
+    SERVICE_SUPPRESSION_ADD,
+    SERVICE_SUPPRESSION_IMPORT,
+    SERVICE_SUPPRESSION_REMOVE,
+)
+from .deadline import deadline_at
+from .dryrun import dry_run_scope
+from .profiler import SamplingProfiler
+from .records import send_response
+from .senders import SEND_MESSAGE_SCHEMA
+from .templates import MessageTemplate
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICES = (
+    SERVICE_SEND_SMS,
+    SERVICE_SEND_STATUS,
+    SERVICE_SEND_BULK,
+    SERVICE_SUPPRESSION_ADD,
+    SERVICE_SUPPRESSION_REMOVE,
+    SERVICE_SUPPRESSION_IMPORT,
+    SERVICE_PROFILE,
+)
+
+# send_message's fields, plus the account and sender to send from
+SEND_SMS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        **SEND_MESSAGE_SCHEMA,
+        vol.Optional(ATTR_SENDER_ID): cv.string,
+        vol.Optional(ATTR_BACKGROUND, default=False): cv.boolean,
+    }
+)
+
+SEND_BULK_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_FILE): cv.string,
+        vol.Required(ATTR_MESSAGE): cv.string,
+        vol.Optional(ATTR_SENDER_ID): cv.string,
+        vol.Optional(ATTR_TARGET_FIELD, default=DEFAULT_TARGET_FIELD): cv.string,
+        vol.Optional(ATTR_MAX_IN_FLIGHT, default=DEFAULT_BULK_MAX_IN_FLIGHT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+        vol.Optional(ATTR_JOB_ID): cv.slug,
+        vol.Optional(ATTR_RESUME, default=True): cv.boolean,
+        vol.Optional(ATTR_DRY_RUN, default=False): cv.boolean,
+        vol.Optional(ATTR_PRIORITY, default=PRIORITY_LOW): vol.In(PRIORITIES),
+        vol.Optional(ATTR_TTL): cv.positive_time_period,
+        vol.Optional(ATTR_DEADLINE): cv.datetime,
+    }
+)
+
+SEND_STATUS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_JOB_ID): cv.string,
+    }
+)
+
+SUPPRESSION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_NUMBERS): vol.All(cv.ensure_list_csv, [cv.string]),
+    }
+)
+
+SUPPRESSION_IMPORT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_FILE): cv.string,
+        vol.Optional(ATTR_TARGET_FIELD, default=DEFAULT_TARGET_FIELD): cv.string,
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=DEFAULT_PROFILE_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=600)
+        ),
+        vol.Optional(ATTR_INTERVAL, default=DEFAULT_PROFILE_INTERVAL): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=1000)
+        ),
+    }
+)
+
+
+def loaded_entry_ids(hass: HomeAssistant) -> List[str]:
+    """Return the IDs of the set-up config entries, in configuration order."""
+    data = hass.data.get(DOMAIN, {})
+    return [
+        entry.entry_id
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if f"{entry.entry_id}_service" in data
+    ]
+
+
+def _entry_ids(hass: HomeAssistant, call: ServiceCall, every: bool) -> List[str]:
+    """Return the entries a call acts on: the one it names, or the default.
+
+    The default is the first loaded entry, or every loaded entry if every is
+    set. Raises HomeAssistantError if there is no such entry.
+    """
+    loaded = loaded_entry_ids(hass)
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is not None:
+        if entry_id not in loaded:
+            raise HomeAssistantError(f"GoTo SMS entry {entry_id} is not loaded")
+        return [entry_id]
+    if not loaded:
+        raise HomeAssistantError("No GoTo SMS entry is loaded")
+    return loaded if every else loaded[:1]
+
+
+def _entry_data(hass: HomeAssistant, entry_id: str, key: str) -> Any:
+    """Return per-entry runtime data stored by async_setup_entry."""
+    return hass.data[DOMAIN][f"{entry_id}_{key}"]
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services, unless they already are."""
+    if hass.services.has_service(DOMAIN, SERVICE_SEND_SMS):
+        return
+
+    async def handle_send_sms(call: ServiceCall):
+        """Handle the send SMS service call, returning per-recipient results."""
+        (entry_id,) = _entry_ids(hass, call, every=False)
+        service = _entry_data(hass, entry_id, "service")
+        if call.data.get(ATTR_BACKGROUND):
+            send_jobs = _entry_data(hass, entry_id, "send_jobs")
+            return send_jobs.start(lambda: service.async_send_message_service(call))
+        return send_response(await service.async_send_message_service(call))
+
+    async def handle_send_status(call: ServiceCall):
+        """Return the state and results of a background send."""
+        for entry_id in _entry_ids(hass, call, every=True):
+            job = _entry_data(hass, entry_id, "send_jobs").get(call.data[ATTR_JOB_ID])
+            if job is not None:
+                return job
+        raise HomeAssistantError(f"Unknown send job {call.data[ATTR_JOB_ID]}")
+
+    async def handle_send_bulk(call: ServiceCall) -> None:
+        """Handle the bulk send service call."""
+        (entry_id,) = _entry_ids(hass, call, every=False)
+        service = _entry_data(hass, entry_id, "service")
+        bulk_jobs = _entry_data(hass, entry_id, "bulk_jobs")
+
+        path = await async_resolve_recipients_file(hass, call.data[ATTR_FILE])
+        sender_id = call.data.get(ATTR_SENDER_ID) or service._default_sender()
+        if not sender_id:
+            raise HomeAssistantError("No sender_id given and no default sender")
+        if not service._sender_allowed(sender_id):
+            raise HomeAssistantError(
+                f"{sender_id} is not an SMS-capable number of this GoTo account"
+            )
+
+        job_id = call.data.get(ATTR_JOB_ID) or default_job_id(path)
+        if job_id in bulk_jobs:
+            raise HomeAssistantError(f"Bulk job {job_id} is already running")
+
+        try:
+            template = MessageTemplate(hass, call.data[ATTR_MESSAGE])
+        except TemplateError as e:
+            raise HomeAssistantError(f"Invalid message template: {e}") from e
+
+        job = BulkSendJob(
+            hass,
+            service,
+            job_id,
+            path,
+            template,
+            sender_id,
+            call.data[ATTR_TARGET_FIELD],
+            call.data[ATTR_MAX_IN_FLIGHT],
+            call.data[ATTR_PRIORITY],
+            deadline_at(call.data.get(ATTR_TTL), call.data.get(ATTR_DEADLINE)),
+        )
+        # The job's task inherits the dry-run flag from this context
+        with dry_run_scope(call.data[ATTR_DRY_RUN]):
+            task = hass.async_create_background_task(
+                job.async_run(call.data[ATTR_RESUME]), f"{DOMAIN} bulk job {job_id}"
+            )
+        bulk_jobs[job_id] = task
+        task.add_done_callback(lambda _: bulk_jobs.pop(job_id, None))
+        _LOGGER.info("Started bulk job %s from %s", job_id, path)
+
+    async def handle_suppression_add(call: ServiceCall) -> None:
+        """Add numbers to the suppression list of each entry."""
+        invalid: List[str] = []
+        for entry_id in _entry_ids(hass, call, every=True):
+            suppression = _entry_data(hass, entry_id, "suppression")
+            added, invalid = suppression.add(call.data[ATTR_NUMBERS])
+            _LOGGER.info("Suppressed %d numbers", added)
+        if invalid:
+            raise HomeAssistantError(f"Invalid phone numbers: {', '.join(invalid)}")
+
+    async def handle_suppression_remove(call: ServiceCall) -> None:
+        """Remove numbers from the suppression list of each entry."""
+        invalid: List[str] = []
+        for entry_id in _entry_ids(hass, call, every=True):
+            suppression = _entry_data(hass, entry_id, "suppression")
+            removed, invalid = suppression.remove(call.data[ATTR_NUMBERS])
+            _LOGGER.info("Removed %d numbers from the suppression list", removed)
+        if invalid:
+            raise HomeAssistantError(f"Invalid phone numbers: {', '.join(invalid)}")
+
+    async def handle_suppression_import(call: ServiceCall) -> None:
+        """Add every number in a file to the suppression list of each entry."""
+        path = await async_resolve_recipients_file(hass, call.data[ATTR_FILE])
+        for entry_id in _entry_ids(hass, call, every=True):
+            suppression = _entry_data(hass, entry_id, "suppression")
+            added, invalid = await suppression.async_import(
+                path, call.data[ATTR_TARGET_FIELD]
+            )
+            _LOGGER.info(
+                "Imported %d suppressed numbers from %s (%d invalid skipped)",
+                added,
+                path,
+                invalid,
+            )
+
+    # Profile the integration's code on demand; nothing runs until called
+    profiler = hass.data[DOMAIN][PROFILER] = SamplingProfiler(hass)
+
+    async def handle_profile(call: ServiceCall):
+        """Profile the integration for a while and report the top functions."""
+        return await profiler.async_profile(
+            call.data[ATTR_DURATION], call.data[ATTR_INTERVAL]
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_SMS,
+        handle_send_sms,
+        schema=SEND_SMS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_STATUS,
+        handle_send_status,
+        schema=SEND_STATUS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SEND_BULK, handle_send_bulk, schema=SEND_BULK_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SUPPRESSION_ADD,
+        handle_suppression_add,
+        schema=SUPPRESSION_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SUPPRESSION_REMOVE,
+        handle_suppression_remove,
+        schema=SUPPRESSION_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SUPPRESSION_IMPORT,
+        handle_suppression_import,
+        schema=SUPPRESSION_IMPORT_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        handle_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the integration's services and stop the profiler."""
+    for service in SERVICES:
+        hass.services.async_remove(DOMAIN, service)
+    profiler = hass.data.get(DOMAIN, {}).pop(PROFILER, None)
+    if profiler is not None:
+        profiler.stop()
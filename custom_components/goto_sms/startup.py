@@ -0,0 +1,120 @@
+"""Concurrent token validation of every config entry at startup."""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, Tuple
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+
+from .const import DOMAIN, STARTUP_VALIDATION_TIMEOUT
+from .oauth import GoToOAuth2Manager
+
+_LOGGER = logging.getLogger(__name__)
+
+READY = "ready"
+NOT_READY = "not_ready"
+AUTH_FAILED = "auth_failed"
+
+
+class StartupValidator:
+    """Validates and refreshes the tokens of all config entries at once.
+
+    When the integration is set up, validation starts for every enabled
+    entry together, so entries with expired tokens refresh in parallel
+    instead of one after another. Each entry's setup then waits only for
+    its own result, for at most STARTUP_VALIDATION_TIMEOUT seconds. A
+    timeout or a network failure raises ConfigEntryNotReady so Home
+    Assistant retries the setup with backoff; a refresh token GoTo rejects
+    raises ConfigEntryAuthFailed. A validation still running when its setup
+    gives up carries on, and the retried setup joins it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the validator."""
+        self.hass = hass
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+
+    @callback
+    def async_start(self, entries: Iterable[ConfigEntry]) -> None:
+        """Start validating each enabled entry that is not already validating."""
+        for entry in entries:
+            if entry.disabled_by is None:
+                self._task(entry)
+
+    def _task(self, entry: ConfigEntry) -> asyncio.Task:
+        """Return the entry's validation, starting it if needed."""
+        task = self._tasks.get(entry.entry_id)
+        if task is None:
+            task = self.hass.async_create_background_task(
+                self._async_validate(
+                    entry.entry_id, GoToOAuth2Manager(self.hass, entry)
+                ),
+                f"{DOMAIN} startup validation {entry.title}",
+            )
+            self._tasks[entry.entry_id] = task
+        return task
+
+    async def _async_validate(
+        self, entry_id: str, oauth_manager: GoToOAuth2Manager
+    ) -> Tuple[GoToOAuth2Manager, str]:
+        """Load the entry's tokens, which refreshes them if they are due."""
+        start = time.monotonic()
+        try:
+            if await oauth_manager.load_tokens():
+                _LOGGER.info("Tokens are valid on startup")
+                state = READY
+            elif not oauth_manager._tokens:
+                _LOGGER.warning("No tokens found during startup validation")
+                state = AUTH_FAILED
+            elif oauth_manager.refresh_rejected:
+                state = AUTH_FAILED
+            else:
+                _LOGGER.warning("Startup token refresh failed - will retry setup")
+                state = NOT_READY
+        except Exception as e:
+            _LOGGER.error("Error during startup token validation: %s", e)
+            state = NOT_READY
+
+        result = self._results.setdefault(entry_id, {"attempts": 0})
+        result["attempts"] += 1
+        result["state"] = state
+        result["seconds"] = round(time.monotonic() - start, 3)
+        return oauth_manager, state
+
+    async def async_validate(self, entry: ConfigEntry) -> GoToOAuth2Manager:
+        """Wait for the entry's validation and return its OAuth manager.
+
+        Raises ConfigEntryNotReady or ConfigEntryAuthFailed if the entry
+        cannot be set up now.
+        """
+        task = self._task(entry)
+        try:
+            oauth_manager, state = await asyncio.wait_for(
+                asyncio.shield(task), STARTUP_VALIDATION_TIMEOUT
+            )
+        except asyncio.TimeoutError as e:
+            raise ConfigEntryNotReady(
+                f"Token validation did not finish within {STARTUP_VALIDATION_TIMEOUT}s"
+            ) from e
+        finally:
+            if task.done() and self._tasks.get(entry.entry_id) is task:
+                del self._tasks[entry.entry_id]
+
+        if state == AUTH_FAILED:
+            raise ConfigEntryAuthFailed("GoTo rejected the stored tokens")
+        if state == NOT_READY:
+            raise ConfigEntryNotReady("Could not refresh tokens with GoTo")
+        return oauth_manager
+
+    def stats(self, entry_id: str) -> Dict[str, Any]:
+        """Return the entry's last validation for metrics."""
+        result = self._results.get(entry_id, {})
+        return {
+            "startup_validation": result.get("state"),
+            "startup_validation_s": result.get("seconds"),
+            "startup_attempts": result.get("attempts", 0),
+        }
@@ -0,0 +1,117 @@
+"""Persistent suppression (opt-out) list for the GoTo SMS integration."""
+
+import logging
+import os
+from typing import Dict, Iterable, List, Set, Tuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .bulk import open_rows
+from .const import DOMAIN
+from .groups import normalize_number
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 1
+
+
+def _read_numbers(path: str, field: str) -> Tuple[Set[str], int]:
+    """Read and normalize every number in a file (runs in the executor).
+
+    Plain text files hold one number per line; CSV and JSONL files are read
+    like bulk recipient files, taking the number from field.
+    """
+    numbers: Set[str] = set()
+    invalid = 0
+    if os.path.splitext(path)[1].lower() == ".txt":
+        with open(path, encoding="utf-8") as handle:
+            values: Iterable[str] = [line for line in handle if line.strip()]
+    else:
+        handle, rows = open_rows(path)
+        with handle:
+            values = [str(row.get(field) or "") for row in rows]
+
+    for value in values:
+        number = normalize_number(value)
+        if number is None:
+            invalid += 1
+        else:
+            numbers.add(number)
+    return numbers, invalid
+
+
+class SuppressionList:
+    """Numbers that must never be texted, checked in O(1) per recipient."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the list."""
+        self.hass = hass
+        self._numbers: Set[str] = set()
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.suppression_{entry_id}")
+
+    def __len__(self) -> int:
+        """Return the number of suppressed numbers."""
+        return len(self._numbers)
+
+    def __contains__(self, number: str) -> bool:
+        """Return True if number is suppressed."""
+        return (normalize_number(number) or number) in self._numbers
+
+    async def async_load(self) -> None:
+        """Load the stored list into memory."""
+        data = await self._store.async_load()
+        if data:
+            self._numbers = set(data["numbers"].split())
+        _LOGGER.debug("Loaded %d suppressed numbers", len(self._numbers))
+
+    def add(self, numbers: Iterable[str]) -> Tuple[int, List[str]]:
+        """Suppress numbers, returning (added count, invalid values)."""
+        valid, invalid = self._normalize(numbers)
+        before = len(self._numbers)
+        self._numbers.update(valid)
+        return self._changed(len(self._numbers) - before), invalid
+
+    def remove(self, numbers: Iterable[str]) -> Tuple[int, List[str]]:
+        """Stop suppressing numbers, returning (removed count, invalid values)."""
+        valid, invalid = self._normalize(numbers)
+        before = len(self._numbers)
+        self._numbers.difference_update(valid)
+        return self._changed(before - len(self._numbers)), invalid
+
+    async def async_import(self, path: str, field: str) -> Tuple[int, int]:
+        """Suppress every number in a file, returning (added, invalid)."""
+        numbers, invalid = await self.hass.async_add_executor_job(
+            _read_numbers, path, field
+        )
+        before = len(self._numbers)
+        self._numbers |= numbers
+        return self._changed(len(self._numbers) - before), invalid
+
+    def stats(self) -> Dict[str, int]:
+        """Return the list size for metrics."""
+        return {"suppressed_numbers": len(self._numbers)}
+
+    @staticmethod
+    def _normalize(numbers: Iterable[str]) -> Tuple[Set[str], List[str]]:
+        """Split values into normalized numbers and invalid values."""
+        valid: Set[str] = set()
+        invalid: List[str] = []
+        for value in numbers:
+            number = normalize_number(value)
+            if number is None:
+                invalid.append(value)
+            else:
+                valid.add(number)
+        return valid, invalid
+
+    def _changed(self, count: int) -> int:
+        """Schedule a save if count numbers changed, and return count."""
+        if count:
+            self._store.async_delay_save(self._data, SAVE_DELAY)
+        return count
+
+    def _data(self) -> Dict[str, str]:
+        """Return the stored form: one newline-separated string of numbers."""
+        return {"numbers": "\n".join(self._numbers)}
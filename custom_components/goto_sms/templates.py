@@ -0,0 +1,55 @@
+"""Message template rendering for the GoTo SMS integration."""
+
+import logging
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.template import Template, TemplateError, is_template_string
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MessageTemplate:
+    """A message template compiled once and rendered many times."""
+
+    def __init__(self, hass: HomeAssistant, message: str) -> None:
+        """Compile the message, raising TemplateError if it is invalid."""
+        self.message = message
+        self._template: Optional[Template] = None
+
+        # Plain messages skip Jinja entirely
+        if is_template_string(message):
+            self._template = Template(message, hass)
+            self._template.ensure_valid()
+
+    @property
+    def is_static(self) -> bool:
+        """Return True if the message contains no template syntax."""
+        return self._template is None
+
+    def render(self, variables: Optional[Dict[str, Any]] = None) -> str:
+        """Render the message with one set of variables."""
+        if self._template is None:
+            return self.message
+        # parse_result=False keeps the text as-is instead of literal_eval'ing it
+        return self._template.async_render(variables, parse_result=False)
+
+    def render_many(
+        self, variables_list: Iterable[Dict[str, Any]]
+    ) -> Iterator[Optional[str]]:
+        """Render the message for each set of variables, in order.
+
+        Yields None for variables that fail to render so callers can skip them.
+        """
+        if self._template is None:
+            for _ in variables_list:
+                yield self.message
+            return
+
+        render = self._template.async_render
+        for variables in variables_list:
+            try:
+                yield render(variables, parse_result=False)
+            except TemplateError as e:
+                _LOGGER.error("Template rendering failed: %s", e)
+                yield None
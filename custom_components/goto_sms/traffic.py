@@ -0,0 +1,154 @@
+"""Opt-in recorder of send_sms traffic for replay against the stub server."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import TRAFFIC_FLUSH_INTERVAL, TRAFFIC_FLUSH_SIZE, TRAFFIC_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def data_shape(value: Any) -> Any:
+    """Return the shape of template data: keys, types and sizes, no values."""
+    if isinstance(value, dict):
+        return {str(key): data_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return f"list[{len(value)}]"
+    if isinstance(value, str):
+        return f"str[{len(value)}]"
+    return type(value).__name__
+
+
+def _append(path: str, lines: List[str]) -> int:
+    """Append lines to the recording and return its size (runs in the executor)."""
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.writelines(lines)
+        return handle.tell()
+
+
+class TrafficRecorder:
+    """Records the shape and timing of send_sms calls as compact JSONL.
+
+    Each line holds the call time, a hash and the length of the message
+    template, whether it was templated, the shape of its data, the rendered
+    length, and hashed sender and recipient numbers. Hashes are keyed with a
+    random per-session salt that is never written, so numbers and bodies
+    cannot be recovered from a recording, yet repeats within it still match.
+    Lines are buffered and appended from the executor.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, path: str, max_bytes: int = TRAFFIC_MAX_BYTES
+    ) -> None:
+        """Initialize the recorder."""
+        self.hass = hass
+        self.path = path
+        self.max_bytes = max_bytes
+        self.recorded = 0
+        self.size = 0
+        self._salt = os.urandom(16)
+        self._buffer: List[str] = []
+        self._write_lock = asyncio.Lock()
+        self._unsub: Optional[Callable[[], None]] = None
+
+    @property
+    def active(self) -> bool:
+        """Return True while calls are being recorded."""
+        return self._unsub is not None
+
+    def async_start(self) -> None:
+        """Start recording."""
+        if self._unsub is None:
+            _LOGGER.info("Recording send_sms traffic to %s", self.path)
+            self._unsub = async_track_time_interval(
+                self.hass,
+                lambda _now: self._async_schedule_flush(),
+                timedelta(seconds=TRAFFIC_FLUSH_INTERVAL),
+            )
+
+    async def async_stop(self) -> None:
+        """Stop recording and write what is buffered."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        await self._async_flush()
+
+    def _hash(self, value: str) -> str:
+        """Return a short keyed hash of value."""
+        return hashlib.blake2b(
+            value.encode(), key=self._salt, digest_size=6
+        ).hexdigest()
+
+    def record(
+        self,
+        template: str,
+        template_data: Optional[Dict[str, Any]],
+        rendered: str,
+        targets: Iterable[str],
+        sender_id: str,
+        priority: str,
+        templated: bool,
+    ) -> None:
+        """Record one send_sms call."""
+        if not self.active:
+            return
+        line = {
+            "t": round(time.time(), 3),
+            "tpl": self._hash(template),
+            "tpl_len": len(template),
+            "templated": templated,
+            "data": data_shape(template_data or {}),
+            "len": len(rendered),
+            "from": self._hash(sender_id),
+            "to": [self._hash(target) for target in targets],
+            "priority": priority,
+        }
+        self._buffer.append(json.dumps(line, separators=(",", ":")) + "\n")
+        self.recorded += 1
+        if len(self._buffer) >= TRAFFIC_FLUSH_SIZE:
+            self._async_schedule_flush()
+
+    def _async_schedule_flush(self) -> None:
+        """Write the buffer in the background unless a write is running."""
+        if self._buffer and not self._write_lock.locked():
+            self.hass.async_create_background_task(
+                self._async_flush(), "goto_sms traffic flush"
+            )
+
+    async def _async_flush(self) -> None:
+        """Append the buffered lines to the recording."""
+        async with self._write_lock:
+            if not self._buffer:
+                return
+            lines, self._buffer = self._buffer, []
+            try:
+                self.size = await self.hass.async_add_executor_job(
+                    _append, self.path, lines
+                )
+            except OSError as e:
+                _LOGGER.error("Could not write traffic recording %s: %s", self.path, e)
+        if self.size >= self.max_bytes and self._unsub is not None:
+            _LOGGER.warning(
+                "Traffic recording %s reached %d bytes; recording stopped",
+                self.path,
+                self.size,
+            )
+            self._unsub()
+            self._unsub = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the recorder state for metrics."""
+        return {
+            "traffic_recording": self.active,
+            "traffic_recorded_calls": self.recorded,
+            "traffic_recording_bytes": self.size,
+        }
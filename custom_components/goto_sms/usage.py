@@ -0,0 +1,279 @@
+"""Message and segment usage rollups for the GoTo SMS integration."""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_utc_time,
+)
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    EVENT_USAGE_BUDGET_REACHED,
+    SIGNAL_USAGE_NEW_SENDER,
+    SIGNAL_USAGE_UPDATED,
+    USAGE_FLUSH_INTERVAL,
+    USAGE_HISTORY,
+    USAGE_PERIODS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# [messages, segments]
+Counts = List[int]
+
+
+_KEY_FORMATS = {"hour": "%Y-%m-%dT%H", "day": "%Y-%m-%d", "month": "%Y-%m"}
+
+
+def _period_bounds(period: str, now: datetime) -> Tuple[datetime, datetime]:
+    """Return the start and end of the local period containing now."""
+    if period == "hour":
+        start = now.replace(minute=0, second=0, microsecond=0)
+        return start, start + timedelta(hours=1)
+    if period == "day":
+        start = dt_util.start_of_local_day(now)
+        return start, dt_util.start_of_local_day(start + timedelta(days=1, hours=1))
+    start = dt_util.start_of_local_day(now.replace(day=1))
+    end = (start + timedelta(days=32)).replace(day=1)
+    return start, dt_util.start_of_local_day(end)
+
+
+class UsageTracker:
+    """Counts messages and segments per entry and per sender.
+
+    Each period (hour, day, month) holds the counts of the current local
+    period plus a short history of finished ones. Recording a send adds to
+    three counters and three per-sender counters. Periods roll over on a
+    timer at each hour boundary; a send only compares the time with that
+    boundary in case the timer has not run yet. While messages are being
+    sent, counts are saved to a Store and sensors are updated at most every
+    USAGE_FLUSH_INTERVAL seconds.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self.budget = 0
+        self.hard_cap = False
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.usage_{entry_id}")
+        self._keys: Dict[str, str] = {}
+        self._starts: Dict[str, datetime] = {}
+        self._totals: Dict[str, Counts] = {}
+        self._senders: Dict[str, Dict[str, Counts]] = {}
+        self._history: Dict[str, List[Dict[str, Any]]] = {}
+        self._rollover_at = 0.0
+        self._budget_reported = False
+        self._unsub_update: Optional[CALLBACK_TYPE] = None
+        self._unsub_rollover: Optional[CALLBACK_TYPE] = None
+        self._roll(dt_util.now())
+
+    async def async_load(self) -> None:
+        """Load the stored counts and roll them over to the current periods."""
+        data = await self._store.async_load()
+        if data:
+            self._keys = data["keys"]
+            self._totals = data["totals"]
+            self._senders = data["senders"]
+            self._history = data["history"]
+            self._budget_reported = data.get("budget_reported", False)
+        self._roll(dt_util.now())
+        self._schedule_rollover()
+
+    @callback
+    def configure(self, budget: int, hard_cap: bool) -> None:
+        """Set the monthly segment budget (0 for none) and whether it is enforced."""
+        self.budget = budget
+        self.hard_cap = hard_cap
+        if self.remaining != 0:
+            self._budget_reported = False
+        async_dispatcher_send(self.hass, SIGNAL_USAGE_UPDATED.format(self.entry_id))
+
+    @property
+    def senders(self) -> List[str]:
+        """Return the sender numbers with usage this month."""
+        return list(self._senders["month"])
+
+    def counts(self, period: str, sender: Optional[str] = None) -> Counts:
+        """Return [messages, segments] for the current period."""
+        if sender is None:
+            return self._totals[period]
+        return self._senders[period].get(sender, [0, 0])
+
+    def period_start(self, period: str) -> datetime:
+        """Return when the current period began, in local time."""
+        return self._starts[period]
+
+    def history(self, period: str) -> List[Dict[str, Any]]:
+        """Return the finished periods, oldest first."""
+        return self._history[period]
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Return the segments left in this month's budget, if one is set."""
+        if not self.budget:
+            return None
+        return max(0, self.budget - self.counts("month")[1])
+
+    @property
+    def blocked(self) -> bool:
+        """Return True if the hard cap stops non-critical sends now."""
+        return self.hard_cap and self.remaining == 0
+
+    @callback
+    def record(self, sender_id: str, segments: int, recipients: int = 1) -> None:
+        """Count a message of segments segments sent to recipients numbers.
+
+        A group message is billed once per recipient, so it counts as that
+        many messages.
+        """
+        if time.time() >= self._rollover_at:
+            self._async_rollover()
+        new_sender = sender_id not in self._senders["month"]
+        for period in USAGE_PERIODS:
+            total = self._totals[period]
+            total[0] += recipients
+            total[1] += segments * recipients
+            counts = self._senders[period].setdefault(sender_id, [0, 0])
+            counts[0] += recipients
+            counts[1] += segments * recipients
+
+        if self.budget and not self._budget_reported and self.remaining == 0:
+            self._budget_reported = True
+            _LOGGER.warning(
+                "Monthly budget of %d segments reached%s",
+                self.budget,
+                "; only critical messages will be sent" if self.hard_cap else "",
+            )
+            self.hass.bus.async_fire(
+                EVENT_USAGE_BUDGET_REACHED,
+                {
+                    "entry_id": self.entry_id,
+                    "budget": self.budget,
+                    "segments": self._totals["month"][1],
+                    "hard_cap": self.hard_cap,
+                },
+            )
+
+        if new_sender:
+            async_dispatcher_send(
+                self.hass, SIGNAL_USAGE_NEW_SENDER.format(self.entry_id), sender_id
+            )
+        if self._unsub_update is None:
+            self._unsub_update = async_call_later(
+                self.hass, USAGE_FLUSH_INTERVAL, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self, _now: Any = None) -> None:
+        """Save the counts and tell the sensors they changed."""
+        if self._unsub_update is not None:
+            self._unsub_update()
+            self._unsub_update = None
+        self._store.async_delay_save(self._data)
+        async_dispatcher_send(self.hass, SIGNAL_USAGE_UPDATED.format(self.entry_id))
+
+    async def async_stop(self) -> None:
+        """Cancel the pending timers and save now."""
+        if self._unsub_update is not None:
+            self._unsub_update()
+            self._unsub_update = None
+        if self._unsub_rollover is not None:
+            self._unsub_rollover()
+            self._unsub_rollover = None
+        await self._store.async_save(self._data())
+
+    def _schedule_rollover(self) -> None:
+        """Roll over when the current hour ends."""
+        if self._unsub_rollover is not None:
+            self._unsub_rollover()
+        self._unsub_rollover = async_track_point_in_utc_time(
+            self.hass,
+            self._async_rollover,
+            dt_util.utc_from_timestamp(self._rollover_at),
+        )
+
+    @callback
+    def _async_rollover(self, _now: Any = None) -> None:
+        """Start the new periods and update the sensors."""
+        self._roll(dt_util.now())
+        self._schedule_rollover()
+        self._async_flush()
+
+    def _roll(self, now: datetime) -> None:
+        """Move finished periods into the history and start new ones."""
+        earliest_end = None
+        for period in USAGE_PERIODS:
+            start, end = _period_bounds(period, now)
+            key = start.strftime(_KEY_FORMATS[period])
+            self._starts[period] = start
+            history = self._history.setdefault(period, [])
+            if self._keys.get(period) != key:
+                if period in self._keys:
+                    messages, segments = self._totals[period]
+                    history.append(
+                        {
+                            "period": self._keys[period],
+                            "messages": messages,
+                            "segments": segments,
+                        }
+                    )
+                    del history[: -USAGE_HISTORY[period]]
+                    if period == "month":
+                        self._budget_reported = False
+                self._keys[period] = key
+                self._totals[period] = [0, 0]
+                self._senders[period] = {}
+            if earliest_end is None or end < earliest_end:
+                earliest_end = end
+        self._rollover_at = earliest_end.timestamp()
+
+    def _data(self) -> Dict[str, Any]:
+        """Return the stored form of the counts."""
+        return {
+            "keys": self._keys,
+            "totals": self._totals,
+            "senders": self._senders,
+            "history": self._history,
+            "budget_reported": self._budget_reported,
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return every period's counts, per sender, and the history."""
+        return {
+            "budget": self.budget,
+            "hard_cap": self.hard_cap,
+            "periods": {
+                period: {
+                    "period": self._keys[period],
+                    "messages": self._totals[period][0],
+                    "segments": self._totals[period][1],
+                    "senders": {
+                        sender: {"messages": counts[0], "segments": counts[1]}
+                        for sender, counts in self._senders[period].items()
+                    },
+                }
+                for period in USAGE_PERIODS
+            },
+            "history": self._history,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Return this month's usage for metrics."""
+        messages, segments = self.counts("month")
+        return {
+            "usage_blocked": self.blocked,
+            "usage_messages_month": messages,
+            "usage_segments_month": segments,
+            "usage_budget_remaining": self.remaining,
+        }
@@ -0,0 +1,67 @@
+"""Startup warm-up of tokens and API connections."""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from yarl import URL
+
+from .const import GOTO_API_BASE_URL, OAUTH2_TOKEN_URL, WARMUP_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def _async_warm_host(hass: HomeAssistant, url: str) -> bool:
+    """Open a keep-alive connection to a host through the shared session.
+
+    Any HTTP response means DNS, TCP and TLS are done and the connection
+    is back in the pool for the next request to that host.
+    """
+    session = async_get_clientsession(hass)
+    try:
+        async with session.head(
+            url, allow_redirects=False, timeout=WARMUP_TIMEOUT
+        ) as response:
+            _LOGGER.debug("Warmed connection to %s (HTTP %d)", url, response.status)
+            return True
+    except Exception as e:  # Warm-up must never fail setup
+        _LOGGER.debug("Could not warm connection to %s: %s", url, e)
+        return False
+
+
+async def _async_timed(name: str, coro, timings: Dict[str, Optional[float]]) -> None:
+    """Run one warm-up step, recording its duration or None on failure."""
+    start = time.monotonic()
+    try:
+        ok = await coro
+    except Exception as e:  # Warm-up must never fail setup
+        _LOGGER.error("Error during startup %s warm-up: %s", name, e)
+        ok = False
+    timings[name] = round(time.monotonic() - start, 3) if ok else None
+
+
+async def async_prewarm(
+    hass: HomeAssistant, timings: Dict[str, Optional[float]]
+) -> None:
+    """Connect to the auth and API hosts in parallel.
+
+    Meant to run as a background task once setup has validated the tokens,
+    so the first message after a restart does not pay for DNS and TLS
+    handshakes. Each step's duration in seconds, or None if it failed, is
+    stored in timings under auth_host and api_host.
+    """
+    start = time.monotonic()
+    await asyncio.gather(
+        _async_timed(
+            "auth_host",
+            _async_warm_host(hass, str(URL(OAUTH2_TOKEN_URL).origin())),
+            timings,
+        ),
+        _async_timed("api_host", _async_warm_host(hass, GOTO_API_BASE_URL), timings),
+    )
+    _LOGGER.info(
+        "Startup warm-up finished in %.2fs: %s", time.monotonic() - start, timings
+    )
@@ -0,0 +1,180 @@
+"""Event loop lag watchdog with slow callback attribution."""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DEFAULT_SLOW_CALLBACK_THRESHOLD,
+    LOOP_HEARTBEAT_INTERVAL,
+    LOOP_LAG_WINDOW,
+    LOOP_RECENT_STALLS,
+    PROFILE_TOP_FUNCTIONS,
+)
+from .profiler import Stack, integration_stack
+
+_LOGGER = logging.getLogger(__name__)
+
+OUTSIDE = "outside goto_sms"
+UNSAMPLED = "not sampled"
+
+
+def _owner(stack: Optional[Stack]) -> str:
+    """Return the innermost integration function of a sampled stack."""
+    if stack is None:
+        return OUTSIDE
+    return [label for label in stack if label.startswith("goto_sms/")][-1]
+
+
+class LoopWatchdog:
+    """Measures event loop lag and attributes stalls to integration code.
+
+    A heartbeat callback reschedules itself on the loop every
+    LOOP_HEARTBEAT_INTERVAL seconds; how late it runs is the loop's lag. A
+    daemon thread watches the heartbeat and, while it is overdue, samples
+    the loop thread's stack. When a stall longer than the threshold ends, it
+    is attributed to the integration function seen in most samples, or to
+    code outside the integration. Nothing runs while the watchdog is off.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, threshold: float = DEFAULT_SLOW_CALLBACK_THRESHOLD
+    ) -> None:
+        """Initialize the watchdog; threshold is in milliseconds."""
+        self.hass = hass
+        self.threshold = threshold / 1000
+        self.stalls = 0
+        self.integration_stalls = 0
+        self.max_lag = 0.0
+        self._lags: Deque[float] = deque(maxlen=LOOP_LAG_WINDOW)
+        self._offenders: Dict[str, Dict[str, float]] = {}
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=LOOP_RECENT_STALLS)
+        self._due = 0.0
+        self._samples: Counter = Counter()
+        self._stacks: Dict[str, Stack] = {}
+        self._lock = threading.Lock()
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._stop = threading.Event()
+        self._loop_thread = 0
+
+    @property
+    def running(self) -> bool:
+        """Return True while the loop is being watched."""
+        return self._handle is not None
+
+    def async_start(self) -> None:
+        """Start watching the event loop."""
+        if self.running:
+            return
+        _LOGGER.info(
+            "Watching the event loop for stalls over %d ms", self.threshold * 1000
+        )
+        self._loop_thread = threading.get_ident()
+        self._stop = threading.Event()
+        self._schedule()
+        threading.Thread(
+            target=self._watch,
+            args=(self._stop,),
+            name="goto_sms loop watchdog",
+            daemon=True,
+        ).start()
+
+    def async_stop(self) -> None:
+        """Stop watching the event loop."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._stop.set()
+
+    def _schedule(self) -> None:
+        """Schedule the next heartbeat."""
+        self._due = time.monotonic() + LOOP_HEARTBEAT_INTERVAL
+        self._handle = self.hass.loop.call_later(LOOP_HEARTBEAT_INTERVAL, self._beat)
+
+    def _beat(self) -> None:
+        """Record how late this heartbeat ran and schedule the next one."""
+        lag = max(0.0, time.monotonic() - self._due)
+        with self._lock:
+            samples, self._samples = self._samples, Counter()
+            stacks, self._stacks = self._stacks, {}
+        self._lags.append(lag)
+        self.max_lag = max(self.max_lag, lag)
+        if lag >= self.threshold:
+            self._record_stall(lag, samples, stacks)
+        self._schedule()
+
+    def _watch(self, stop: threading.Event) -> None:
+        """Sample the loop thread's stack while the heartbeat is overdue."""
+        # Sample often enough that a stall just over the threshold is seen
+        while not stop.wait(self.threshold / 4):
+            if time.monotonic() - self._due < self.threshold / 2:
+                continue
+            stack = integration_stack(sys._current_frames().get(self._loop_thread))
+            owner = _owner(stack)
+            with self._lock:
+                self._samples[owner] += 1
+                if stack is not None:
+                    self._stacks.setdefault(owner, stack)
+
+    def _record_stall(
+        self, lag: float, samples: Counter, stacks: Dict[str, Stack]
+    ) -> None:
+        """Attribute a stall to the function seen most while it lasted."""
+        owner = samples.most_common(1)[0][0] if samples else UNSAMPLED
+        self.stalls += 1
+        if owner not in (OUTSIDE, UNSAMPLED):
+            self.integration_stalls += 1
+            _LOGGER.warning("Event loop blocked for %.0f ms in %s", lag * 1000, owner)
+
+        offender = self._offenders.setdefault(
+            owner, {"stalls": 0, "total_ms": 0.0, "max_ms": 0.0}
+        )
+        offender["stalls"] += 1
+        offender["total_ms"] += lag * 1000
+        offender["max_ms"] = max(offender["max_ms"], lag * 1000)
+        self._recent.append(
+            {
+                "time": datetime.now().isoformat(timespec="seconds"),
+                "lag_ms": round(lag * 1000, 1),
+                "function": owner,
+                "stack": list(stacks.get(owner, ())),
+            }
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return loop lag and stall counts for metrics."""
+        lags = sorted(self._lags)
+        p95 = lags[min(len(lags) - 1, int(len(lags) * 0.95))] if lags else 0.0
+        return {
+            "loop_watchdog": self.running,
+            "loop_lag_p95_ms": round(p95 * 1000, 1),
+            "loop_lag_max_ms": round(self.max_lag * 1000, 1),
+            "loop_stalls": self.stalls,
+            "loop_stalls_goto_sms": self.integration_stalls,
+        }
+
+    def slow_callbacks(self) -> Dict[str, Any]:
+        """Return the stall attribution for diagnostics."""
+        top: List[Dict[str, Any]] = [
+            {
+                "function": owner,
+                "stalls": int(offender["stalls"]),
+                "total_ms": round(offender["total_ms"], 1),
+                "max_ms": round(offender["max_ms"], 1),
+            }
+            for owner, offender in sorted(
+                self._offenders.items(), key=lambda item: -item[1]["total_ms"]
+            )[:PROFILE_TOP_FUNCTIONS]
+        ]
+        return {
+            "threshold_ms": round(self.threshold * 1000),
+            "top": top,
+            "recent": list(self._recent),
+        }
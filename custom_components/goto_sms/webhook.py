@@ -0,0 +1,174 @@
+"""Webhook receiver for GoTo notification-channel events."""
+
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util.json import json_loads
+
+from .const import (
+    CONF_WEBHOOK_ID,
+    DOMAIN,
+    EVENT_MESSAGE_RECEIVED,
+    EVENT_MESSAGE_STATUS,
+    START_KEYWORDS,
+    STOP_KEYWORDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def async_register_webhook(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Register the notification-channel webhook for a config entry."""
+    webhook_id = entry.data.get(CONF_WEBHOOK_ID)
+    if not webhook_id:
+        # Persist the ID so the URL given to GoTo survives restarts
+        webhook_id = webhook.async_generate_id()
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: webhook_id}
+        )
+
+    async def handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        """Handle a push from the GoTo notification channel."""
+        return await async_handle_payload(hass, entry.entry_id, await request.read())
+
+    # GoTo pushes from the internet, so the webhook cannot be local only
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        "GoTo SMS",
+        webhook_id,
+        handle_webhook,
+        local_only=False,
+        allowed_methods=["POST"],
+    )
+
+    try:
+        url = webhook.async_generate_url(hass, webhook_id)
+    except Exception:  # No external URL configured
+        url = webhook.async_generate_path(webhook_id)
+    _LOGGER.info("GoTo notification-channel webhook registered at %s", url)
+
+    return webhook_id
+
+
+def async_unregister_webhook(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Unregister the notification-channel webhook for a config entry."""
+    webhook_id = entry.data.get(CONF_WEBHOOK_ID)
+    if webhook_id:
+        webhook.async_unregister(hass, webhook_id)
+
+
+async def async_handle_payload(
+    hass: HomeAssistant, entry_id: str, body: bytes
+) -> web.Response:
+    """Parse a notification payload and fire the matching events."""
+    try:
+        payload = json_loads(body)
+    except ValueError as e:
+        _LOGGER.warning("Ignoring malformed webhook payload: %s", e)
+        return web.Response(status=400)
+
+    # The channel may batch several notifications into one request
+    events = payload if isinstance(payload, list) else [payload]
+    for event in events:
+        if isinstance(event, dict):
+            _dispatch_event(hass, entry_id, event)
+        else:
+            _LOGGER.debug("Ignoring non-object webhook event: %s", event)
+
+    return web.Response(status=200)
+
+
+def _dispatch_event(hass: HomeAssistant, entry_id: str, event: Dict[str, Any]) -> None:
+    """Fire a Home Assistant event for a single notification."""
+    content = event.get("content") or event.get("data") or event
+    if not isinstance(content, dict):
+        _LOGGER.debug("Ignoring webhook event without content: %s", event)
+        return
+
+    message_id = content.get("id") or content.get("messageId")
+    direction = str(content.get("direction") or "").upper()
+    event_type = str(event.get("type") or event.get("eventType") or "").upper()
+
+    if direction == "IN" or "INCOMING" in event_type:
+        sender = _first_number(
+            content.get("authorPhoneNumber"),
+            content.get("contactPhoneNumber"),
+            content.get("contactPhoneNumbers"),
+        )
+        body = content.get("body", "")
+        _apply_opt_out(hass, entry_id, sender, body)
+        hass.bus.async_fire(
+            EVENT_MESSAGE_RECEIVED,
+            {
+                "entry_id": entry_id,
+                "message_id": message_id,
+                "from": sender,
+                "to": content.get("ownerPhoneNumber"),
+                "body": body,
+                "timestamp": content.get("timestamp") or event.get("timestamp"),
+            },
+        )
+        return
+
+    status = content.get("status") or content.get("deliveryStatus")
+    if not message_id or not status:
+        _LOGGER.debug("Ignoring webhook event without a message status: %s", event)
+        return
+
+    records = hass.data.get(DOMAIN, {}).get(f"{entry_id}_outbound")
+    record = records.update_status(message_id, status) if records else None
+
+    data = {
+        "entry_id": entry_id,
+        "message_id": message_id,
+        "status": status,
+        "matched": record is not None,
+    }
+    if record is not None:
+        data["target"] = record.target
+        data["sender_id"] = record.sender_id
+        data["idempotency_key"] = record.idempotency_key
+        data["latency"] = round(time.time() - record.sent_at, 3)
+
+    hass.bus.async_fire(EVENT_MESSAGE_STATUS, data)
+
+
+def _apply_opt_out(
+    hass: HomeAssistant, entry_id: str, sender: Optional[str], body: Any
+) -> None:
+    """Suppress a sender who replied STOP, and lift it when they reply START."""
+    suppression = hass.data.get(DOMAIN, {}).get(f"{entry_id}_suppression")
+    if suppression is None or not sender:
+        return
+
+    keyword = str(body).strip().upper()
+    if keyword in STOP_KEYWORDS:
+        if suppression.add([sender])[0]:
+            _LOGGER.info(
+                "%s replied %s and was added to the suppression list", sender, keyword
+            )
+    elif keyword in START_KEYWORDS:
+        if suppression.remove([sender])[0]:
+            _LOGGER.info(
+                "%s replied %s and was removed from the suppression list",
+                sender,
+                keyword,
+            )
+
+
+def _first_number(*candidates: Any) -> Optional[str]:
+    """Return the first phone number from a set of optional fields."""
+    for candidate in candidates:
+        if isinstance(candidate, list):
+            candidate = candidate[0] if candidate else None
+        if candidate:
+            return candidate
+    return None
@@ -35,11 +35,40 @@ def test_file_structure():
     
     required_files = [
         'custom_components/goto_sms/__init__.py',
+        'custom_components/goto_sms/admission.py',
         'custom_components/goto_sms/manifest.json',
         'custom_components/goto_sms/const.py',
         'custom_components/goto_sms/oauth.py',
         'custom_components/goto_sms/notify.py',
         'custom_components/goto_sms/config_flow.py',
+        'custom_components/goto_sms/bulk.py',
+        'custom_components/goto_sms/concurrency.py',
+        'custom_components/goto_sms/diagnostics.py',
+        'custom_components/goto_sms/dryrun.py',
+        'custom_components/goto_sms/groups.py',
+        'custom_components/goto_sms/jobs.py',
+        'custom_components/goto_sms/metrics.py',
+        'custom_components/goto_sms/numbers.py',
+        'custom_components/goto_sms/ordering.py',
+        'custom_components/goto_sms/payload.py',
+        'custom_components/goto_sms/pool.py',
+        'custom_components/goto_sms/profiler.py',
+        'custom_components/goto_sms/ratelimit.py',
+        'custom_components/goto_sms/records.py',
+        'custom_components/goto_sms/retrybudget.py',
+        'custom_components/goto_sms/suppression.py',
+        'custom_components/goto_sms/templates.py',
+        'custom_components/goto_sms/traffic.py',
+        'custom_components/goto_sms/warmup.py',
+        'custom_components/goto_sms/watchdog.py',
+        'custom_components/goto_sms/sensor.py',
+        'custom_components/goto_sms/usage.py',
+        'custom_components/goto_sms/startup.py',
+        'custom_components/goto_sms/deadline.py',
+        'custom_components/goto_sms/routing.py',
+        'custom_components/goto_sms/senders.py',
+        'custom_components/goto_sms/services.py',
+        'custom_components/goto_sms/webhook.py',
         'custom_components/goto_sms/services.yaml',
         'custom_components/goto_sms/translations/en/config_flow.json',
     ]
@@ -62,10 +91,39 @@ def test_syntax():
     
     python_files = [
         'custom_components/goto_sms/__init__.py',
+        'custom_components/goto_sms/admission.py',
         'custom_components/goto_sms/const.py',
         'custom_components/goto_sms/oauth.py',
         'custom_components/goto_sms/notify.py',
         'custom_components/goto_sms/config_flow.py',
+        'custom_components/goto_sms/bulk.py',
+        'custom_components/goto_sms/concurrency.py',
+        'custom_components/goto_sms/diagnostics.py',
+        'custom_components/goto_sms/dryrun.py',
+        'custom_components/goto_sms/groups.py',
+        'custom_components/goto_sms/jobs.py',
+        'custom_components/goto_sms/metrics.py',
+        'custom_components/goto_sms/numbers.py',
+        'custom_components/goto_sms/ordering.py',
+        'custom_components/goto_sms/payload.py',
+        'custom_components/goto_sms/pool.py',
+        'custom_components/goto_sms/profiler.py',
+        'custom_components/goto_sms/ratelimit.py',
+        'custom_components/goto_sms/records.py',
+        'custom_components/goto_sms/retrybudget.py',
+        'custom_components/goto_sms/suppression.py',
+        'custom_components/goto_sms/templates.py',
+        'custom_components/goto_sms/traffic.py',
+        'custom_components/goto_sms/warmup.py',
+        'custom_components/goto_sms/watchdog.py',
+        'custom_components/goto_sms/sensor.py',
+        'custom_components/goto_sms/usage.py',
+        'custom_components/goto_sms/startup.py',
+        'custom_components/goto_sms/deadline.py',
+        'custom_components/goto_sms/routing.py',
+        'custom_components/goto_sms/senders.py',
+        'custom_components/goto_sms/services.py',
+        'custom_components/goto_sms/webhook.py',
     ]
     
     all_valid = True
@@ -167,10 +225,10 @@ def test_notify_logic():
             print("❌ Missing periodic token refresh")
             all_found = False
         
-        if 'startup_token_validation' in init_content:
-            print("✅ Found startup token validation")
+        if 'async_prewarm' in init_content:
+            print("✅ Found startup token warm-up")
         else:
-            print("❌ Missing startup token validation")
+            print("❌ Missing startup token warm-up")
             all_found = False
         
         return all_found
@@ -233,6 +291,734 @@ def test_authentication_persistence():
         print(f"❌ Authentication persistence test failed: {e}")
         return False
 
+def _load_module(name):
+    """Load a dependency-free integration module without Home Assistant.
+
+    The modules go into a bare package rather than goto_sms, whose __init__
+    needs Home Assistant, so their relative imports of const still resolve.
+    """
+    import importlib
+    import types
+
+    if 'goto_sms_standalone' not in sys.modules:
+        package = types.ModuleType('goto_sms_standalone')
+        package.__path__ = ['custom_components/goto_sms']
+        sys.modules['goto_sms_standalone'] = package
+    return importlib.import_module(f'goto_sms_standalone.{name}')
+
+class _MemoryStore:
+    """Stands in for a Store, saving delayed writes at once."""
+    
+    def __init__(self):
+        self.data = None
+    
+    async def async_load(self):
+        return self.data
+    
+    async def async_save(self, data):
+        self.data = data
+    
+    def async_delay_save(self, data_func, delay):
+        self.data = data_func()
+    
+    async def async_remove(self):
+        self.data = None
+
+async def _run_inline(func, *args):
+    """Stands in for hass.async_add_executor_job."""
+    return func(*args)
+
+def test_conversation_ordering():
+    """Property test: per-conversation order holds under retries and priorities."""
+    print("\n🔍 Testing conversation ordering...")
+    
+    import asyncio
+    import random
+    
+    ordering = _load_module('ordering')
+    admission = _load_module('admission')
+    const = _load_module('const')
+    
+    async def trial(seed):
+        rng = random.Random(seed)
+        serializer = ordering.KeyedSerializer()
+        # Admission starts higher priorities first; the conversation's place
+        # is taken before admission, as in the notification service
+        controller = admission.AdmissionController(
+            max_active=rng.randint(1, 3), max_queued=1000
+        )
+        keys = [("+15550100001", f"+1555000{i:04d}") for i in range(rng.randint(1, 6))]
+        submitted = {key: [] for key in keys}
+        delivered = {key: [] for key in keys}
+        active = set()
+        peak = {"keys": 0}
+        cancelled = set()
+        
+        async def send(key, seq, priority):
+            async with serializer.hold(key), controller.admit(priority):
+                assert key not in active, f"overlapping sends for {key}"
+                active.add(key)
+                peak["keys"] = max(peak["keys"], len(active))
+                try:
+                    # Injected failures: each attempt may fail and be retried
+                    for _attempt in range(rng.randint(1, 4)):
+                        for _ in range(rng.randint(0, 5)):
+                            await asyncio.sleep(0)
+                        if rng.random() < 0.6:
+                            break
+                    delivered[key].append(seq)
+                finally:
+                    active.discard(key)
+        
+        tasks = []
+        for seq in range(rng.randint(1, 60)):
+            key = rng.choice(keys)
+            submitted[key].append(seq)
+            priority = rng.choice(const.PRIORITIES)
+            tasks.append((key, seq, asyncio.ensure_future(send(key, seq, priority))))
+            for _ in range(rng.randint(0, 2)):
+                await asyncio.sleep(0)
+        
+        # Cancel a few queued sends; the rest must keep their order
+        for key, seq, task in rng.sample(tasks, k=len(tasks) // 10):
+            if task.cancel():
+                cancelled.add(seq)
+        await asyncio.gather(*(task for _, _, task in tasks), return_exceptions=True)
+        
+        for key in keys:
+            expected = [seq for seq in submitted[key] if seq not in cancelled]
+            got = [seq for seq in delivered[key] if seq not in cancelled]
+            assert got == expected, f"seed {seed}: {key} delivered {got}, expected {expected}"
+        assert len(serializer) == 0, f"seed {seed}: {len(serializer)} idle keys left"
+        assert controller.active == controller.queued == 0, f"seed {seed}: slots leaked"
+        return len(keys), peak["keys"]
+    
+    async def run():
+        parallel = 0
+        for seed in range(300):
+            key_count, peak = await trial(seed)
+            parallel += key_count > 1 and peak > 1
+        return parallel
+    
+    try:
+        parallel = asyncio.run(run())
+        print("✅ Per-conversation order preserved across 300 random schedules")
+        print("✅ Higher priorities did not pass earlier messages in a conversation")
+        print("✅ Idle conversation state released")
+        if parallel:
+            print(f"✅ Different conversations ran concurrently in {parallel} schedules")
+            return True
+        print("❌ Different conversations never ran concurrently")
+        return False
+    except AssertionError as e:
+        print(f"❌ Ordering violated: {e}")
+        return False
+
+def test_routing_rules():
+    """Test routing rule parsing and matching against a linear evaluation."""
+    print("\n🔍 Testing routing rules...")
+    
+    import random
+    
+    routing = _load_module('routing')
+    
+    try:
+        rules = routing.RoutingRules("""
+            # Comments and blank lines are ignored
+            severity=critical, area=garage|Shed -> target: oncall; priority: high
+
+            severity=critical -> target: everyone; sender_id: alerts
+            event=door_open -> mode: group
+            * -> target: family
+        """)
+        assert len(rules) == 4, f"{len(rules)} rules parsed"
+        cases = [
+            ({"severity": "critical", "area": "shed"}, routing.Route(target="oncall", priority="high")),
+            ({"severity": "CRITICAL", "area": "kitchen"}, routing.Route(target="everyone", sender_id="alerts")),
+            ({"severity": "critical"}, routing.Route(target="everyone", sender_id="alerts")),
+            ({"event": "door_open", "area": "garage"}, routing.Route(mode="group")),
+            ({"severity": "info"}, routing.Route(target="family")),
+            ({}, routing.Route(target="family")),
+            (None, routing.Route(target="family")),
+        ]
+        for data, expected in cases:
+            got = rules.match(data)
+            assert got == expected, f"{data} routed to {got}, expected {expected}"
+        assert rules.hits == [1, 2, 1, 3], f"hits {rules.hits}"
+        assert rules.stats()["routing_matches"] == 7
+        print("✅ First matching rule wins, with alternatives, case and catch-all")
+        
+        assert routing.RoutingRules("severity=critical -> target: oncall").match({"severity": "info"}) is None
+        assert routing.RoutingRules("").match({"severity": "info"}) is None
+        print("✅ Unmatched notifications get no route")
+        
+        for text in (
+            "severity critical -> target: oncall",
+            "severity=critical",
+            "severity=critical, severity=info -> target: oncall",
+            "severity=critical -> priority: urgent",
+            "severity=critical -> colour: red",
+            "severity=critical -> ",
+        ):
+            try:
+                routing.RoutingRules(text)
+            except ValueError:
+                continue
+            raise AssertionError(f"accepted invalid rule {text!r}")
+        print("✅ Invalid rules rejected")
+        
+        # The compiled indexes must agree with trying each rule in order
+        for seed in range(200):
+            rng = random.Random(seed)
+            fields = ["severity", "area", "event"]
+            values = ["a", "b", "c", "d"]
+            lines = []
+            for i in range(rng.randint(0, 12)):
+                conditions = [
+                    f"{field}={'|'.join(rng.sample(values, rng.randint(1, 2)))}"
+                    for field in rng.sample(fields, rng.randint(1, 3))
+                ]
+                lines.append(f"{', '.join(conditions)} -> target: group_{i}")
+            if rng.random() < 0.3:
+                lines.append("* -> target: everyone")
+            compiled = routing.RoutingRules("\n".join(lines))
+            parsed = routing.parse_rules("\n".join(lines))
+            for _ in range(50):
+                data = {field: rng.choice(values) for field in fields if rng.random() < 0.8}
+                expected = next(
+                    (
+                        rule.route
+                        for rule in parsed
+                        if all(str(data.get(field, "")).lower() in accepted for field, accepted in rule.conditions)
+                    ),
+                    None,
+                )
+                got = compiled.match(data)
+                assert got == expected, f"seed {seed}: {data} routed to {got}, expected {expected}"
+        print("✅ Compiled matching agrees with linear evaluation on 200 random rule sets")
+        return True
+    except AssertionError as e:
+        print(f"❌ Routing rules test failed: {e}")
+        return False
+
+def test_token_save_keeps_pools():
+    """Test that saving tokens to the entry does not rebuild sender pools."""
+    print("\n🔍 Testing sender pools across entry updates...")
+    
+    import asyncio
+    from types import MappingProxyType, SimpleNamespace
+    
+    sys.path.insert(0, 'custom_components')
+    try:
+        import goto_sms
+    except ImportError:
+        print("⚠️  Home Assistant not available, skipping")
+        return True
+    
+    options = {"sender_pools": "alerts: +15550100001, +15550100002, +15550100003", "sender_rate": 0.01}
+    hass = SimpleNamespace(data={"goto_sms": {}})
+    entry = SimpleNamespace(entry_id="entry", title="GoTo", data={}, options=MappingProxyType(options))
+    goto_sms._async_build_sender_pools(hass, entry)
+    # As async_setup_entry leaves it
+    hass.data["goto_sms"]["entry_options"] = dict(entry.options)
+    
+    try:
+        pool = hass.data["goto_sms"]["entry_pools"]["alerts"]
+        recipients = [f"+1555020{i:04d}" for i in range(30)]
+        
+        async def send_first(count):
+            # Each send uses its number's only token, so the next recipient
+            # goes to the number with the most headroom left
+            for recipient in recipients[:count]:
+                async with pool.slot(pool.select(recipient)):
+                    pass
+        
+        asyncio.run(send_first(3))
+        assigned = {recipient: pool.select(recipient) for recipient in recipients}
+        assert len(set(assigned.values())) > 1, "recipients were not spread"
+        
+        # Token refreshes and the webhook ID only change entry.data
+        for _ in range(3):
+            entry.data = {"tokens": {"access_token": object()}}
+            asyncio.run(goto_sms.async_update_options(hass, entry))
+        assert hass.data["goto_sms"]["entry_pools"]["alerts"] is pool, "pools rebuilt"
+        moved = [r for r in recipients if pool.select(r) != assigned[r]]
+        assert not moved, f"{len(moved)} recipients moved to another number"
+        print("✅ Token saves keep pools and recipient stickiness")
+        
+        # Other option changes keep the pools too; pool changes rebuild them
+        entry.options = MappingProxyType({**options, "retry_budget": 5})
+        goto_sms._async_build_sender_pools(hass, entry)
+        assert hass.data["goto_sms"]["entry_pools"]["alerts"] is pool, "pools rebuilt"
+        entry.options = MappingProxyType({**options, "sender_rate": 0.02})
+        goto_sms._async_build_sender_pools(hass, entry)
+        assert hass.data["goto_sms"]["entry_pools"]["alerts"] is not pool, "pools kept"
+        print("✅ Pools rebuilt only when the pools or sender rate change")
+        return True
+    except AssertionError as e:
+        print(f"❌ Sender pool test failed: {e}")
+        return False
+
+def test_adaptive_concurrency():
+    """Test the AIMD concurrency limit's increases and decreases."""
+    print("\n🔍 Testing adaptive concurrency...")
+    
+    import asyncio
+    from types import SimpleNamespace
+    
+    concurrency = _load_module('concurrency')
+    # A fake clock, so request latency is whatever the test says it is
+    clock = {"now": 1000.0}
+    real_time = concurrency.time
+    concurrency.time = SimpleNamespace(monotonic=lambda: clock["now"])
+    
+    async def request(limiter, latency=0.01, status=200, timeout=False):
+        try:
+            async with limiter.slot() as sample:
+                clock["now"] += latency
+                if timeout:
+                    raise asyncio.TimeoutError()
+                sample.record_status(status)
+        except asyncio.TimeoutError:
+            pass
+    
+    async def requests(limiter, count, **kwargs):
+        for _ in range(count):
+            await request(limiter, **kwargs)
+    
+    async def concurrent_throttles(limiter, count):
+        # Started together, so their 429s are one round and cut only once
+        started = asyncio.Event()
+        
+        async def throttled():
+            async with limiter.slot() as sample:
+                await started.wait()
+                clock["now"] += 0.01
+                sample.record_status(429)
+        
+        tasks = [asyncio.ensure_future(throttled()) for _ in range(count)]
+        await asyncio.sleep(0)
+        started.set()
+        await asyncio.gather(*tasks)
+    
+    try:
+        # Additive increase: about one per limit's worth of healthy responses
+        limiter = concurrency.AdaptiveConcurrencyLimiter(initial=4, max_limit=8, window=10)
+        asyncio.run(requests(limiter, 4))
+        assert 4.9 < limiter.limit < 5, f"limit {limiter.limit} after 4 successes"
+        asyncio.run(requests(limiter, 200))
+        assert limiter.limit == 8, f"limit {limiter.limit} not capped at 8"
+        print("✅ Healthy responses raise the limit by about one per round, up to the maximum")
+        
+        # Multiplicative decrease on 429, once per round of requests
+        asyncio.run(concurrent_throttles(limiter, 4))
+        assert limiter.limit == 4 and limiter.decreases == 1, f"limit {limiter.limit}, {limiter.decreases} cuts"
+        asyncio.run(request(limiter, timeout=True))
+        assert limiter.limit == 2 and limiter.decreases == 2, f"limit {limiter.limit} after timeout"
+        for _ in range(3):
+            asyncio.run(request(limiter, status=429))
+        assert limiter.limit == 1, f"limit {limiter.limit} below the minimum"
+        print("✅ 429s and timeouts halve the limit once per round, down to the minimum")
+        
+        # No increase while the error rate is high; 5xx errors do not cut
+        limiter = concurrency.AdaptiveConcurrencyLimiter(initial=4, window=10)
+        asyncio.run(requests(limiter, 5, status=500))
+        asyncio.run(requests(limiter, 5))
+        assert limiter.limit == 4 and limiter.decreases == 0, f"limit {limiter.limit} with errors"
+        print("✅ Server errors hold the limit without cutting it")
+        
+        # A latency spike over the baseline cuts the limit
+        limiter = concurrency.AdaptiveConcurrencyLimiter(initial=8, max_limit=8, window=10)
+        asyncio.run(requests(limiter, 20, latency=0.01))
+        asyncio.run(requests(limiter, 10, latency=0.2))
+        assert limiter.limit == 4 and limiter.decreases == 1, f"limit {limiter.limit} after latency spike"
+        print("✅ A p95 latency spike halves the limit")
+        
+        # Waiters beyond the limit start in order as slots free up
+        limiter = concurrency.AdaptiveConcurrencyLimiter(initial=2, max_limit=2)
+        order = []
+        
+        async def tracked(n):
+            async with limiter.slot():
+                order.append(n)
+                assert limiter.in_flight <= 2, "limit exceeded"
+                await asyncio.sleep(0)
+        
+        async def many():
+            await asyncio.gather(*(tracked(n) for n in range(10)))
+        
+        asyncio.run(many())
+        assert order == list(range(10)) and limiter.in_flight == 0, f"order {order}"
+        print("✅ In-flight requests stay under the limit and waiters start in order")
+        return True
+    except AssertionError as e:
+        print(f"❌ Adaptive concurrency test failed: {e}")
+        return False
+    finally:
+        concurrency.time = real_time
+
+def test_retry_budget():
+    """Test that the retry budget runs out and refills over its window."""
+    print("\n🔍 Testing retry budget...")
+    
+    from types import SimpleNamespace
+    
+    retrybudget = _load_module('retrybudget')
+    clock = {"now": 1000.0}
+    real_time = retrybudget.time
+    retrybudget.time = SimpleNamespace(monotonic=lambda: clock["now"])
+    
+    def retries(budget, count):
+        return sum(budget.try_retry() for _ in range(count))
+    
+    try:
+        # With no traffic only the fixed allowance is available
+        budget = retrybudget.RetryBudget(percent=20, window=10, min_retries=5)
+        assert retries(budget, 8) == 5, "allowance not enforced"
+        assert budget.denied == 3, f"{budget.denied} retries denied"
+        print("✅ Retries beyond the fixed allowance are denied")
+        
+        # First attempts earn percent of a retry each
+        for _ in range(50):
+            budget.record_request()
+        assert retries(budget, 20) == 10, "earned budget not enforced"
+        stats = budget.stats()
+        assert stats["retries_in_window"] == 15 and stats["retry_budget_used"] == 100.0, stats
+        print("✅ First attempts earn retries at the configured percentage")
+        
+        # Retries and first attempts leave the window as it slides
+        clock["now"] += 5
+        assert retries(budget, 1) == 0, "budget refilled before the window passed"
+        clock["now"] += 5
+        stats = budget.stats()
+        assert stats["retries_in_window"] == 0 and stats["first_attempts_in_window"] == 0, stats
+        assert retries(budget, 8) == 5, "budget not refilled after the window"
+        assert budget.total_retries == 20 and budget.denied == 17, (budget.total_retries, budget.denied)
+        print("✅ The budget refills as the window slides")
+        
+        # No percentage and no allowance: retries are never allowed
+        budget = retrybudget.RetryBudget(percent=0, window=10, min_retries=0)
+        for _ in range(1000):
+            budget.record_request()
+        assert retries(budget, 3) == 0, "retries allowed with no budget"
+        print("✅ A zero budget denies every retry")
+        return True
+    except AssertionError as e:
+        print(f"❌ Retry budget test failed: {e}")
+        return False
+    finally:
+        retrybudget.time = real_time
+
+def test_suppression_list():
+    """Test adding, lifting, importing and persisting suppressed numbers."""
+    print("\n🔍 Testing suppression list...")
+    
+    import asyncio
+    import tempfile
+    from types import SimpleNamespace
+    
+    sys.path.insert(0, 'custom_components')
+    try:
+        import goto_sms  # noqa: F401
+        from goto_sms import suppression, webhook
+    except ImportError:
+        print("⚠️  Home Assistant not available, skipping")
+        return True
+    
+    hass = SimpleNamespace(async_add_executor_job=_run_inline, data={"goto_sms": {}})
+    store = _MemoryStore()
+    
+    def make_list():
+        suppressed = suppression.SuppressionList(hass, "entry")
+        suppressed._store = store
+        return suppressed
+    
+    paths = []
+    
+    def write(suffix, text):
+        with tempfile.NamedTemporaryFile("w", suffix=suffix, delete=False) as handle:
+            handle.write(text)
+        paths.append(handle.name)
+        return handle.name
+    
+    try:
+        suppressed = make_list()
+        added, invalid = suppressed.add(["+1 (555) 040-0001", "+15550400001", "+15550400002", "nope"])
+        assert (added, invalid) == (2, ["nope"]), (added, invalid)
+        assert "+1 555 040 0001" in suppressed and "+15550400003" not in suppressed
+        removed, _ = suppressed.remove(["+15550400002", "+15550400009"])
+        assert removed == 1 and "+15550400002" not in suppressed, removed
+        print("✅ Numbers are normalized when added, checked and removed")
+        
+        # STOP replies suppress the sender and START replies lift it
+        hass.data["goto_sms"]["entry_suppression"] = suppressed
+        webhook._apply_opt_out(hass, "entry", "+15550400005", " stop ")
+        assert "+15550400005" in suppressed, "STOP reply not suppressed"
+        webhook._apply_opt_out(hass, "entry", "+15550400005", "Thanks")
+        assert "+15550400005" in suppressed, "other reply lifted suppression"
+        webhook._apply_opt_out(hass, "entry", "+15550400005", "START")
+        assert "+15550400005" not in suppressed, "START reply did not lift suppression"
+        print("✅ STOP replies suppress a number and START replies lift it")
+        
+        txt = write(".txt", "+15550400010\n\n+15550400011\nbad\n")
+        csv_path = write(".csv", "name,phone\nA,+15550400012\nB,\nC,+15550400010\n")
+        assert asyncio.run(suppressed.async_import(txt, "phone")) == (2, 1)
+        assert asyncio.run(suppressed.async_import(csv_path, "phone")) == (1, 1)
+        assert len(suppressed) == 4, f"{len(suppressed)} numbers suppressed"
+        print("✅ Text and CSV files are imported")
+        
+        # What was saved is loaded again by a fresh list
+        reloaded = make_list()
+        asyncio.run(reloaded.async_load())
+        assert set(reloaded._numbers) == set(suppressed._numbers), "saved list differs"
+        assert "+15550400012" in reloaded and "+15550400002" not in reloaded
+        print("✅ The list persists across a reload")
+        return True
+    except AssertionError as e:
+        print(f"❌ Suppression list test failed: {e}")
+        return False
+    finally:
+        for path in paths:
+            Path(path).unlink()
+
+def test_admission_shedding():
+    """Test what each shed policy drops when the send queue is full."""
+    print("\n🔍 Testing admission shedding...")
+    
+    import asyncio
+    
+    admission = _load_module('admission')
+    
+    async def scenario(policy, arrivals):
+        # One send holds the only slot while the arrivals queue behind it;
+        # the queue holds 4 sends: 2 low, 3 normal, 4 high or critical
+        controller = admission.AdmissionController(max_active=1, max_queued=4, policy=policy)
+        started, shed = [], {}
+        release = asyncio.Event()
+        
+        async def blocker():
+            async with controller.admit():
+                await release.wait()
+        
+        async def send(name, priority):
+            try:
+                async with controller.admit(priority):
+                    started.append(name)
+            except admission.SendShed as err:
+                shed[name] = err.reason
+        
+        tasks = [asyncio.ensure_future(blocker())]
+        for name, priority in arrivals:
+            tasks.append(asyncio.ensure_future(send(name, priority)))
+            await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks)
+        assert controller.active == controller.queued == 0, f"{policy}: slots leaked"
+        return started, shed, controller.shed
+    
+    normal = [("n1", "normal"), ("n2", "normal"), ("n3", "normal"), ("n4", "normal")]
+    urgent = [("h1", "high"), ("h2", "high")]
+    
+    try:
+        started, shed, counts = asyncio.run(scenario("reject_newest", normal + urgent))
+        assert shed == {"n4": "priority_queue_full", "h2": "queue_full"}, shed
+        assert started == ["h1", "n1", "n2", "n3"], started
+        assert counts["normal"] == 1 and counts["high"] == 1, counts
+        print("✅ reject_newest sheds the sends that do not fit")
+        
+        started, shed, _ = asyncio.run(scenario("drop_oldest", normal + urgent))
+        assert shed == {"n1": "priority_queue_full", "n2": "queue_full"}, shed
+        assert started == ["h1", "h2", "n3", "n4"], started
+        print("✅ drop_oldest sheds the longest waiting sends")
+        
+        arrivals = [
+            ("l1", "low"), ("l2", "low"), ("l3", "low"), ("n1", "normal"), ("n2", "normal"),
+            ("h1", "high"), ("c1", "critical"), ("n3", "normal"),
+        ]
+        started, shed, counts = asyncio.run(scenario("drop_lowest_priority", arrivals))
+        assert shed == {
+            "l3": "priority_queue_full", "l1": "queue_full", "l2": "queue_full", "n3": "queue_full",
+        }, shed
+        assert started == ["c1", "h1", "n1", "n2"], started
+        assert counts == {"low": 3, "normal": 1, "high": 0, "critical": 0}, counts
+        print("✅ drop_lowest_priority sheds lower priorities first, else the new send")
+        
+        async def invalid():
+            controller = admission.AdmissionController(max_active=1, max_queued=4)
+            try:
+                async with controller.admit("urgent"):
+                    pass
+            except ValueError:
+                return controller.active, controller.queued
+            return None
+        
+        assert asyncio.run(invalid()) == (0, 0), "unknown priority admitted"
+        print("✅ An unknown priority is rejected without taking a slot")
+        return True
+    except AssertionError as e:
+        print(f"❌ Admission shedding test failed: {e}")
+        return False
+
+def test_payload_reuse():
+    """Test that retries send the request body encoded for the first attempt."""
+    print("\n🔍 Testing payload reuse across retries...")
+    
+    import asyncio
+    import json
+    from types import SimpleNamespace
+    
+    sys.path.insert(0, 'custom_components')
+    try:
+        import goto_sms  # noqa: F401
+        from goto_sms import notify, payload
+        from goto_sms.records import SendResult
+    except ImportError:
+        print("⚠️  Home Assistant not available, skipping")
+        return True
+    
+    class OAuth:
+        """A token manager whose refreshes always succeed."""
+        
+        config_entry = SimpleNamespace(entry_id="entry")
+        
+        async def get_headers(self):
+            return {"Authorization": "Bearer token"}
+        
+        async def async_refresh_rejected(self, authorization):
+            return True
+    
+    service = notify.GoToSMSNotificationService(SimpleNamespace(data={"goto_sms": {}}), OAuth())
+    posted = []
+    responses = []
+    
+    async def post(url, headers, body, deadline=None):
+        posted.append((body, headers[notify.IDEMPOTENCY_HEADER]))
+        return responses.pop(0)
+    
+    service._async_post = post
+    encodes = []
+    real_json_bytes = payload.json_bytes
+    
+    def counting_json_bytes(value):
+        encodes.append(value)
+        return real_json_bytes(value)
+    
+    payload.json_bytes = counting_json_bytes
+    try:
+        text = 'Door "front" open — 5°C'
+        body = payload.SmsBody(text)
+        encodes.clear()
+        
+        # Two expired tokens, then success: three attempts, one encoding
+        responses[:] = [(401, ""), (401, ""), (200, '{"id": "m1"}')]
+        result = SendResult("+15550500001", "+15550100001", "key-1")
+        sent = asyncio.run(service._post_sms(body, result.target, result.sender_id, result))
+        assert sent and result.attempts == 3, f"sent {sent} after {result.attempts} attempts"
+        assert all(item[0] is posted[0][0] for item in posted), "body re-encoded on retry"
+        assert {item[1] for item in posted} == {"key-1"}, "idempotency key changed"
+        assert text not in [value for value in encodes if isinstance(value, str)], "message text re-encoded"
+        decoded = json.loads(posted[0][0])
+        assert decoded == {
+            "ownerPhoneNumber": "+15550100001", "contactPhoneNumbers": ["+15550500001"], "body": text,
+        }, decoded
+        print("✅ Every attempt posts the same encoded bytes and idempotency key")
+        
+        # A group conversation embeds the same encoded body
+        posted.clear()
+        responses[:] = [(200, '{"id": "m2"}')]
+        result = SendResult("group", "+15550100001", "key-2")
+        contacts = ["+15550500001", "+15550500002"]
+        asyncio.run(service._post_sms(body, "group", result.sender_id, result, contacts=contacts))
+        decoded = json.loads(posted[0][0])
+        assert decoded["contactPhoneNumbers"] == contacts and decoded["body"] == text, decoded
+        assert text not in [value for value in encodes if isinstance(value, str)], "message text re-encoded"
+        print("✅ The message body is encoded once and shared by every request")
+        return True
+    except AssertionError as e:
+        print(f"❌ Payload reuse test failed: {e}")
+        return False
+    finally:
+        payload.json_bytes = real_json_bytes
+
+def test_bulk_resume():
+    """Test that a resumed bulk job skips rows that finished out of order."""
+    print("\n🔍 Testing bulk send resume...")
+    
+    import asyncio
+    import tempfile
+    from types import SimpleNamespace
+    
+    sys.path.insert(0, 'custom_components')
+    try:
+        import goto_sms  # noqa: F401
+        from goto_sms import bulk
+    except ImportError:
+        print("⚠️  Home Assistant not available, skipping")
+        return True
+    
+    class Service:
+        """Sends instantly except to the targets in stall."""
+        
+        def __init__(self, stall):
+            self.stall = stall
+            self.sent = []
+        
+        def _is_suppressed(self, target):
+            return False
+        
+        async def _async_send(self, message, target, *args, **kwargs):
+            if target in self.stall:
+                await asyncio.Event().wait()
+            self.sent.append(target)
+            return SimpleNamespace(sent=True, status="sent")
+    
+    hass = SimpleNamespace(
+        async_add_executor_job=_run_inline,
+        bus=SimpleNamespace(async_fire=lambda *args: None),
+    )
+    targets = [f"+1555030{i:04d}" for i in range(12)]
+    store = _MemoryStore()
+    
+    def make_job(service):
+        job = bulk.BulkSendJob(
+            hass, service, "resume", path, SimpleNamespace(render_many=lambda rows: ("Hi" for _ in rows)),
+            "+15550100001", "phone", max_in_flight=4,
+        )
+        job._store = store
+        return job
+    
+    async def run():
+        # Rows 0 and 5 stall while the rows after them finish; then stop
+        first = Service({targets[0], targets[5]})
+        job = make_job(first)
+        task = asyncio.ensure_future(job.async_run())
+        for _ in range(50):
+            await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        
+        second = Service(set())
+        job = make_job(second)
+        await job.async_run()
+        return first.sent, second.sent, job
+    
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as handle:
+        handle.write("phone\n" + "\n".join(targets) + "\n")
+        path = handle.name
+    try:
+        first, second, job = asyncio.run(run())
+        assert len(first) == 10, f"first run sent {len(first)} rows"
+        assert sorted(second) == [targets[0], targets[5]], f"resume sent {second}"
+        assert job.sent == len(targets), f"counted {job.sent} sent"
+        print("✅ Resume sends only rows that had not finished")
+        print("✅ Rows finished past the checkpoint are counted once")
+        return True
+    except AssertionError as e:
+        print(f"❌ Bulk resume test failed: {e}")
+        return False
+    finally:
+        Path(path).unlink()
+
 def main():
     """Run all tests."""
     print("🚀 GoTo SMS Integration Test Suite")
@@ -246,6 +1032,15 @@ def main():
         ("YAML Files", test_yaml_files),
         ("Notify Logic", test_notify_logic),
         ("Authentication Persistence", test_authentication_persistence),
+        ("Conversation Ordering", test_conversation_ordering),
+        ("Routing Rules", test_routing_rules),
+        ("Sender Pools Across Updates", test_token_save_keeps_pools),
+        ("Bulk Resume", test_bulk_resume),
+        ("Adaptive Concurrency", test_adaptive_concurrency),
+        ("Retry Budget", test_retry_budget),
+        ("Suppression List", test_suppression_list),
+        ("Admission Shedding", test_admission_shedding),
+        ("Payload Reuse", test_payload_reuse),
     ]
     
     results = []
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark the AIMD concurrency limiter against fixed limits.
+The stub server's capacity drops partway through the run and then
+recovers; a good limiter keeps throughput high while avoiding 429s.
+
+Usage:
+    python tools/bench_adaptive_concurrency.py [--phase 5] [--workers 100]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components"))
+
+from goto_sms.concurrency import AdaptiveConcurrencyLimiter  # noqa: E402
+from goto_sms.const import DOMAIN  # noqa: E402
+from harness import Harness  # noqa: E402
+from stub_server import StubGoToServer  # noqa: E402
+
+CAPACITIES = (32, 8, 32)
+
+
+async def run(name, limiter, phase, workers):
+    """Drive a closed-loop workload through one limiter."""
+    server = StubGoToServer(latency=0.02, capacity=CAPACITIES[0])
+    url = await server.start()
+    latencies = []
+    trace = []
+
+    try:
+        async with Harness(url) as harness:
+            harness.hass.data[DOMAIN][f"{harness.entry.entry_id}_limiter"] = limiter
+            end = time.monotonic() + phase * len(CAPACITIES)
+
+            async def worker(n):
+                while time.monotonic() < end:
+                    start = time.monotonic()
+                    if await harness.service._send_sms(
+                        "Benchmark", f"+1555040{n:04d}", "+15550100001"
+                    ):
+                        latencies.append(time.monotonic() - start)
+
+            async def schedule():
+                for capacity in CAPACITIES:
+                    server.capacity = capacity
+                    for _ in range(int(phase / 0.5)):
+                        trace.append(limiter.limit)
+                        await asyncio.sleep(0.5)
+
+            start = time.monotonic()
+            await asyncio.gather(schedule(), *(worker(n) for n in range(workers)))
+            elapsed = time.monotonic() - start
+    finally:
+        await server.stop()
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0
+    per_phase = len(trace) // len(CAPACITIES)
+    limits = "/".join(
+        f"{sum(trace[i:i + per_phase]) / per_phase:.0f}"
+        for i in range(0, per_phase * len(CAPACITIES), per_phase)
+    )
+    print(
+        f"  {name:10} {server.accepted / elapsed:7.1f} msg/s  "
+        f"429s={server.rate_limited:<5} p95={p95 * 1000:7.1f} ms  "
+        f"avg limit per phase={limits}"
+    )
+
+
+async def main():
+    """Run the benchmark for each strategy."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--phase", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=100)
+    args = parser.parse_args()
+
+    print(
+        f"🚀 Concurrency benchmark, stub capacity "
+        f"{' -> '.join(map(str, CAPACITIES))} every {args.phase:g}s"
+    )
+    strategies = {
+        "fixed 4": AdaptiveConcurrencyLimiter(4, min_limit=4, max_limit=4),
+        "fixed 32": AdaptiveConcurrencyLimiter(32, min_limit=32, max_limit=32),
+        "adaptive": AdaptiveConcurrencyLimiter(4, max_limit=64),
+    }
+    for name, limiter in strategies.items():
+        await run(name, limiter, args.phase, args.workers)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark admission control under a sensor storm. Messages arrive faster
+than the stub accepts them, 10% at high priority and the rest at low.
+Without a bound every pending send stays alive and latency keeps growing;
+with one, memory and latency stay flat and the excess is shed.
+
+Usage:
+    python tools/bench_admission.py [--rate 1000] [--seconds 3]
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from harness import Harness
+from stub_server import StubGoToServer
+
+STRATEGIES = {
+    "unbounded": {"max_active_sends": 10**9, "max_queued_sends": 10**9},
+    "reject_newest": {"shed_policy": "reject_newest"},
+    "drop_oldest": {"shed_policy": "drop_oldest"},
+    "drop_lowest": {"shed_policy": "drop_lowest_priority"},
+}
+
+
+async def run(name, options, rate, seconds):
+    """Drive one storm through the integration and report the outcome."""
+    server = StubGoToServer(latency=0.02)
+    url = await server.start()
+    options = {
+        "max_concurrency": 8,
+        "max_active_sends": 50,
+        "max_queued_sends": 200,
+        **options,
+    }
+    latencies = {"high": [], "low": []}
+    outcomes = {}
+    pending = set()
+    peak_pending = 0
+
+    async def send(n, priority):
+        start = time.monotonic()
+        result = await harness.service._async_send(
+            "Storm", f"+1555080{n % 5000:04d}", "+15550100001", priority=priority
+        )
+        outcomes[result.status] = outcomes.get(result.status, 0) + 1
+        if result.sent:
+            latencies[priority].append(time.monotonic() - start)
+
+    try:
+        async with Harness(url, options) as harness:
+            tracemalloc.start()
+            start = time.monotonic()
+            for n in range(int(rate * seconds)):
+                priority = "high" if n % 10 == 0 else "low"
+                task = asyncio.create_task(send(n, priority))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                peak_pending = max(peak_pending, len(pending))
+                # Keep the arrival rate, yielding so sends make progress
+                delay = start + (n + 1) / rate - time.monotonic()
+                await asyncio.sleep(max(0, delay))
+            await asyncio.gather(*pending)
+            elapsed = time.monotonic() - start
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    finally:
+        await server.stop()
+
+    def p95(values):
+        values.sort()
+        return values[int(len(values) * 0.95) - 1] * 1000 if values else 0
+
+    print(
+        f"  {name:13} sent={outcomes.get('sent', 0):<5} "
+        f"shed={outcomes.get('shed', 0):<5} peak pending={peak_pending:<5} "
+        f"peak mem={peak_memory / 1e6:5.1f} MB  "
+        f"p95 high={p95(latencies['high']):7.1f} ms "
+        f"low={p95(latencies['low']):7.1f} ms  drained in {elapsed:.1f}s"
+    )
+
+
+async def main():
+    """Run the storm for each strategy."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=float, default=1000.0)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(
+        f"🚀 Admission benchmark: {args.rate:g} msg/s for {args.seconds:g}s "
+        f"against a stub limited to 8 concurrent requests"
+    )
+    for name, options in STRATEGIES.items():
+        await run(name, options, args.rate, args.seconds)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark message deadlines on a backlog. A burst of alerts arrives at
+once for a single sender number that the stub rate-limits, as after an
+outage, and a fresh alert follows a few seconds later. The number is a
+one-member sender pool paced at the stub's rate. Without a ttl every
+alert is delivered, most of them late, and the fresh alert waits behind
+the backlog; with a ttl stale alerts expire and the fresh one goes out
+as soon as the pacing allows.
+
+Usage:
+    python tools/bench_deadline.py [--backlog 40] [--rate 2] [--ttl 5]
+        [--fresh-after 3]
+"""
+
+import argparse
+import asyncio
+import time
+
+from harness import Harness
+from stub_server import StubGoToServer
+
+
+async def send(harness, number, ttl):
+    """Send one alert and return its result and when it finished."""
+    deadline = time.monotonic() + ttl if ttl else None
+    results = await harness.service._send_to_targets(
+        "Front door opened",
+        number,
+        "alerts",
+        None,
+        "normal",
+        "individual",
+        deadline,
+    )
+    return results[0], time.monotonic()
+
+
+async def run(backlog, rate, ttl, fresh_after, late_after):
+    """Send the backlog and the fresh alert; return what happened."""
+    server = StubGoToServer(rate=rate, latency=0.02)
+    url = await server.start()
+    options = {"sender_pools": "alerts: +15550100001", "sender_rate": rate}
+
+    try:
+        async with Harness(url, options) as harness:
+            start = time.monotonic()
+            stale = [
+                asyncio.create_task(send(harness, f"+1555030{i:04d}", ttl))
+                for i in range(backlog)
+            ]
+            await asyncio.sleep(fresh_after)
+            fresh_start = time.monotonic()
+            fresh, fresh_done = await send(harness, "+15550399999", ttl)
+            done = await asyncio.gather(*stale)
+            elapsed = time.monotonic() - start
+            expired = harness.metrics.get("expired")
+    finally:
+        await server.stop()
+
+    sent = [finished - start for result, finished in done if result.sent]
+    return {
+        "sent": len(sent),
+        "expired": expired,
+        "late": sum(1 for age in sent if age > late_after),
+        "oldest": max(sent, default=0.0),
+        "fresh": fresh.status,
+        "fresh_latency": fresh_done - fresh_start,
+        "requests": server.stats()["accepted"],
+        "elapsed": elapsed,
+    }
+
+
+async def main():
+    """Compare the backlog with and without a ttl."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backlog", type=int, default=40)
+    parser.add_argument("--rate", type=float, default=2.0, help="stub msg/s")
+    parser.add_argument("--ttl", type=float, default=5.0, help="seconds")
+    parser.add_argument("--fresh-after", type=float, default=3.0, help="seconds")
+    args = parser.parse_args()
+
+    print(
+        f"🚀 Backlog of {args.backlog} alerts at {args.rate:g} msg/s, "
+        f"fresh alert after {args.fresh_after:g}s"
+    )
+    for ttl in (None, args.ttl):
+        stats = await run(args.backlog, args.rate, ttl, args.fresh_after, args.ttl)
+        label = f"ttl {ttl:g}s" if ttl else "no ttl"
+        print(
+            f"  {label:8} sent={stats['sent']:<3} expired={stats['expired']:<3} "
+            f"late={stats['late']:<3} oldest={stats['oldest']:5.1f}s  "
+            f"fresh alert {stats['fresh']} in {stats['fresh_latency']:5.2f}s  "
+            f"requests={stats['requests']} total {stats['elapsed']:5.1f}s"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
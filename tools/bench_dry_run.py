@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Measure the integration's own per-message overhead with dry run enabled.
+Every send goes through target resolution, ordering, the retry budget,
+the concurrency limiter and metrics, then ends in the in-process sink
+instead of the GoTo API, so no stub server or SMS credit is needed.
+
+Usage:
+    python tools/bench_dry_run.py [--messages 5000] [--latency 0]
+"""
+
+import argparse
+import asyncio
+import time
+
+from harness import Harness
+
+
+async def main():
+    """Send a batch through the dry-run sink and report the overhead."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--latency", type=int, default=0, help="sink latency, ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="percent")
+    args = parser.parse_args()
+
+    options = {
+        "dry_run": True,
+        "dry_run_latency": args.latency,
+        "dry_run_error_rate": args.error_rate,
+        "max_concurrency": 256,
+        "max_active_sends": 256,
+        "max_queued_sends": args.messages,
+    }
+    async with Harness("http://127.0.0.1:9", options) as harness:
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                harness.service._send_sms("Dry run", f"+1555070{i:04d}", "+15550100001")
+                for i in range(args.messages)
+            )
+        )
+        elapsed = time.perf_counter() - start
+        stats = harness.dry_run.stats()
+
+    print(f"🚀 Dry run: {args.messages} messages, sink latency {args.latency} ms")
+    print(
+        f"  sent={sum(results)} sink accepted={stats['dry_run_accepted']} "
+        f"errors={stats['dry_run_errors']}"
+    )
+    print(
+        f"  {args.messages / elapsed:8.0f} msg/s  "
+        f"{elapsed / args.messages * 1e6:6.1f} µs/message end to end"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
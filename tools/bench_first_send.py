@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark the latency of the first SMS after a restart. Two stub servers
+stand in for the auth and API hosts, each charging a connection setup
+delay for DNS and TLS, and the stored token has expired. Compares a cold
+first send, a send after startup validation refreshed the token, and a
+send after the connection warm-up finished as well.
+
+Usage:
+    python tools/bench_first_send.py [--runs 5] [--connect 0.1] [--token 0.15]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components"))
+
+from goto_sms.startup import StartupValidator  # noqa: E402
+from goto_sms.warmup import async_prewarm  # noqa: E402
+from harness import Harness  # noqa: E402
+from stub_server import StubGoToServer  # noqa: E402
+
+
+async def first_send(scenario, connect, token):
+    """Restart, optionally validate and warm up, and time the first send."""
+    auth = StubGoToServer(connect_latency=connect, token_latency=token)
+    api = StubGoToServer(latency=0.02, connect_latency=connect)
+    api._tokens = auth._tokens  # Accept the tokens the auth stub issues
+    auth_url = await auth.start()
+    api_url = await api.start()
+    try:
+        async with Harness(api_url, token_ttl=0, auth_url=auth_url) as harness:
+            if scenario != "cold":
+                validator = StartupValidator(harness.hass)
+                harness.service.oauth_manager = await validator.async_validate(
+                    harness.entry
+                )
+            if scenario == "warm":
+                await async_prewarm(harness.hass, {})
+
+            start = time.monotonic()
+            sent = await harness.service._send_sms(
+                "Power restored", "+15550300001", "+15550100001"
+            )
+            latency = time.monotonic() - start
+    finally:
+        await auth.stop()
+        await api.stop()
+    assert sent
+    return latency, auth.token_requests, auth.connections + api.connections
+
+
+async def main():
+    """Run each scenario several times and report the medians."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--connect", type=float, default=0.1, help="seconds")
+    parser.add_argument("--token", type=float, default=0.15, help="seconds")
+    args = parser.parse_args()
+
+    print(
+        f"🚀 First send after restart: expired token, {args.connect * 1000:.0f} ms "
+        f"connection setup per host, {args.token * 1000:.0f} ms token refresh"
+    )
+    for scenario in ("cold", "validated", "warm"):
+        runs = [
+            await first_send(scenario, args.connect, args.token)
+            for _ in range(args.runs)
+        ]
+        latency = statistics.median(run[0] for run in runs)
+        print(
+            f"  {scenario:9} first send {latency * 1000:7.1f} ms  "
+            f"token refreshes={max(run[1] for run in runs)} "
+            f"connections={max(run[2] for run in runs)}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark group mode against per-recipient fan-out on the stub server.
+Each team size is sent once with mode individual (one POST per recipient)
+and once with mode group (one POST per group of up to 10), from a single
+sender number that the stub rate-limits. The number is a one-member sender
+pool paced at the stub's rate, as a real deployment would configure it.
+The run reports wall time, API requests, attempts, 429s and how many
+recipients were reached.
+
+Usage:
+    python tools/bench_group_send.py [--sizes 10,50,200] [--rate 10]
+        [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import time
+
+from harness import Harness
+from stub_server import StubGoToServer
+
+
+async def run(size, mode, rate, latency):
+    """Send one message to a team of size recipients in mode."""
+    server = StubGoToServer(rate=rate, latency=latency)
+    url = await server.start()
+    team = ",".join(f"+1555030{i:04d}" for i in range(size))
+    options = {"sender_pools": "team: +15550100001", "sender_rate": rate}
+
+    try:
+        async with Harness(url, options) as harness:
+            start = time.perf_counter()
+            results = await harness.service._send_to_targets(
+                "Team notice: the on-call rotation changes at 18:00",
+                team,
+                "team",
+                None,
+                "normal",
+                mode,
+            )
+            elapsed = time.perf_counter() - start
+            attempts = harness.metrics.get("attempts")
+    finally:
+        await server.stop()
+
+    reached = sum(1 for result in results if result.sent)
+    return reached, elapsed, attempts, server.stats()
+
+
+async def main():
+    """Compare both modes for each team size."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10,50,200")
+    parser.add_argument("--rate", type=float, default=10.0, help="stub msg/s")
+    parser.add_argument("--latency", type=float, default=0.05, help="stub latency, s")
+    args = parser.parse_args()
+
+    print(
+        f"🚀 Group vs individual sends ({args.rate:g} requests/s per sender, "
+        f"{args.latency * 1000:.0f} ms latency)"
+    )
+    for size in map(int, args.sizes.split(",")):
+        for mode in ("individual", "group"):
+            reached, elapsed, attempts, stats = await run(
+                size, mode, args.rate, args.latency
+            )
+            print(
+                f"  {size:>4} recipients {mode:<10} reached={reached:<4} "
+                f"{elapsed:6.2f}s  requests={stats['accepted']:<4} "
+                f"attempts={attempts:<4} 429s={stats['rate_limited']}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
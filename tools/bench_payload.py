@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark request body encoding for 1-10 segment SMS bodies.
+Compares a stdlib json.dumps per attempt (what aiohttp's json= does),
+orjson per attempt, and the integration's pre-serialized payloads, which
+encode the body once per message and reuse the bytes for every recipient
+and retry.
+
+Usage:
+    python tools/bench_payload.py [--recipients 1,10] [--attempts 1,3]
+"""
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components"))
+
+from goto_sms.payload import SmsBody, sms_payload  # noqa: E402
+from homeassistant.helpers.json import json_bytes  # noqa: E402
+
+SENDER = "+15550100001"
+WORDS = (
+    "alarm door garage temperature humidity sensor basement kitchen battery low "
+    'open closed motion detected at since minutes ago please check "front" '
+    "water leak 21.5°C 45% ok"
+).split()
+
+
+def body(segments, unicode):
+    """Return a message of about segments SMS segments."""
+    # Concatenated segments carry 153 GSM-7 or 67 UCS-2 characters each
+    length = segments * (67 if unicode else 153)
+    rng = random.Random(segments)
+    text = ""
+    while len(text) < length:
+        text += rng.choice(WORDS) + ("\n" if rng.random() < 0.05 else " ")
+    if unicode:
+        text = "🚨 " + text
+    return text[:length]
+
+
+def stdlib(message, targets, attempts):
+    """Encode a dict per attempt with the stdlib encoder."""
+    for target in targets:
+        for _ in range(attempts):
+            payload = {
+                "ownerPhoneNumber": SENDER,
+                "contactPhoneNumbers": [target],
+                "body": message,
+            }
+            json.dumps(payload).encode()
+
+
+def orjson_dict(message, targets, attempts):
+    """Encode a dict per attempt with orjson."""
+    for target in targets:
+        for _ in range(attempts):
+            payload = {
+                "ownerPhoneNumber": SENDER,
+                "contactPhoneNumbers": [target],
+                "body": message,
+            }
+            json_bytes(payload)
+
+
+def preserialized(message, targets, attempts):
+    """Encode the body once and each recipient's payload once."""
+    encoded = SmsBody(message)
+    for target in targets:
+        payload = sms_payload(SENDER, target, encoded)
+        for _ in range(attempts):
+            len(payload)
+
+
+STRATEGIES = {
+    "stdlib": stdlib,
+    "orjson": orjson_dict,
+    "pre-serialized": preserialized,
+}
+
+
+def main():
+    """Time each strategy over every body size and scenario."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recipients", default="1,10")
+    parser.add_argument("--attempts", default="1,3")
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    # Every strategy must put the same JSON on the wire
+    message = body(3, True)
+    expected = {
+        "ownerPhoneNumber": SENDER,
+        "contactPhoneNumbers": ["+15550300001"],
+        "body": message,
+    }
+    assert json.loads(sms_payload(SENDER, "+15550300001", SmsBody(message))) == expected
+
+    print("🚀 Payload encoding, µs per logical message")
+    for recipients in map(int, args.recipients.split(",")):
+        targets = [f"+1555030{i:04d}" for i in range(recipients)]
+        for attempts in map(int, args.attempts.split(",")):
+            print(f"  {recipients} recipient(s), {attempts} attempt(s) each")
+            print(f"    {'segments':>10} " + " ".join(f"{n:>15}" for n in STRATEGIES))
+            for segments in (1, 2, 5, 10):
+                for unicode in (False, True):
+                    message = body(segments, unicode)
+                    timings = [
+                        timeit.timeit(
+                            lambda fn=fn: fn(message, targets, attempts),
+                            number=args.number,
+                        )
+                        / args.number
+                        * 1e6
+                        for fn in STRATEGIES.values()
+                    ]
+                    label = f"{segments}{' ucs2' if unicode else ''}"
+                    print(f"    {label:>10} " + " ".join(f"{t:15.2f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
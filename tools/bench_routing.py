@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark routing rule evaluation.
+Compares trying each parsed rule in order, checking its conditions one by
+one, with RoutingRules.match, which looks up one bitmask per indexed field
+and picks the first rule left. Also reports how long compiling takes, which
+happens only when the options change.
+
+Usage:
+    python tools/bench_routing.py [--rules 200] [--events 100000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components"))
+
+from goto_sms.routing import RoutingRules, parse_rules  # noqa: E402
+
+SEVERITIES = ["info", "warning", "critical"]
+AREAS = [f"area_{i}" for i in range(40)]
+EVENTS = [f"event_{i}" for i in range(25)]
+
+
+def make_rules(count):
+    """Build rules for areas, some narrowed by severity or event, and a catch-all."""
+    rng = random.Random(1)
+    lines = []
+    for i in range(count - 1):
+        conditions = [f"area={rng.choice(AREAS)}|{rng.choice(AREAS)}"]
+        if i % 2:
+            conditions.append(f"severity={rng.choice(SEVERITIES)}")
+        if i % 3 == 0:
+            conditions.append(f"event={rng.choice(EVENTS)}")
+        lines.append(
+            f"{', '.join(conditions)} -> target: group_{i}; sender_id: pool_{i % 4}"
+        )
+    lines.append("* -> target: everyone")
+    return "\n".join(lines)
+
+
+def make_events(count):
+    """Build the data of one notification per event."""
+    rng = random.Random(2)
+    return [
+        {
+            "severity": rng.choice(SEVERITIES),
+            "area": rng.choice(AREAS),
+            "event": rng.choice(EVENTS),
+            "entity_id": f"binary_sensor.sensor_{i % 100}",
+        }
+        for i in range(count)
+    ]
+
+
+def linear(rules, events):
+    """Try each rule in order, as a naive rules engine would."""
+    routes = []
+    for data in events:
+        for rule in rules:
+            if all(
+                str(data.get(field, "")).lower() in values
+                for field, values in rule.conditions
+            ):
+                routes.append(rule.route)
+                break
+        else:
+            routes.append(None)
+    return routes
+
+
+def compiled(routing, events):
+    """Match with the compiled indexes."""
+    return [routing.match(data) for data in events]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rules", type=int, default=200)
+    parser.add_argument("--events", type=int, default=100000)
+    args = parser.parse_args()
+
+    text = make_rules(args.rules)
+    events = make_events(args.events)
+
+    start = time.perf_counter()
+    routing = RoutingRules(text)
+    compile_ms = (time.perf_counter() - start) * 1000
+    rules = parse_rules(text)
+
+    print(f"🚀 Routing {args.events} notifications through {args.rules} rules")
+    print(f"  compile      {compile_ms:8.2f} ms (only when the options change)")
+    results = {}
+    for name, func, arg in (("linear", linear, rules), ("compiled", compiled, routing)):
+        start = time.perf_counter()
+        routes = func(arg, events)
+        elapsed = time.perf_counter() - start
+        results[name] = (elapsed, routes)
+        print(
+            f"  {name:12} {elapsed * 1000:8.1f} ms "
+            f"({elapsed / args.events * 1e6:6.2f} µs/message)"
+        )
+
+    assert results["linear"][1] == results["compiled"][1], "routes differ"
+    print(f"  speedup      {results['linear'][0] / results['compiled'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark sender pool throughput against the stub GoTo server.
+The stub limits each sender number to --rate messages per second, so
+aggregate throughput should grow roughly linearly with the pool size.
+
+Usage:
+    python tools/bench_sender_pool.py [--rate 20] [--seconds 3]
+"""
+
+import argparse
+import asyncio
+import time
+
+from harness import Harness
+from stub_server import StubGoToServer
+
+
+async def run(pool_size, rate, seconds):
+    """Send a burst through a pool of pool_size numbers and time it."""
+    server = StubGoToServer(rate=rate, latency=0.01)
+    url = await server.start()
+    numbers = [f"+1555020{i:04d}" for i in range(pool_size)]
+    options = {
+        "sender_pools": f"bench: {', '.join(numbers)}",
+        "sender_rate": rate,
+    }
+    count = int(rate * pool_size * seconds)
+
+    try:
+        async with Harness(url, options) as harness:
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(
+                    harness.service._send_sms("Benchmark", f"+1555030{i:04d}", "bench")
+                    for i in range(count)
+                )
+            )
+            elapsed = time.perf_counter() - start
+    finally:
+        await server.stop()
+
+    return count, sum(results), elapsed, server.stats()
+
+
+async def main():
+    """Run the benchmark for several pool sizes."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=float, default=20.0)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--sizes", default="1,2,4,8")
+    args = parser.parse_args()
+
+    print(f"🚀 Sender pool benchmark ({args.rate:g} msg/s per number)")
+    baseline = None
+    for size in (int(s) for s in args.sizes.split(",")):
+        count, sent, elapsed, stats = await run(size, args.rate, args.seconds)
+        throughput = sent / elapsed
+        baseline = baseline or throughput
+        print(
+            f"  pool={size:<2} sent={sent}/{count} "
+            f"{throughput:7.1f} msg/s  scaling={throughput / baseline:4.2f}x  "
+            f"429s={stats['rate_limited']}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
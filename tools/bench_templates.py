@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark personalized message rendering.
+Compares building a Template per message (the old _render_template path)
+with MessageTemplate.render_many, which compiles once and renders many.
+
+Usage:
+    python tools/bench_templates.py [--count 10000]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components"))
+
+from goto_sms.templates import MessageTemplate  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers.template import Template  # noqa: E402
+
+MESSAGE = (
+    "Hi {{ name }}, water to unit {{ unit }} will be off on {{ date }} "
+    "from {{ start }} to {{ end }}. {% if vip %}Call us on {{ phone }}.{% endif %}"
+)
+
+
+def make_rows(count):
+    """Build one variables dict per recipient."""
+    return [
+        {
+            "name": f"Tenant {i}",
+            "unit": f"{i % 40}{'ABCD'[i % 4]}",
+            "date": "Tuesday",
+            "start": "9am",
+            "end": "11am",
+            "vip": i % 10 == 0,
+            "phone": "+15550100000",
+        }
+        for i in range(count)
+    ]
+
+
+def per_message(hass, rows):
+    """Render the way _render_template used to: a new Template per message."""
+    return [Template(MESSAGE, hass).async_render(row) for row in rows]
+
+
+def render_many(hass, rows):
+    """Compile once and stream the renders."""
+    return list(MessageTemplate(hass, MESSAGE).render_many(rows))
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        rows = make_rows(args.count)
+
+        print(f"🚀 Rendering {args.count} personalized messages")
+        results = {}
+        for name, func in (("per-message", per_message), ("render_many", render_many)):
+            func(hass, rows[:100])  # warm up
+            start = time.perf_counter()
+            rendered = func(hass, rows)
+            elapsed = time.perf_counter() - start
+            results[name] = elapsed
+            print(
+                f"  {name:12} {elapsed * 1000:8.1f} ms "
+                f"({elapsed / args.count * 1e6:6.1f} µs/message)"
+            )
+            assert len(rendered) == args.count
+
+        print(f"  speedup      {results['per-message'] / results['render_many']:.1f}x")
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Check that retries after lost responses never deliver a message twice.
+The stub server accepts each message and then drops a fraction of the
+responses, so the integration retries messages that were already sent.
+Run once with the stub honoring Idempotency-Key and once ignoring it.
+
+Usage:
+    python tools/check_duplicates.py [--messages 200] [--drop-rate 0.2]
+"""
+
+import argparse
+import asyncio
+import sys
+
+from harness import Harness
+from stub_server import StubGoToServer
+
+
+async def run(messages, drop_rate, idempotent):
+    """Send messages through a lossy stub and return its stats."""
+    server = StubGoToServer(latency=0.01, drop_rate=drop_rate, idempotent=idempotent)
+    url = await server.start()
+    try:
+        # Retries are safe with keys, so let every lost response be retried
+        async with Harness(url, {"retry_budget": 100}) as harness:
+            results = await asyncio.gather(
+                *(
+                    harness.service._send_sms(
+                        "Check", f"+1555060{i:04d}", "+15550100001"
+                    )
+                    for i in range(messages)
+                )
+            )
+    finally:
+        await server.stop()
+    return sum(results), server.stats()
+
+
+async def main():
+    """Run the check with and without idempotency on the server."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--drop-rate", type=float, default=0.2)
+    args = parser.parse_args()
+
+    print(
+        f"🚀 Duplicate check ({args.messages} messages, "
+        f"{args.drop_rate:.0%} of responses lost)"
+    )
+    failed = False
+    for idempotent in (False, True):
+        sent, stats = await run(args.messages, args.drop_rate, idempotent)
+        label = "keys honored" if idempotent else "keys ignored"
+        print(
+            f"  {label:13} sent={sent}/{args.messages} "
+            f"delivered={stats['accepted']} dropped={stats['dropped']} "
+            f"replayed={stats['replayed']} duplicates={stats['duplicates']}"
+        )
+        failed |= idempotent and stats["duplicates"] > 0
+
+    print("❌ Duplicates delivered" if failed else "✅ No duplicates with keys")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,141 @@
+"""
+Minimal Home Assistant harness for benchmarking goto_sms against the stub
+server. Builds a real config entry, OAuth manager and notify service with
+the API and token URLs pointed at the stub.
+"""
+
+import logging
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components"))
+
+import goto_sms  # noqa: E402
+from goto_sms import notify, numbers, oauth, warmup  # noqa: E402
+from goto_sms.admission import AdmissionController  # noqa: E402
+from goto_sms.concurrency import AdaptiveConcurrencyLimiter  # noqa: E402
+from goto_sms.const import (  # noqa: E402
+    DEFAULT_MAX_ACTIVE_SENDS,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_QUEUED_SENDS,
+    DEFAULT_SHED_POLICY,
+    DOMAIN,
+)
+from goto_sms.dryrun import DryRunSink  # noqa: E402
+from goto_sms.metrics import SendMetrics  # noqa: E402
+from goto_sms.oauth import GoToOAuth2Manager  # noqa: E402
+from goto_sms.ordering import KeyedSerializer  # noqa: E402
+from goto_sms.records import OutboundRecords  # noqa: E402
+from goto_sms.retrybudget import RetryBudget  # noqa: E402
+from goto_sms.suppression import SuppressionList  # noqa: E402
+from goto_sms.usage import UsageTracker  # noqa: E402
+from homeassistant.config_entries import ConfigEntries, ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from stub_server import INITIAL_TOKEN  # noqa: E402
+
+
+class Harness:
+    """A Home Assistant instance with one goto_sms entry."""
+
+    def __init__(self, base_url, options=None, token_ttl=3600, auth_url=None):
+        """Initialize the harness.
+
+        token_ttl is the lifetime in seconds of the initial access token.
+        auth_url serves the token endpoint if it is not at base_url.
+        """
+        self.base_url = base_url
+        self.auth_url = auth_url or base_url
+        self.options = options or {}
+        self.token_ttl = token_ttl
+        self._tmp = tempfile.TemporaryDirectory()
+        self.hass = None
+        self.entry = None
+        self.service = None
+
+    async def __aenter__(self):
+        """Start Home Assistant and build the entry."""
+        logging.getLogger("custom_components.goto_sms").setLevel(logging.CRITICAL)
+        logging.getLogger("goto_sms").setLevel(logging.CRITICAL)
+
+        notify.GOTO_API_BASE_URL = self.base_url
+        numbers.GOTO_API_BASE_URL = self.base_url
+        oauth.OAUTH2_TOKEN_URL = f"{self.auth_url}/oauth/token"
+        warmup.GOTO_API_BASE_URL = self.base_url
+        warmup.OAUTH2_TOKEN_URL = oauth.OAUTH2_TOKEN_URL
+
+        self.hass = hass = HomeAssistant(self._tmp.name)
+        hass.config_entries = ConfigEntries(hass, {})
+        self.entry = ConfigEntry(
+            version=1,
+            minor_version=1,
+            domain=DOMAIN,
+            title="GoTo SMS (stub)",
+            data={
+                "client_id": "stub",
+                "client_secret": "stub",
+                "tokens": {
+                    "access_token": INITIAL_TOKEN,
+                    "refresh_token": "stub-refresh-token",
+                    "token_expires_at": (
+                        datetime.now() + timedelta(seconds=self.token_ttl)
+                    ).isoformat(),
+                },
+            },
+            source="user",
+            options=self.options,
+        )
+        hass.config_entries._entries[self.entry.entry_id] = self.entry
+
+        entry_id = self.entry.entry_id
+        hass.data[DOMAIN] = {entry_id: self.entry.data}
+        oauth_manager = GoToOAuth2Manager(hass, self.entry)
+        hass.data[DOMAIN][f"{entry_id}_oauth"] = oauth_manager
+        hass.data[DOMAIN][f"{entry_id}_outbound"] = OutboundRecords()
+        goto_sms._async_build_groups(hass, self.entry)
+        goto_sms._async_build_sender_pools(hass, self.entry)
+        goto_sms._async_build_routing(hass, self.entry)
+        self.metrics = hass.data[DOMAIN][f"{entry_id}_metrics"] = SendMetrics()
+        self.limiter = AdaptiveConcurrencyLimiter(
+            max_limit=self.options.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        )
+        hass.data[DOMAIN][f"{entry_id}_limiter"] = self.limiter
+        self.metrics.add_source("limiter", self.limiter.stats)
+        self.admission = AdmissionController(
+            self.options.get("max_active_sends", DEFAULT_MAX_ACTIVE_SENDS),
+            self.options.get("max_queued_sends", DEFAULT_MAX_QUEUED_SENDS),
+            self.options.get("shed_policy", DEFAULT_SHED_POLICY),
+        )
+        hass.data[DOMAIN][f"{entry_id}_admission"] = self.admission
+        self.metrics.add_source("admission", self.admission.stats)
+        self.ordering = KeyedSerializer()
+        hass.data[DOMAIN][f"{entry_id}_ordering"] = self.ordering
+        self.metrics.add_source("ordering", self.ordering.stats)
+        self.retry_budget = RetryBudget(self.options.get("retry_budget", 20))
+        hass.data[DOMAIN][f"{entry_id}_retry_budget"] = self.retry_budget
+        self.metrics.add_source("retry_budget", self.retry_budget.stats)
+        self.suppression = SuppressionList(hass, entry_id)
+        hass.data[DOMAIN][f"{entry_id}_suppression"] = self.suppression
+        self.usage = UsageTracker(hass, entry_id)
+        self.usage.configure(
+            self.options.get("monthly_segment_budget", 0),
+            self.options.get("budget_hard_cap", False),
+        )
+        hass.data[DOMAIN][f"{entry_id}_usage"] = self.usage
+        self.metrics.add_source("usage", self.usage.stats)
+        self.dry_run = DryRunSink(
+            self.options.get("dry_run", False),
+            self.options.get("dry_run_latency", 200),
+            self.options.get("dry_run_error_rate", 0),
+        )
+        hass.data[DOMAIN][f"{entry_id}_dry_run"] = self.dry_run
+        self.metrics.add_source("dry_run", self.dry_run.stats)
+
+        self.service = notify.GoToSMSNotificationService(hass, oauth_manager)
+        return self
+
+    async def __aexit__(self, *exc):
+        """Stop Home Assistant."""
+        await self.hass.async_stop(force=True)
+        self._tmp.cleanup()
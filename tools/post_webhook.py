@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Post captured GoTo notification payloads to a Home Assistant webhook.
+This lets the webhook receiver be exercised without a GoTo subscription.
+
+Usage:
+    python tools/post_webhook.py http://localhost:8123 <webhook_id> \\
+        tools/payloads/inbound_message.json tools/payloads/message_status.json
+"""
+
+import argparse
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+
+def post_payload(url: str, body: bytes) -> tuple:
+    """POST a raw JSON body and return (status, elapsed seconds)."""
+    request = urllib.request.Request(
+        url,
+        data=body,
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    return status, time.perf_counter() - start
+
+
+def main():
+    """Post each payload file to the webhook."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "base_url", help="Home Assistant URL, e.g. http://localhost:8123"
+    )
+    parser.add_argument("webhook_id", help="Webhook ID logged by the integration")
+    parser.add_argument("payloads", nargs="+", help="JSON payload files to post")
+    args = parser.parse_args()
+
+    url = f"{args.base_url.rstrip('/')}/api/webhook/{args.webhook_id}"
+
+    failures = 0
+    for path in args.payloads:
+        status, elapsed = post_payload(url, Path(path).read_bytes())
+        ok = status == 200
+        failures += not ok
+        print(
+            f"{'✅' if ok else '❌'} {path}: HTTP {status} in {elapsed * 1000:.1f} ms"
+        )
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
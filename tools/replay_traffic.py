@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Replay a recorded goto_sms_traffic_<entry_id>.jsonl against the stub
+server. Calls are issued with their recorded spacing, divided by --speed,
+using synthetic numbers and bodies of the recorded shape, and the run
+reports throughput, per-message latency, schedule lag and token refreshes.
+
+Usage:
+    python tools/replay_traffic.py goto_sms_traffic_<entry_id>.jsonl [--speed 10]
+        [--rate 10] [--latency 0.05] [--token-ttl 3600]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from harness import Harness
+from stub_server import StubGoToServer
+
+
+def load(path):
+    """Read the recorded calls in time order."""
+    with open(path, encoding="utf-8") as handle:
+        calls = [json.loads(line) for line in handle if line.strip()]
+    calls.sort(key=lambda call: call["t"])
+    return calls
+
+
+def number_for(digest, prefix="+1555"):
+    """Map a recorded number hash to a stable synthetic number."""
+    return f"{prefix}{int(digest, 16) % 10**7:07d}"
+
+
+def message_for(call):
+    """Build a message and template data of the recorded shape."""
+    if call["templated"]:
+        return "{{ body }}", {"body": "x" * call["len"]}
+    return "x" * call["len"], {}
+
+
+def percentile(values, fraction):
+    """Return a percentile of sorted values in milliseconds."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * fraction))] * 1000
+
+
+async def replay(calls, speed, server, token_ttl):
+    """Issue the calls on schedule and collect per-message results."""
+    senders = {}
+    for call in calls:
+        senders.setdefault(call["from"], f"+1555010{len(senders):04d}")
+    server.numbers = list(senders.values())
+    url = await server.start()
+
+    results = []
+    lags = []
+
+    async with Harness(url, {"max_queued_sends": 10**6}, token_ttl) as harness:
+        service = harness.service
+
+        async def issue(call):
+            template, data = message_for(call)
+            message = await service._render_template(template, data)
+            targets = [number_for(digest) for digest in call["to"]]
+            results.extend(
+                await service._send_to_targets(
+                    message,
+                    targets,
+                    senders[call["from"]],
+                    None,
+                    call.get("priority", "normal"),
+                )
+            )
+
+        tasks = []
+        first = calls[0]["t"]
+        start = time.monotonic()
+        for call in calls:
+            due = start + (call["t"] - first) / speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            lags.append(max(0.0, time.monotonic() - due))
+            tasks.append(asyncio.create_task(issue(call)))
+        await asyncio.gather(*tasks)
+        elapsed = time.monotonic() - start
+
+    await server.stop()
+    return results, lags, elapsed
+
+
+async def main():
+    """Replay a recording and print the report."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("recording")
+    parser.add_argument("--speed", type=float, default=1.0, help="1 = real time")
+    parser.add_argument("--rate", type=float, default=None, help="stub msg/s/number")
+    parser.add_argument("--latency", type=float, default=0.05, help="stub latency, s")
+    parser.add_argument("--token-ttl", type=int, default=3600, help="seconds")
+    args = parser.parse_args()
+
+    calls = load(args.recording)
+    if not calls:
+        print("Recording is empty")
+        return
+    span = calls[-1]["t"] - calls[0]["t"]
+    server = StubGoToServer(
+        rate=args.rate, latency=args.latency, token_ttl=args.token_ttl
+    )
+    print(
+        f"🚀 Replaying {len(calls)} calls spanning {span:.1f}s at {args.speed:g}x "
+        f"({sum(len(call['to']) for call in calls)} messages)"
+    )
+
+    results, lags, elapsed = await replay(calls, args.speed, server, args.token_ttl)
+
+    statuses = {}
+    for result in results:
+        statuses[result.status] = statuses.get(result.status, 0) + 1
+    latencies = sorted(r.latency for r in results if r.sent and r.latency is not None)
+    lags.sort()
+    stats = server.stats()
+    print(f"  elapsed {elapsed:.1f}s, {statuses.get('sent', 0) / elapsed:.1f} msg/s")
+    print(f"  results {statuses}")
+    print(
+        f"  latency p50={percentile(latencies, 0.5):.1f} ms "
+        f"p95={percentile(latencies, 0.95):.1f} ms "
+        f"p99={percentile(latencies, 0.99):.1f} ms "
+        f"max={percentile(latencies, 1.0):.1f} ms"
+    )
+    print(f"  schedule lag p95={percentile(lags, 0.95):.1f} ms")
+    print(
+        f"  token refreshes={stats['token_requests']} "
+        f"401s={stats['unauthorized']} 429s={stats['rate_limited']} "
+        f"max in flight={stats['max_in_flight']}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Local stub of the GoTo token and messaging endpoints for benchmarks.
+Enforces a per-sender-number rate limit and adds configurable latency so
+throughput behaviour can be measured without a GoTo account.
+Honors the Idempotency-Key header and can drop responses after accepting
+a message, to check that retries never deliver a message twice.
+
+Usage:
+    python tools/stub_server.py [--port 8099] [--rate 5] [--latency 0.05]
+                                [--drop-rate 0.1]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from collections import defaultdict
+
+from aiohttp import web
+
+INITIAL_TOKEN = "stub-access-token"
+
+
+class _Bucket:
+    """Per-number token bucket."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class StubGoToServer:
+    """In-process stub GoTo API server."""
+
+    def __init__(
+        self,
+        rate=None,
+        numbers=("+15550100001",),
+        burst=5,
+        latency=0.02,
+        token_ttl=3600,
+        capacity=None,
+        drop_rate=0.0,
+        idempotent=True,
+        token_latency=0.0,
+        connect_latency=0.0,
+    ):
+        """Initialize the stub.
+
+        rate is messages per second per ownerPhoneNumber (None = unlimited).
+        capacity is the number of requests served concurrently before
+        answering 429; latency grows as in-flight requests approach it.
+        drop_rate is the fraction of accepted messages whose response is
+        lost, as when a timeout hits after the server has committed.
+        With idempotent=False the Idempotency-Key header is ignored.
+        numbers are listed as the account's SMS-capable phone numbers.
+        token_latency delays token responses; connect_latency delays the
+        first request on each new connection, standing in for the DNS
+        lookup and TLS handshake a real client pays.
+        These may be changed while the server is running.
+        """
+        self.rate = rate
+        self.numbers = list(numbers)
+        self.capacity = capacity
+        self.drop_rate = drop_rate
+        self.idempotent = idempotent
+        self.token_latency = token_latency
+        self.connect_latency = connect_latency
+        self.burst = burst
+        self.latency = latency
+        self.token_ttl = token_ttl
+        self._buckets = {}
+        self._tokens = {INITIAL_TOKEN}
+        self._by_key = {}
+        self._runner = None
+        self.url = None
+        self.reset()
+
+    def reset(self):
+        """Clear the counters."""
+        self.accepted = 0
+        self.recipients = 0
+        self.rate_limited = 0
+        self.unauthorized = 0
+        self.token_requests = 0
+        self.number_requests = 0
+        self.connections = 0
+        self._peers = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.replayed = 0
+        self.dropped = 0
+        self.by_sender = defaultdict(int)
+        self.messages = []
+        self._delivered = defaultdict(int)
+
+    def app(self):
+        """Build the aiohttp application."""
+        app = web.Application(middlewares=[self._connect_middleware])
+        app.router.add_post("/oauth/token", self.handle_token)
+        app.router.add_post("/messaging/v1/messages", self.handle_message)
+        app.router.add_get("/voice-admin/v1/phone-numbers", self.handle_numbers)
+        app.router.add_get("/stats", self.handle_stats)
+        return app
+
+    async def start(self, host="127.0.0.1", port=0):
+        """Start serving and return the base URL."""
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self):
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _connect_middleware(self, request, handler):
+        """Delay the first request on each new connection."""
+        peer = request.transport.get_extra_info("peername")
+        if peer not in self._peers:
+            self._peers.add(peer)
+            self.connections += 1
+            if self.connect_latency:
+                await asyncio.sleep(self.connect_latency)
+        return await handler(request)
+
+    async def handle_token(self, request):
+        """Issue a fresh access token for any grant."""
+        self.token_requests += 1
+        if self.token_latency:
+            await asyncio.sleep(self.token_latency)
+        token = uuid.uuid4().hex
+        self._tokens.add(token)
+        return web.json_response(
+            {
+                "access_token": token,
+                "refresh_token": "stub-refresh-token",
+                "expires_in": self.token_ttl,
+            }
+        )
+
+    async def handle_numbers(self, request):
+        """List the account's phone numbers."""
+        self.number_requests += 1
+        items = [{"number": number, "smsEnabled": True} for number in self.numbers]
+        return web.json_response({"items": items})
+
+    async def handle_message(self, request):
+        """Accept a message, subject to auth and per-sender rate limits."""
+        auth = request.headers.get("Authorization", "")
+        if auth.removeprefix("Bearer ") not in self._tokens:
+            self.unauthorized += 1
+            return web.json_response({"error": "unauthorized"}, status=401)
+
+        payload = await request.json()
+        sender = payload.get("ownerPhoneNumber")
+
+        key = request.headers.get("Idempotency-Key") if self.idempotent else None
+        if key is not None and key in self._by_key:
+            # A retry of a message already accepted: answer as before
+            self.replayed += 1
+            return web.json_response({"id": self._by_key[key]}, status=201)
+
+        if self.rate is not None:
+            bucket = self._buckets.get(sender)
+            if bucket is None:
+                bucket = self._buckets[sender] = _Bucket(self.rate, self.burst)
+            if not bucket.take():
+                self.rate_limited += 1
+                return web.json_response({"error": "rate limited"}, status=429)
+
+        if self.capacity is not None and self.in_flight >= self.capacity:
+            self.rate_limited += 1
+            return web.json_response({"error": "over capacity"}, status=429)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                load = self.in_flight / self.capacity if self.capacity else 0
+                await asyncio.sleep(self.latency * (1 + load))
+        finally:
+            self.in_flight -= 1
+
+        message_id = str(uuid.uuid4())
+        self.accepted += 1
+        self.recipients += len(payload.get("contactPhoneNumbers") or ())
+        self.by_sender[sender] += 1
+        self.messages.append((message_id, payload))
+        self._delivered[request.headers.get("Idempotency-Key") or message_id] += 1
+        if key is not None:
+            self._by_key[key] = message_id
+
+        if self.drop_rate and random.random() < self.drop_rate:
+            # Committed, but the client never sees the response
+            self.dropped += 1
+            request.transport.close()
+            raise asyncio.CancelledError
+
+        return web.json_response({"id": message_id}, status=201)
+
+    @property
+    def duplicates(self):
+        """Return how many extra deliveries shared a logical message's key."""
+        return sum(count - 1 for count in self._delivered.values())
+
+    async def handle_stats(self, request):
+        """Return the counters."""
+        return web.json_response(self.stats())
+
+    def stats(self):
+        """Return the counters as a dict."""
+        return {
+            "accepted": self.accepted,
+            "recipients": self.recipients,
+            "rate_limited": self.rate_limited,
+            "unauthorized": self.unauthorized,
+            "token_requests": self.token_requests,
+            "number_requests": self.number_requests,
+            "connections": self.connections,
+            "max_in_flight": self.max_in_flight,
+            "replayed": self.replayed,
+            "dropped": self.dropped,
+            "duplicates": self.duplicates,
+            "by_sender": dict(self.by_sender),
+        }
+
+
+def main():
+    """Run the stub server standalone."""
+    parser = argparse.ArgumentParser(description="Stub GoTo API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--rate", type=float, default=None)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--capacity", type=int, default=None)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = StubGoToServer(
+        rate=args.rate,
+        latency=args.latency,
+        capacity=args.capacity,
+        drop_rate=args.drop_rate,
+    )
+    web.run_app(server.app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()